@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.cases import CASES, MEMORY_CASES
+from benchmarks.runner import (
+    compare,
+    compare_memory,
+    format_report,
+    load_results,
+    run_cases,
+    run_memory_cases,
+    save_results,
+)
+from rocket_args import Argument, RocketBase
+
+BENCHMARKS_DIR = Path(__file__).parent
+
+
+class BenchmarkArgs(RocketBase):
+    output: Path = Argument(default=BENCHMARKS_DIR / "results.json", help="Path where results are written")
+    baseline: Path = Argument(default=BENCHMARKS_DIR / "baseline.json", help="Path of results to compare against")
+    update_baseline: bool = Argument(default=False, env_name=False, help="Store results as the new baseline")
+    case: Optional[str] = Argument(default=None, env_name=False, help="Run only benchmark with given name")
+    max_size: Optional[int] = Argument(default=None, env_name=False, help="Skip sizes bigger than given one")
+    repeat: int = Argument(default=3, env_name=False, help="Number of timing repetitions per size")
+    time_tolerance: float = Argument(default=2.0, env_name=False, help="Allowed slowdown relative to baseline")
+    memory: bool = Argument(default=True, env_name=False, help="Measure peak memory of list casting")
+
+
+def main() -> int:
+    args = BenchmarkArgs.parse_args()
+    cases = [case for case in CASES if args.case in (None, case.name)]
+    memory_cases = [case for case in MEMORY_CASES if args.memory and args.case in (None, case.name)]
+    if not cases and not memory_cases:
+        raise SystemExit(f"Unknown benchmark: {args.case}")
+
+    results = run_cases(cases, args.repeat, args.max_size)
+    if memory_cases:
+        results["memory"] = run_memory_cases(memory_cases, args.max_size)
+    print(format_report(results))
+    save_results(args.output, results)
+
+    if args.update_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline stored in {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    regressions = compare(results, baseline, args.time_tolerance) + compare_memory(results, baseline)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
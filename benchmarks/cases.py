@@ -0,0 +1,145 @@
+import atexit
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Type
+
+from rocket_args import Argument, RocketBase
+from rocket_args.arg_parsing import get_cmd_line_args, get_env_args
+from rocket_args.type_casting import cast_args_to_fields_types, get_caster, get_compact_caster
+from rocket_args.utils import Field, MessageBuilder
+
+Setup = Callable[[int], Callable[[], Any]]
+
+FIXED_FIELDS_COUNT = 100
+
+
+class Case(NamedTuple):
+    name: str
+    parameter: str
+    sizes: Sequence[int]
+    setup: Setup
+
+
+def make_schema(fields_count: int) -> Type[RocketBase]:
+    annotations = {f"field_{index}": int if index % 2 else str for index in range(fields_count)}
+    namespace: Dict[str, Any] = {"__annotations__": annotations}
+    namespace.update({name: Argument(help=f"Help of {name}") for name in annotations})
+    return type(f"Schema{fields_count}", (RocketBase,), namespace)
+
+
+def make_fields(fields_count: int) -> Sequence[Field]:
+    return make_schema(fields_count).get_schema().fields
+
+
+def make_argv(fields: Sequence[Field], tokens_count: int) -> List[str]:
+    argv: List[str] = []
+    for index in range(tokens_count // 2):
+        field = fields[index % len(fields)]
+        argv += [field.cli_names[0], str(index)]  # type: ignore
+    return argv
+
+
+def make_env(fields: Sequence[Field], env_size: int) -> Dict[str, str]:
+    env = {f"UNRELATED_VARIABLE_{index}": str(index) for index in range(env_size)}
+    env.update({field.env_name: "1" for field in fields[:env_size] if field.env_name})
+    return env
+
+
+def setup_parse_args(fields_count: int) -> Callable[[], Any]:
+    schema = make_schema(fields_count)
+    fields = schema.get_schema().fields
+    argv = make_argv(fields, 2 * fields_count)
+    return lambda: schema.parse_args(argv, {})
+
+
+def setup_parse_compiled(fields_count: int) -> Callable[[], Any]:
+    schema = make_schema(fields_count)
+    fields = schema.get_schema().fields
+    argv = make_argv(fields, 2 * fields_count)
+    schema.compile_parser()
+    return lambda: schema.parse_args(argv, {})
+
+
+def setup_get_cmd_line_args(tokens_count: int) -> Callable[[], Any]:
+    fields = make_fields(FIXED_FIELDS_COUNT)
+    argv = ["program", *make_argv(fields, tokens_count)]
+
+    def run() -> Any:
+        original_argv, sys.argv = sys.argv, argv
+        try:
+            return get_cmd_line_args(fields)
+        finally:
+            sys.argv = original_argv
+
+    return run
+
+
+def setup_get_env_args(env_size: int) -> Callable[[], Any]:
+    fields = make_fields(FIXED_FIELDS_COUNT)
+    env = make_env(fields, env_size)
+    return lambda: get_env_args(fields, env)
+
+
+def setup_cast_args_to_fields_types(fields_count: int) -> Callable[[], Any]:
+    fields = make_fields(fields_count)
+    args = {field.name: str(index) for index, field in enumerate(fields)}
+    return lambda: cast_args_to_fields_types(args, fields)
+
+
+def setup_help_message(fields_count: int) -> Callable[[], Any]:
+    builder = MessageBuilder(make_fields(fields_count))
+    return lambda: builder.create_help_message("benchmark")
+
+
+def setup_cast_int_list(items_count: int) -> Callable[[], Any]:
+    caster = get_caster(List[int])
+    value = ",".join(map(str, range(items_count)))
+    return lambda: caster(value)
+
+
+def setup_cast_int_list_compact(items_count: int) -> Callable[[], Any]:
+    caster = get_compact_caster(List[int])
+    value = ",".join(map(str, range(items_count)))
+    return lambda: caster(value)
+
+
+def setup_cast_int_range(items_count: int) -> Callable[[], Any]:
+    caster = get_caster(List[int])
+    return lambda: caster(f"0-{items_count - 1}")
+
+
+def setup_cast_int_range_compact(items_count: int) -> Callable[[], Any]:
+    caster = get_compact_caster(List[int])
+    return lambda: caster(f"0-{items_count - 1}")
+
+
+def setup_cast_int_file_compact(items_count: int) -> Callable[[], Any]:
+    caster = get_compact_caster(List[int], read_files=True)
+    path = make_items_file(items_count)
+    return lambda: caster(f"@{path}")
+
+
+def make_items_file(items_count: int) -> str:
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as file:
+        file.writelines(f"{index}\n" for index in range(items_count))
+    atexit.register(os.remove, file.name)
+    return file.name
+
+
+CASES = [
+    Case("parse_args", "fields", [10, 100, 1_000, 10_000], setup_parse_args),
+    Case("parse_compiled", "fields", [10, 100, 1_000, 10_000], setup_parse_compiled),
+    Case("get_cmd_line_args", "argv tokens", [0, 100, 1_000, 10_000, 100_000], setup_get_cmd_line_args),
+    Case("get_env_args", "env size", [10, 100, 1_000, 10_000, 100_000], setup_get_env_args),
+    Case("cast_args_to_fields_types", "fields", [10, 100, 1_000, 10_000], setup_cast_args_to_fields_types),
+    Case("help_message", "fields", [10, 100, 1_000, 10_000], setup_help_message),
+]
+
+MEMORY_CASES = [
+    Case("cast_int_list", "items", [1_000, 10_000, 100_000, 1_000_000], setup_cast_int_list),
+    Case("cast_int_list_compact", "items", [1_000, 10_000, 100_000, 1_000_000], setup_cast_int_list_compact),
+    Case("cast_int_range", "items", [1_000, 10_000, 100_000, 1_000_000], setup_cast_int_range),
+    Case("cast_int_range_compact", "items", [1_000, 10_000, 100_000, 1_000_000], setup_cast_int_range_compact),
+    Case("cast_int_file_compact", "items", [1_000, 10_000, 100_000, 1_000_000], setup_cast_int_file_compact),
+]
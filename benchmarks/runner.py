@@ -0,0 +1,155 @@
+import json
+import math
+import platform
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from benchmarks.cases import Case
+
+MIN_MEASURE_TIME = 0.05
+MAX_EXPONENT = 1.3
+EXPONENT_TOLERANCE = 0.25
+MEMORY_TOLERANCE = 1.2
+
+
+def run_cases(cases: Sequence[Case], repeat: int = 3, max_size: Optional[int] = None) -> Dict[str, Any]:
+    results = {case.name: run_case(case, repeat, max_size) for case in cases}
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(), "cases": results}
+
+
+def run_case(case: Case, repeat: int, max_size: Optional[int]) -> Dict[str, Any]:
+    sizes = [size for size in case.sizes if max_size is None or size <= max_size]
+    seconds = [measure(case, size, repeat) for size in sizes]
+    return {"parameter": case.parameter, "sizes": sizes, "seconds": seconds, "exponent": fit_exponent(sizes, seconds)}
+
+
+def measure(case: Case, size: int, repeat: int) -> float:
+    timer = timeit.Timer(case.setup(size))
+    number, elapsed = timer.autorange()
+    if elapsed < MIN_MEASURE_TIME:
+        number = max(1, math.ceil(number * MIN_MEASURE_TIME / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_memory_cases(cases: Sequence[Case], max_size: Optional[int] = None) -> Dict[str, Any]:
+    return {case.name: run_memory_case(case, max_size) for case in cases}
+
+
+def run_memory_case(case: Case, max_size: Optional[int]) -> Dict[str, Any]:
+    sizes = [size for size in case.sizes if max_size is None or size <= max_size]
+    peak_bytes = [measure_memory(case, size) for size in sizes]
+    return {"parameter": case.parameter, "sizes": sizes, "peak_bytes": peak_bytes}
+
+
+def measure_memory(case: Case, size: int) -> int:
+    run = case.setup(size)
+    tracemalloc.start()
+    try:
+        result = run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def fit_exponent(sizes: Sequence[int], seconds: Sequence[float]) -> Optional[float]:
+    points = [(math.log(size), math.log(time)) for size, time in zip(sizes, seconds) if size > 0 and time > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return round(covariance / variance, 3)
+
+
+def compare(results: Mapping[str, Any], baseline: Optional[Mapping[str, Any]], time_tolerance: float) -> List[str]:
+    regressions = []
+    baseline_cases = baseline["cases"] if baseline else {}
+
+    for name, result in results["cases"].items():
+        exponent = result["exponent"]
+        if exponent is not None and exponent > MAX_EXPONENT:
+            regressions.append(f"{name}: scales as n^{exponent} over {result['parameter']}, limit is n^{MAX_EXPONENT}")
+
+        baseline_result = baseline_cases.get(name, None)
+        if baseline_result is None:
+            continue
+
+        baseline_exponent = baseline_result["exponent"]
+        if None not in (exponent, baseline_exponent) and exponent > baseline_exponent + EXPONENT_TOLERANCE:
+            regressions.append(f"{name}: scaling exponent grew from {baseline_exponent} to {exponent}")
+
+        baseline_seconds = dict(zip(baseline_result["sizes"], baseline_result["seconds"]))
+        for size, seconds in zip(result["sizes"], result["seconds"]):
+            if size in baseline_seconds and seconds > baseline_seconds[size] * time_tolerance:
+                regressions.append(
+                    f"{name}: {format_time(seconds)} for {result['parameter']}={size}, "
+                    f"baseline is {format_time(baseline_seconds[size])}"
+                )
+
+    return regressions
+
+
+def compare_memory(results: Mapping[str, Any], baseline: Optional[Mapping[str, Any]]) -> List[str]:
+    regressions = []
+    baseline_cases = baseline.get("memory", {}) if baseline else {}
+
+    for name, result in results.get("memory", {}).items():
+        baseline_result = baseline_cases.get(name, None)
+        if baseline_result is None:
+            continue
+
+        baseline_peaks = dict(zip(baseline_result["sizes"], baseline_result["peak_bytes"]))
+        for size, peak in zip(result["sizes"], result["peak_bytes"]):
+            if size in baseline_peaks and peak > baseline_peaks[size] * MEMORY_TOLERANCE:
+                regressions.append(
+                    f"{name}: peak {format_size(peak)} for {result['parameter']}={size}, "
+                    f"baseline is {format_size(baseline_peaks[size])}"
+                )
+
+    return regressions
+
+
+def format_report(results: Mapping[str, Any]) -> str:
+    lines = []
+    for name, result in results["cases"].items():
+        lines.append(f"{name} (exponent {result['exponent']})")
+        for size, seconds in zip(result["sizes"], result["seconds"]):
+            lines.append(f"  {result['parameter']}={size:<8} {format_time(seconds)}")
+    for name, result in results.get("memory", {}).items():
+        lines.append(f"{name} (peak memory)")
+        for size, peak in zip(result["sizes"], result["peak_bytes"]):
+            lines.append(f"  {result['parameter']}={size:<8} {format_size(peak):>10} {peak / size:8.1f} B/item")
+    return "\n".join(lines)
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f}{unit}"
+    return f"{seconds / 1e-9:.1f}ns"
+
+
+def format_size(size: float) -> str:
+    for unit, scale in (("MiB", 2**20), ("KiB", 2**10)):
+        if size >= scale:
+            return f"{size / scale:.2f}{unit}"
+    return f"{size:.0f}B"
+
+
+def load_results(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    with path.open(encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_results(path: Path, results: Mapping[str, Any]) -> None:
+    with path.open("w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
@@ -1,8 +1,68 @@
+import sys
+from typing import Any
+
+from rocket_args.exceptions import (
+    ConfigFileError,
+    HelpRequested,
+    InvalidValueError,
+    MissingArgumentsError,
+    RocketArgsError,
+    SecretsDirError,
+    UnknownArgumentsError,
+    ValidationError,
+)
 from rocket_args.rocket_base import RocketBase
-from rocket_args.utils import Argument
+from rocket_args.slots import slotted
+from rocket_args.sources import CliSource, EnvSource, MappingSource, PrefixEnvSource, Source
+from rocket_args.stats import ParseStats
+from rocket_args.utils import Argument, Subcommands
 
 __author__ = "Amadeusz Hercog"
 __email__ = "xaaq333@gmail.com"
 __version__ = "0.1.0"
 
-__all__ = ["RocketBase", "Argument"]
+LAZY_EXPORTS = {
+    "ConfigFile": "rocket_args.config_files",
+    "SecretsDir": "rocket_args.secrets_dir",
+    "Watcher": "rocket_args.watch",
+}
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    from rocket_args.config_files import ConfigFile  # noqa: F401
+    from rocket_args.secrets_dir import SecretsDir  # noqa: F401
+    from rocket_args.watch import Watcher  # noqa: F401
+
+__all__ = [
+    "RocketBase",
+    "Argument",
+    "Subcommands",
+    "slotted",
+    "Source",
+    "CliSource",
+    "EnvSource",
+    "MappingSource",
+    "PrefixEnvSource",
+    "ConfigFile",
+    "SecretsDir",
+    "Watcher",
+    "ParseStats",
+    "RocketArgsError",
+    "ConfigFileError",
+    "SecretsDirError",
+    "UnknownArgumentsError",
+    "MissingArgumentsError",
+    "InvalidValueError",
+    "ValidationError",
+    "HelpRequested",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
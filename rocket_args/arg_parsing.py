@@ -1,33 +1,127 @@
 import os
 import sys
-from typing import Mapping, Optional, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from rocket_args.utils import Color, Field
+from rocket_args.exceptions import UnknownArgumentsError
+from rocket_args.utils import Field
 
+FLAG_VALUE = "true"
+END_OF_OPTIONS = "--"
 
-def get_cmd_line_args(fields_data: Sequence[Field]) -> Mapping[str, Optional[str]]:
-    cli_args = sys.argv[1:]
-    known_args = {}
-    unknown_args = []
 
-    while cli_args:
-        cli_arg = cli_args.pop(0)
+def get_cmd_line_args(fields_data: Sequence[Field]) -> Mapping[str, Any]:
+    try:
+        return parse_cmd_line_args(sys.argv[1:], build_cli_index(fields_data))
+    except UnknownArgumentsError as error:
+        raise SystemExit(str(error)) from None
 
-        for field in fields_data:
-            if field.cli_names and cli_arg in field.cli_names:
-                known_args[field.name] = cli_args.pop(0) if cli_args else None
-                break
-        else:
-            unknown_args.append(cli_arg)
+
+def parse_cmd_line_args(cli_args: Sequence[str], cli_name_to_field: Mapping[str, Field]) -> Dict[str, Any]:
+    known_args, unknown_args = tokenize_cmd_line_args(cli_args, cli_name_to_field)
 
     if unknown_args:
-        unknown_args_str = " ".join(unknown_args)
-        raise SystemExit(f"Unknown arguments: {Color.cli.value}{unknown_args_str}{Color.neutral.value}")
+        raise UnknownArgumentsError(unknown_args)
 
     return known_args
 
 
-def get_env_args(fields_data: Sequence[Field]) -> Mapping[str, str]:
-    field_with_value = [(field, os.environ.get(field.env_name, None)) for field in fields_data if field.env_name]
+def build_cli_index(fields_data: Sequence[Field]) -> Dict[str, Field]:
+    return {name: field for field in fields_data for name in field.cli_names or ()}
+
+
+def tokenize_cmd_line_args(
+    cli_args: Sequence[str], cli_name_to_field: Mapping[str, Field]
+) -> Tuple[Dict[str, Any], List[str]]:
+    unknown_args: List[str] = []
+    known_args, _ = __tokenize(cli_args, cli_name_to_field, unknown_args)
+    return known_args, unknown_args
+
+
+def tokenize_known_cmd_line_args(
+    cli_args: Sequence[str], cli_name_to_field: Mapping[str, Field]
+) -> Tuple[Dict[str, Any], int]:
+    return __tokenize(cli_args, cli_name_to_field, None)
+
+
+def __tokenize(
+    cli_args: Sequence[str], cli_name_to_field: Mapping[str, Field], unknown_args: Optional[List[str]]
+) -> Tuple[Dict[str, Any], int]:
+    known_args: Dict[str, Any] = {}
+    args_count = len(cli_args)
+    index = 0
+
+    while index < args_count:
+        cli_arg = cli_args[index]
+        index += 1
+        field = cli_name_to_field.get(cli_arg)
+
+        if field is None:
+            next_index = __tokenize_compound_arg(cli_args, index, cli_name_to_field, known_args)
+            if next_index is not None:
+                index = next_index
+                continue
+            elif unknown_args is None:
+                return known_args, index if cli_arg == END_OF_OPTIONS else index - 1
+            unknown_args.append(cli_arg)
+        elif field.is_flag:
+            known_args[field.name] = FLAG_VALUE
+        elif field.is_subcommand:
+            start = index - 1
+            known_args[field.name] = cli_args[start:]
+            break
+        else:
+            known_args[field.name] = cli_args[index] if index < args_count else None
+            index += 1
+
+    return known_args, args_count
+
+
+def __tokenize_compound_arg(
+    cli_args: Sequence[str], index: int, cli_name_to_field: Mapping[str, Field], known_args: Dict[str, Any]
+) -> Optional[int]:
+    cli_arg = cli_args[index - 1]
+    if not cli_arg.startswith("-"):
+        return None
+
+    name, separator, value = cli_arg.partition("=")
+    if separator and name in cli_name_to_field:
+        known_args[cli_name_to_field[name].name] = value
+        return index
+
+    if cli_arg.startswith("--") or len(cli_arg) <= 2:
+        return None
+
+    return __tokenize_short_args_group(cli_args, index, cli_name_to_field, known_args)
+
+
+def __tokenize_short_args_group(
+    cli_args: Sequence[str], index: int, cli_name_to_field: Mapping[str, Field], known_args: Dict[str, Any]
+) -> Optional[int]:
+    cli_arg = cli_args[index - 1]
+    group_args: Dict[str, Optional[str]] = {}
+
+    for position in range(1, len(cli_arg)):
+        field = cli_name_to_field.get(f"-{cli_arg[position]}")
+
+        if field is None:
+            return None
+        elif not field.is_flag:
+            value_start = position + 1
+            if value_start < len(cli_arg):
+                group_args[field.name] = cli_arg[value_start:]
+            else:
+                group_args[field.name] = cli_args[index] if index < len(cli_args) else None
+                index += 1
+            break
+
+        group_args[field.name] = FLAG_VALUE
+
+    known_args.update(group_args)
+    return index
+
+
+def get_env_args(fields_data: Sequence[Field], env: Optional[Mapping[str, str]] = None) -> Mapping[str, str]:
+    env = os.environ if env is None else env
+    field_with_value = [(field, env.get(field.env_name, None)) for field in fields_data if field.env_name]
     name_to_value = {field.name: value for field, value in field_with_value if value is not None}
     return name_to_value
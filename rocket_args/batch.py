@@ -0,0 +1,61 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from rocket_args.arg_parsing import parse_cmd_line_args
+from rocket_args.exceptions import HelpRequested, InvalidValueError, MissingArgumentsError, ValidationError
+from rocket_args.schema import Schema
+from rocket_args.type_casting import cast_columns
+
+ArgsInput = Tuple[Sequence[str], Mapping[str, str]]
+
+
+def parse_columns(schema: Schema, inputs: Iterable[ArgsInput], program_name: str) -> Tuple[int, Dict[str, List[Any]]]:
+    if schema.subcommand_field is not None:
+        raise TypeError("Batch parsing doesn't support subcommands")
+
+    rows_count, raw_columns, default_rows = __collect_raw_columns(schema, inputs, program_name)
+    invalid_values: List[InvalidValueError] = []
+    columns = cast_columns(raw_columns, schema.casters, invalid_values)
+    if invalid_values:
+        raise ValidationError([], invalid_values)
+
+    for name, rows in default_rows.items():
+        column, default = columns[name], schema.defaults[name]
+        for row in rows:
+            column[row] = default
+
+    return rows_count, columns
+
+
+def __collect_raw_columns(
+    schema: Schema, inputs: Iterable[ArgsInput], program_name: str
+) -> Tuple[int, Dict[str, List[Optional[str]]], Dict[str, List[int]]]:
+    env_fields = [(field.name, field.env_name) for field in schema.fields if field.env_name]
+    raw_columns: Dict[str, List[Optional[str]]] = {field.name: [] for field in schema.fields}
+    default_rows: Dict[str, List[int]] = {name: [] for name in schema.defaults}
+    rows_count = 0
+
+    for row, (argv, env) in enumerate(inputs):
+        raw_args = parse_cmd_line_args(argv, schema.cli_name_to_field)
+        rows_count += 1
+
+        if "help" in raw_args:
+            raise HelpRequested(schema.message_builder.create_help_message(program_name))
+
+        for name, env_name in env_fields:
+            if name not in raw_args and env_name in env:
+                raw_args[name] = env[env_name]
+
+        absent_fields = []
+        for field in schema.fields:
+            if field.name in raw_args:
+                raw_columns[field.name].append(raw_args[field.name])
+            elif field.name in schema.defaults:
+                raw_columns[field.name].append(None)
+                default_rows[field.name].append(row)
+            else:
+                absent_fields.append(field)
+
+        if absent_fields:
+            raise MissingArgumentsError(absent_fields)
+
+    return rows_count, raw_columns, default_rows
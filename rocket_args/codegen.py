@@ -0,0 +1,101 @@
+import linecache
+from typing import Any, Callable, Dict, List, Sequence
+
+from rocket_args.arg_parsing import tokenize_cmd_line_args
+from rocket_args.exceptions import HelpRequested, InvalidValueError, UnknownArgumentsError, create_validation_error
+from rocket_args.schema import Schema
+from rocket_args.utils import Field
+
+Parser = Callable[..., Any]
+
+MISSING = object()
+
+
+def compile_parser(cls: type, schema: Schema) -> Parser:
+    if schema.subcommand_field is not None:
+        raise TypeError(f"{cls.__name__} has subcommands, they can't be compiled")
+
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "MISSING": MISSING,
+        "schema": schema,
+        "tokenize": tokenize_cmd_line_args,
+        "HelpRequested": HelpRequested,
+        "InvalidValueError": InvalidValueError,
+        "UnknownArgumentsError": UnknownArgumentsError,
+        "create_validation_error": create_validation_error,
+    }
+    source = create_parser_source(cls.__name__, schema, namespace)
+    filename = f"<rocket_args parser {cls.__module__}.{cls.__qualname__}>"
+
+    exec(compile(source, filename, "exec"), namespace)
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+
+    parser = namespace["parse"]
+    parser.__source__ = source
+    parser.__qualname__ = f"{cls.__qualname__}.parse"
+    return parser
+
+
+def create_parser_source(class_name: str, schema: Schema, namespace: Dict[str, Any]) -> str:
+    lines = [
+        "def parse(argv, env, program_name=None):",
+        "    known_args, unknown_args = tokenize(argv, schema.cli_name_to_field)",
+        "    if unknown_args:",
+        "        raise UnknownArgumentsError(unknown_args)",
+        '    if "help" in known_args:',
+        f"        program_name = {class_name!r} if program_name is None else program_name",
+        "        raise HelpRequested(schema.message_builder.create_help_message(program_name))",
+        "    missing = []",
+        "    invalid = []",
+    ]
+
+    for index, field in enumerate(schema.fields):
+        lines += __create_field_lines(index, field, schema, namespace)
+
+    lines += [
+        "    if missing or invalid:",
+        "        raise create_validation_error(missing, invalid)",
+        f"    return cls(**{{{__join_arguments(schema.fields)}}})",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def __create_field_lines(index: int, field: Field, schema: Schema, namespace: Dict[str, Any]) -> List[str]:
+    target = f"arg_{index}"
+    caster = schema.casters[field.name]
+    namespace[f"FIELD_{index}"] = field
+    lines = [f"    # {field.name}"]
+
+    if field.cli_names:
+        lines.append(f"    value = known_args.get({field.name!r}, MISSING)")
+    else:
+        lines.append("    value = MISSING")
+    if field.env_name:
+        lines += ["    if value is MISSING:", f"        value = env.get({field.env_name!r}, MISSING)"]
+
+    lines.append("    if value is MISSING:")
+    if field.name in schema.defaults:
+        namespace[f"DEFAULT_{index}"] = schema.defaults[field.name]
+        lines.append(f"        {target} = DEFAULT_{index}")
+    else:
+        lines += [f"        {target} = None", f"        missing.append(FIELD_{index})"]
+
+    if caster is None:
+        lines += ["    else:", f"        {target} = value"]
+    else:
+        namespace[f"CAST_{index}"] = caster
+        lines += [
+            "    else:",
+            "        try:",
+            f"            {target} = CAST_{index}(value) if value is not None else None",
+            "        except (TypeError, ValueError) as error:",
+            f"            {target} = None",
+            f"            invalid.append(InvalidValueError({field.name!r}, value, str(error)))",
+        ]
+
+    return lines
+
+
+def __join_arguments(fields: Sequence[Field]) -> str:
+    return ", ".join(f"{field.name!r}: arg_{index}" for index, field in enumerate(fields))
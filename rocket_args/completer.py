@@ -0,0 +1,74 @@
+# Runs as a plain script (python -S completer.py CACHE_PATH WORD...) on every TAB press, so it imports
+# only builtin modules: json, typing and the rest of rocket_args alone would take longer than the completion.
+import marshal
+import sys
+
+CACHE_VERSION = 1
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Dict, List, Optional, Sequence
+
+    Spec = Dict[str, Any]
+
+
+def complete(spec: "Spec", words: "Sequence[str]") -> "List[str]":
+    node = spec
+    expected_option: "Optional[Spec]" = None
+    *previous_words, current = words if words else [""]
+
+    for word in previous_words:
+        if expected_option is not None:
+            expected_option = None
+        elif word in node["commands"]:
+            node = node["commands"][word]
+        elif "=" not in word:
+            option = find_option(node, word)
+            expected_option = option if option is not None and not option["flag"] else None
+
+    if expected_option is not None:
+        return [choice for choice in expected_option["choices"] if choice.startswith(current)]
+
+    if current.startswith("-") and "=" in current:
+        name, _, value = current.partition("=")
+        option = find_option(node, name)
+        choices = option["choices"] if option is not None else []
+        return [f"{name}={choice}" for choice in choices if choice.startswith(value)]
+
+    candidates = [name for option in node["options"] for name in option["names"]] + list(node["commands"])
+    return [candidate for candidate in candidates if candidate.startswith(current)]
+
+
+def find_option(node: "Spec", name: str) -> "Optional[Spec]":
+    return next((option for option in node["options"] if name in option["names"]), None)
+
+
+def dump_cache(spec: "Spec") -> bytes:
+    return marshal.dumps(spec)
+
+
+def load_cache(path: str) -> "Optional[Spec]":
+    try:
+        with open(path, "rb") as file:
+            spec = marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return spec if isinstance(spec, dict) and spec.get("version") == CACHE_VERSION else None
+
+
+def main(argv: "Sequence[str]") -> int:
+    if not argv:
+        print("usage: completer.py CACHE_PATH [WORD...]", file=sys.stderr)
+        return 2
+
+    spec = load_cache(argv[0])
+    if spec is None:
+        return 1
+
+    for candidate in complete(spec, argv[1:]):
+        print(candidate)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
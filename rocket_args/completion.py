@@ -0,0 +1,205 @@
+import os
+import re
+import shlex
+import sys
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from rocket_args import completer
+from rocket_args.completer import CACHE_VERSION, dump_cache
+from rocket_args.schema import Schema
+from rocket_args.type_casting import Literal
+from rocket_args.utils import Field, Subcommands
+
+SHELLS = ("bash", "zsh", "fish")
+ZSH_PRELUDE = "autoload -U +X bashcompinit && bashcompinit\n"
+
+Spec = Dict[str, Any]
+
+
+def create_spec(cls: Any, program_name: str) -> Spec:
+    schema: Schema = cls.get_schema()
+    spec: Spec = {"version": CACHE_VERSION, "program": program_name, "options": [], "commands": {}}
+
+    for field in schema.fields_with_help:
+        if field.is_subcommand:
+            subcommands: Subcommands = field.value  # type: ignore
+            spec["commands"] = {
+                name: create_spec(subcommands.resolve(name), f"{program_name} {name}") for name in subcommands.commands
+            }
+        elif field.cli_names:
+            spec["options"].append(
+                {
+                    "names": list(field.cli_names),
+                    "flag": field.is_flag,
+                    "choices": get_choices(field),
+                    "help": field.value.help or "",
+                }
+            )
+
+    return spec
+
+
+def get_choices(field: Field) -> List[str]:
+    if field.value.choices is not None:
+        return [__format_choice(choice) for choice in field.value.choices]
+    return __get_type_choices(field.type)
+
+
+def write_cache(cls: Any, path: Union[str, "os.PathLike[str]"], program_name: str) -> None:
+    spec = create_spec(cls, program_name)
+    path = os.path.expanduser(path)
+    temporary_path = f"{path}.tmp"
+
+    with open(temporary_path, "wb") as file:
+        file.write(dump_cache(spec))
+    os.replace(temporary_path, path)
+
+
+def create_script(
+    cls: Any, shell: str, program_name: str, cache_path: Optional[Union[str, "os.PathLike[str]"]] = None
+) -> str:
+    if shell not in SHELLS:
+        raise ValueError(f"Unsupported shell: {shell}, expected one of: {', '.join(SHELLS)}")
+
+    if cache_path is not None:
+        command = __create_completer_command(cache_path)
+        if shell == "fish":
+            return __create_dynamic_fish_script(program_name, command)
+        script = __create_dynamic_bash_script(program_name, command)
+    else:
+        spec = create_spec(cls, program_name)
+        if shell == "fish":
+            return __create_fish_script(spec)
+        script = __create_bash_script(spec)
+
+    return ZSH_PRELUDE + script if shell == "zsh" else script
+
+
+def __create_bash_script(spec: Spec) -> str:
+    function_name = __get_function_name(spec["program"])
+    nodes = list(__iter_nodes(spec, ""))
+    transitions = [f"{path} {name}" for path, node in nodes for name in node["commands"]]
+    value_options = [
+        (f"{path} {name}", option["choices"])
+        for path, node in nodes
+        for option in node["options"]
+        if not option["flag"]
+        for name in option["names"]
+    ]
+
+    lines = [
+        f"{function_name}() {{",
+        '    local cur="${COMP_WORDS[COMP_CWORD]}" prev="${COMP_WORDS[COMP_CWORD-1]}" path="" opts="" i',
+        "    for ((i = 1; i < COMP_CWORD; i++)); do",
+        '        case "$path ${COMP_WORDS[i]}" in',
+    ]
+    if transitions:
+        lines.append(f'            {"|".join(map(shlex.quote, transitions))}) path="$path ${{COMP_WORDS[i]}}" ;;')
+    lines += ["        esac", "    done", '    case "$path $prev" in']
+    for key, choices in value_options:
+        lines.append(
+            f'        {shlex.quote(key)}) COMPREPLY=($(compgen -W {__quote_words(choices)} -- "$cur")); return ;;'
+        )
+    lines += ["    esac", '    case "$path" in']
+    for path, node in nodes:
+        words = [name for option in node["options"] for name in option["names"]] + list(node["commands"])
+        lines.append(f"        {shlex.quote(path)}) opts={__quote_words(words)} ;;")
+    lines += [
+        "    esac",
+        '    COMPREPLY=($(compgen -W "$opts" -- "$cur"))',
+        "}",
+        f"complete -o default -F {function_name} {shlex.quote(spec['program'])}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def __create_fish_script(spec: Spec) -> str:
+    program = shlex.quote(spec["program"])
+    lines = []
+
+    for path, node in __iter_nodes(spec, ""):
+        if path:
+            condition = f"__fish_seen_subcommand_from {shlex.quote(path.split()[-1])}"
+        elif spec["commands"]:
+            condition = f"not __fish_seen_subcommand_from {' '.join(map(shlex.quote, spec['commands']))}"
+        else:
+            condition = ""
+        prefix = f"complete -c {program}" + (f" -n {shlex.quote(condition)}" if condition else "")
+
+        for name in node["commands"]:
+            lines.append(f"{prefix} -f -a {shlex.quote(name)}")
+        for option in node["options"]:
+            arguments = "".join(f" {__fish_option_name(name)}" for name in option["names"])
+            if option["choices"]:
+                arguments += f" -x -a {__quote_words(option['choices'])}"
+            elif not option["flag"]:
+                arguments += " -r"
+            if option["help"]:
+                arguments += f" -d {shlex.quote(option['help'])}"
+            lines.append(prefix + arguments)
+
+    return "\n".join(lines) + "\n"
+
+
+def __create_dynamic_bash_script(program_name: str, command: str) -> str:
+    function_name = __get_function_name(program_name)
+    return (
+        f"{function_name}() {{\n"
+        "    local IFS=$'\\n'\n"
+        f'    COMPREPLY=($({command} "${{COMP_WORDS[@]:1:COMP_CWORD}}"))\n'
+        "}\n"
+        f"complete -o default -F {function_name} {shlex.quote(program_name)}\n"
+    )
+
+
+def __create_dynamic_fish_script(program_name: str, command: str) -> str:
+    arguments = "(commandline -opc)[2..-1] (commandline -ct)"
+    return f"complete -c {shlex.quote(program_name)} -a {shlex.quote(f'({command} {arguments})')}\n"
+
+
+def __create_completer_command(cache_path: Union[str, "os.PathLike[str]"]) -> str:
+    words = [sys.executable, "-S", completer.__file__, os.path.abspath(os.path.expanduser(cache_path))]
+    return " ".join(map(shlex.quote, words))
+
+
+def __iter_nodes(spec: Spec, path: str) -> Iterator[Tuple[str, Spec]]:
+    yield path, spec
+    for name, command in spec["commands"].items():
+        yield from __iter_nodes(command, f"{path} {name}")
+
+
+def __get_function_name(program_name: str) -> str:
+    return "_" + re.sub(r"\W", "_", os.path.basename(program_name)) + "_complete"
+
+
+def __quote_words(words: List[str]) -> str:
+    return shlex.quote(" ".join(words))
+
+
+def __fish_option_name(name: str) -> str:
+    if name.startswith("--"):
+        return f"-l {shlex.quote(name[2:])}"
+    elif len(name) == 2:
+        return f"-s {shlex.quote(name[1:])}"
+    return f"-o {shlex.quote(name[1:])}"
+
+
+def __get_type_choices(type_hint: Any) -> List[str]:
+    origin = getattr(type_hint, "__origin__", None)
+    args = getattr(type_hint, "__args__", None) or ()
+
+    if isinstance(type_hint, type) and issubclass(type_hint, Enum):
+        return list(type_hint.__members__)
+    elif Literal is not None and origin is Literal:
+        return [__format_choice(arg) for arg in args]
+    elif origin is Union:
+        choices: Dict[str, None] = {}
+        for arg in args:
+            choices.update(dict.fromkeys(__get_type_choices(arg)))
+        return list(choices)
+    return []
+
+
+def __format_choice(choice: Any) -> str:
+    return choice.name if isinstance(choice, Enum) else str(choice)
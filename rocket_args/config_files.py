@@ -0,0 +1,338 @@
+import json
+import re
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from typing import IO, Any, Callable, Collection, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+from rocket_args.exceptions import ConfigFileError
+from rocket_args.sources import Source
+from rocket_args.utils import Field
+
+try:
+    import tomllib  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        import tomli as tomllib  # type: ignore
+    except ImportError:
+        tomllib = None  # type: ignore
+
+PathLike = Union[str, Path]
+Reader = Callable[[Path, Collection[str], Optional[str]], Dict[str, Any]]
+
+SUFFIX_TO_FORMAT = {".json": "json", ".toml": "toml", ".ini": "ini", ".cfg": "ini", ".env": "env"}
+
+JSON_TEXT_PATTERN = rb'[^"\[\]{}]*'
+JSON_STRING_PATTERN = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+JSON_FLAT_CONTAINER_PATTERN = rb"[\[{]%s(?:%s%s)*[\]}]" % (JSON_TEXT_PATTERN, JSON_STRING_PATTERN, JSON_TEXT_PATTERN)
+JSON_FLAT_CONTENT = re.compile(
+    rb"%s(?:(?:%s|%s)%s)*" % (JSON_TEXT_PATTERN, JSON_STRING_PATTERN, JSON_FLAT_CONTAINER_PATTERN, JSON_TEXT_PATTERN)
+)
+JSON_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+JSON_STRING = re.compile(JSON_STRING_PATTERN)
+JSON_SCALAR = re.compile(rb"[^,:\[\]{}\s]+")
+
+TOML_KEY_PATTERN = r"""[A-Za-z0-9_-]+|"(?:[^"\\]|\\.)*"|'[^']*'"""
+TOML_DOTTED_KEY_PATTERN = r"(?:%s)(?:\s*\.\s*(?:%s))*" % (TOML_KEY_PATTERN, TOML_KEY_PATTERN)
+
+INI_SECTION = re.compile(r"\[\s*(?P<name>[^\]]+?)\s*\]")
+INI_OPTION = re.compile(r"(?P<key>[^=:\s][^=:]*?)\s*[=:]\s*(?P<value>.*)")
+TOML_KEY = re.compile(TOML_KEY_PATTERN)
+TOML_TABLE = re.compile(r"\[\s*(?P<name>%s)\s*\](?:\s*#.*)?" % TOML_DOTTED_KEY_PATTERN)
+TOML_KEY_VALUE = re.compile(r"(?P<key>%s)\s*=\s*(?P<value>.*)" % TOML_DOTTED_KEY_PATTERN, re.DOTALL)
+TOML_STRING = re.compile(r""""(?:[^"\\]|\\.)*"|'[^']*'""")
+TOML_ARRAY_TABLE = object()
+ENV_KEY_VALUE = re.compile(r"(?:export\s+)?(?P<key>[A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?P<value>.*)")
+ENV_QUOTED_VALUE = re.compile(r"""(?P<quoted>"(?:[^"\\]|\\.)*"|'[^']*')\s*(?:#.*)?""")
+ENV_ESCAPE = re.compile(r"\\(.)", re.DOTALL)
+ENV_ESCAPES = {
+    "\\": "\\",
+    '"': '"',
+    "'": "'",
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+
+
+class ConfigFile(Source):
+    # noinspection PyShadowingBuiltins
+    def __init__(self, path: PathLike, *, section: Optional[str] = None, format: Optional[str] = None):
+        self.path = Path(path)
+        self.section = section
+        resolved_format = format or SUFFIX_TO_FORMAT.get(self.path.suffix.lower(), None)
+
+        if resolved_format is None or resolved_format not in FORMAT_TO_READER:
+            raise ValueError(f"Unsupported config file format: {self.path}")
+        self.format = resolved_format
+
+    def fetch(self, fields: Sequence[Field]) -> Dict[str, Any]:
+        reader = FORMAT_TO_READER[self.format]
+        env_name_to_name = {field.env_name: field.name for field in fields if field.env_name}
+        names = env_name_to_name.keys() if self.format == "env" else {field.name for field in fields}
+
+        try:
+            values = reader(self.path, names, self.section)
+        except (OSError, ValueError) as error:
+            raise ConfigFileError(self.path, str(error)) from error
+
+        if self.format == "env":
+            return {env_name_to_name[env_name]: value for env_name, value in values.items()}
+        return values
+
+
+def __read_json(path: Path, names: Collection[str], section: Optional[str]) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+    if not names or path.stat().st_size == 0:
+        return values
+
+    section_path = tuple(section.split(".")) if section else ()
+
+    with path.open("rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+        __scan_json_object(data, __skip_json_whitespace(data, 0), names, section_path, values)
+
+    return values
+
+
+def __scan_json_object(
+    data: mmap, position: int, names: Collection[str], section_path: Tuple[str, ...], values: Dict[str, Any]
+) -> int:
+    position = __expect_json_token(data, position, b"{")
+
+    while True:
+        position = __skip_json_whitespace(data, position)
+        if __peek(data, position) == b"}":
+            return position + 1
+
+        key_match = JSON_STRING.match(data, position)
+        if key_match is None:
+            raise ValueError(f"Invalid JSON, expected key at position {position}")
+
+        key = __load_json_value(key_match.group(), position)
+        position = __expect_json_token(data, __skip_json_whitespace(data, key_match.end()), b":")
+        position = __skip_json_whitespace(data, position)
+
+        if section_path and key == section_path[0] and __peek(data, position) == b"{":
+            return __scan_json_object(data, position, names, section_path[1:], values)
+        elif not section_path and key in names:
+            value_end = __skip_json_value(data, position)
+            values[key] = __load_json_value(data[position:value_end], position)
+            if len(values) == len(names):
+                return value_end
+            position = value_end
+        else:
+            position = __skip_json_value(data, position)
+
+        position = __skip_json_whitespace(data, position)
+        if __peek(data, position) == b",":
+            position += 1
+        elif __peek(data, position) != b"}":
+            raise ValueError(f"Invalid JSON, expected , or }} at position {position}")
+
+
+def __load_json_value(value: bytes, position: int) -> Any:
+    try:
+        return json.loads(value)
+    except ValueError as error:
+        raise ValueError(f"Invalid JSON value at position {position}: {error}") from error
+
+
+def __skip_json_value(data: mmap, position: int) -> int:
+    token = __peek(data, position)
+
+    if token == b'"':
+        string_match = JSON_STRING.match(data, position)
+        if string_match is None:
+            raise ValueError(f"Invalid JSON, unterminated string at position {position}")
+        return string_match.end()
+    elif token not in (b"{", b"["):
+        scalar_match = JSON_SCALAR.match(data, position)
+        if scalar_match is None:
+            raise ValueError(f"Invalid JSON, expected value at position {position}")
+        return scalar_match.end()
+
+    depth = 1
+    position += 1
+    while True:
+        position = JSON_FLAT_CONTENT.match(data, position).end()  # type: ignore
+        token = __peek(data, position)
+
+        if token in (b"{", b"["):
+            depth += 1
+        elif token in (b"}", b"]"):
+            depth -= 1
+        else:
+            raise ValueError(f"Invalid JSON, unterminated container at position {position}")
+
+        position += 1
+        if depth == 0:
+            return position
+
+
+def __peek(data: mmap, position: int) -> bytes:
+    end = position + 1
+    return data[position:end]
+
+
+def __skip_json_whitespace(data: mmap, position: int) -> int:
+    whitespace_match = JSON_WHITESPACE.match(data, position)
+    return whitespace_match.end() if whitespace_match else position
+
+
+def __expect_json_token(data: mmap, position: int, token: bytes) -> int:
+    if __peek(data, position) != token:
+        raise ValueError(f"Invalid JSON, expected {token.decode()} at position {position}")
+    return position + 1
+
+
+def __read_toml(path: Path, names: Collection[str], section: Optional[str]) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+    section_path = __parse_toml_key(section) if section else ()
+    current_table: Any = ()
+
+    with path.open(encoding="utf-8") as file:
+        for line_number, line in __iter_logical_lines(file, __is_complete_toml_line):
+            if line.startswith("["):
+                if current_table == section_path:
+                    break
+                table_match = TOML_TABLE.fullmatch(line)
+                current_table = __parse_toml_key(table_match.group("name")) if table_match else TOML_ARRAY_TABLE
+                continue
+
+            key_value_match = TOML_KEY_VALUE.match(line)
+            if current_table is TOML_ARRAY_TABLE or key_value_match is None:
+                continue
+
+            *table, key = current_table + __parse_toml_key(key_value_match.group("key"))
+            if tuple(table) == section_path and key in names:
+                values[key] = __parse_toml_value(key_value_match.group("value"), line_number)
+                if len(values) == len(names):
+                    break
+
+    return values
+
+
+def __parse_toml_key(key: str) -> Tuple[str, ...]:
+    parts = TOML_KEY.findall(key)
+    return tuple(json.loads(part) if part[0] == '"' else part.strip("'") for part in parts)
+
+
+def __parse_toml_value(value: str, line_number: int) -> Any:
+    try:
+        return __load_toml_value(value)
+    except ValueError as error:
+        raise ValueError(f"Invalid TOML value at line {line_number}: {error}") from error
+
+
+def __load_toml_value(value: str) -> Any:
+    if tomllib is not None:
+        return tomllib.loads(f"value = {value}")["value"]
+
+    value = value.split(" #", 1)[0].strip()
+    if value[:1] == "'" and value[-1:] == "'":
+        return value[1:-1]
+    elif value[:1] == '"':
+        return json.loads(value)
+    return value
+
+
+def __is_complete_toml_line(line: str) -> bool:
+    if line.count('"""') % 2 or line.count("'''") % 2:
+        return False
+
+    code = TOML_STRING.sub("", line).split("#", 1)[0]
+    return code.count("[") <= code.count("]") and code.count("{") <= code.count("}")
+
+
+def __read_ini(path: Path, names: Collection[str], section: Optional[str]) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+    lowercase_to_name = {name.lower(): name for name in names}
+    current_section: Optional[str] = None
+    target_sections = {section, "DEFAULT"} if section else {None, "DEFAULT"}
+    last_key: Optional[str] = None
+
+    with path.open(encoding="utf-8") as file:
+        for raw_line in file:
+            line = raw_line.strip()
+            if not line or line[0] in "#;":
+                continue
+            elif raw_line[0].isspace() and last_key is not None:
+                values[last_key] += f"\n{line}"
+                continue
+
+            last_key = None
+            section_match = INI_SECTION.fullmatch(line)
+            if section_match:
+                current_section = section_match.group("name")
+                continue
+
+            option_match = INI_OPTION.fullmatch(line)
+            if current_section not in target_sections or option_match is None:
+                continue
+
+            name = lowercase_to_name.get(option_match.group("key").lower(), None)
+            if name is not None and (name not in values or current_section != "DEFAULT"):
+                values[name] = option_match.group("value")
+                last_key = name
+
+    return values
+
+
+def __read_env(path: Path, names: Collection[str], section: Optional[str]) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            key_value_match = ENV_KEY_VALUE.fullmatch(line.strip())
+            if key_value_match is None or key_value_match.group("key") not in names:
+                continue
+
+            values[key_value_match.group("key")] = __unquote_env_value(key_value_match.group("value"))
+            if len(values) == len(names):
+                break
+
+    return values
+
+
+def __unquote_env_value(value: str) -> str:
+    quoted_match = ENV_QUOTED_VALUE.fullmatch(value)
+    if quoted_match is None:
+        return value.split(" #", 1)[0].strip()
+
+    quoted_value = quoted_match.group("quoted")
+    if quoted_value[0] == "'":
+        return quoted_value[1:-1]
+    return ENV_ESCAPE.sub(
+        lambda escape_match: ENV_ESCAPES.get(escape_match.group(1), escape_match.group()), quoted_value[1:-1]
+    )
+
+
+def __iter_logical_lines(file: IO[str], is_complete: Callable[[str], bool]) -> Iterator[Tuple[int, str]]:
+    buffered_line = ""
+    first_line_number = 0
+
+    for line_number, raw_line in enumerate(file, start=1):
+        line = raw_line.strip() if not buffered_line else f"{buffered_line}\n{raw_line.rstrip()}"
+        if not line or line.startswith("#"):
+            continue
+
+        first_line_number = first_line_number if buffered_line else line_number
+        if line.startswith("[") or is_complete(line):
+            buffered_line = ""
+            yield first_line_number, line
+        else:
+            buffered_line = line
+
+    if buffered_line:
+        yield first_line_number, buffered_line
+
+
+FORMAT_TO_READER: Mapping[str, Reader] = {
+    "json": __read_json,
+    "toml": __read_toml,
+    "ini": __read_ini,
+    "env": __read_env,
+}
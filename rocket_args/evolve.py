@@ -0,0 +1,116 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from rocket_args.lazy import RAW_VALUES_KEY
+from rocket_args.snapshot import get_state, restore_state
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    ContextVar = None  # type: ignore
+
+T = TypeVar("T")
+
+PARENT_KEY = "__rocket_parent__"
+DEPTH_KEY = "__rocket_depth__"
+MAX_DEPTH = 8
+MISSING = object()
+
+
+class ParentValue:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        return getattr(instance.__dict__[PARENT_KEY], self.name)
+
+
+__evolved_classes: "WeakKeyDictionary[type, type]" = WeakKeyDictionary()
+__overlays: "Optional[ContextVar[Mapping[int, Tuple[Any, Any]]]]" = (
+    ContextVar("rocket_args_overlays", default={}) if ContextVar is not None else None
+)
+
+
+def replace(instance: T, **changes: Any) -> T:
+    cls = get_original_class(instance)
+    schema = cls.get_schema()
+    unknown_names = [name for name in changes if name not in schema.casters]
+    if unknown_names:
+        raise TypeError(f"{cls.__name__} doesn't have fields: {', '.join(unknown_names)}")
+
+    depth = getattr(instance, "__dict__", {}).get(DEPTH_KEY, 0) + 1
+    if cls.__dictoffset__ == 0 or depth > MAX_DEPTH:
+        values = {name: value for name, value in __iter_values(instance, schema) if value is not MISSING}
+        return cls(**{**values, **changes})
+
+    evolved_cls: Any = get_evolved_class(cls)
+    evolved = evolved_cls.__new__(evolved_cls)
+    evolved.__dict__.update(changes)
+    evolved.__dict__[PARENT_KEY] = instance
+    evolved.__dict__[DEPTH_KEY] = depth
+    return evolved
+
+
+@contextmanager
+def overlay(instance: T, **changes: Any) -> Iterator[T]:
+    if __overlays is None:  # pragma: no cover
+        raise RuntimeError("overlay requires contextvars module (Python 3.7+ or its backport)")
+
+    overlays = __overlays.get()
+    key = id(instance)
+    derived = replace(current(instance), **changes)
+    token = __overlays.set({**overlays, key: (instance, derived)})
+
+    try:
+        yield derived
+    finally:
+        __overlays.reset(token)
+
+
+def current(instance: T) -> T:
+    if __overlays is None:  # pragma: no cover
+        return instance
+
+    entry = __overlays.get().get(id(instance), None)
+    return entry[1] if entry is not None and entry[0] is instance else instance
+
+
+def get_original_class(instance: Any) -> Any:
+    instance_dict = getattr(instance, "__dict__", {})
+    is_generated = PARENT_KEY in instance_dict or RAW_VALUES_KEY in instance_dict
+    return type(instance).__mro__[1] if is_generated else type(instance)
+
+
+def get_evolved_class(cls: Type[T]) -> Type[T]:
+    evolved_cls = __evolved_classes.get(cls, None)
+
+    if evolved_cls is None or evolved_cls.get_schema() is not cls.get_schema():  # type: ignore
+        evolved_cls = __create_evolved_class(cls)
+        __evolved_classes[cls] = evolved_cls
+
+    return evolved_cls
+
+
+def __create_evolved_class(cls: Type[T]) -> Type[T]:
+    schema = cls.get_schema()  # type: ignore
+
+    def __repr__(self: Any) -> str:
+        args = [f"{name}={value}" for name, value in __iter_values(self, schema) if value is not MISSING]
+        concatenated_args = ", ".join(args)
+        return f"{cls.__name__}({concatenated_args})"
+
+    def __reduce__(self: Any) -> Tuple[Any, ...]:
+        return restore_state, (cls, get_state(self, schema, (PARENT_KEY, DEPTH_KEY)))
+
+    namespace: Dict[str, Any] = {field.name: ParentValue(field.name) for field in schema.fields}
+    namespace.update(__module__=cls.__module__, __qualname__=cls.__qualname__, __repr__=__repr__, __reduce__=__reduce__)
+
+    metaclass: Any = type(cls)
+    return metaclass(cls.__name__, (cls,), namespace, schema=schema)
+
+
+def __iter_values(instance: Any, schema: Any) -> Iterator[Tuple[str, Any]]:
+    return ((field.name, getattr(instance, field.name, MISSING)) for field in schema.fields)
@@ -0,0 +1,72 @@
+from typing import Any, List, Optional, Sequence
+
+from rocket_args.utils import Color, Field, MessageBuilder
+
+
+class RocketArgsError(Exception):
+    pass
+
+
+class UnknownArgumentsError(RocketArgsError):
+    def __init__(self, arguments: Sequence[str]):
+        self.arguments = arguments
+        arguments_str = " ".join(arguments)
+        super().__init__(f"Unknown arguments: {Color.cli.value}{arguments_str}{Color.neutral.value}")
+
+
+class MissingArgumentsError(RocketArgsError):
+    def __init__(self, fields: Sequence[Field]):
+        self.fields = fields
+        super().__init__(MessageBuilder(fields).create_missing_arguments_message())
+
+
+class InvalidValueError(RocketArgsError, ValueError):
+    def __init__(self, field_name: str, value: Any, reason: str, row: Optional[int] = None):
+        self.field_name = field_name
+        self.value = value
+        self.reason = reason
+        self.row = row
+        location = f" in row {row}" if row is not None else ""
+        super().__init__(
+            f"Invalid value of {Color.cli.value}{field_name}{Color.neutral.value}{location}: {value!r} ({reason})"
+        )
+
+
+class ConfigFileError(RocketArgsError, ValueError):
+    def __init__(self, path: Any, reason: str):
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Can't read config file {Color.cli.value}{path}{Color.neutral.value}: {reason}")
+
+
+class SecretsDirError(RocketArgsError, OSError):
+    def __init__(self, path: Any, reason: str):
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Can't read secrets from {Color.cli.value}{path}{Color.neutral.value}: {reason}")
+
+
+class HelpRequested(RocketArgsError):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+class ValidationError(RocketArgsError, ValueError):
+    def __init__(self, missing_fields: Sequence[Field], invalid_values: Sequence[InvalidValueError]):
+        self.missing_fields = missing_fields
+        self.invalid_values = invalid_values
+        self.errors: List[RocketArgsError] = [*invalid_values]
+        if missing_fields:
+            self.errors.insert(0, MissingArgumentsError(missing_fields))
+
+        errors_str = "\n".join(str(error) for error in self.errors)
+        super().__init__(f"{len(missing_fields) + len(invalid_values)} invalid arguments:\n{errors_str}")
+
+
+def create_validation_error(
+    missing_fields: Sequence[Field], invalid_values: Sequence[InvalidValueError]
+) -> RocketArgsError:
+    if not invalid_values:
+        return MissingArgumentsError(missing_fields)
+    return ValidationError(missing_fields, invalid_values)
@@ -0,0 +1,104 @@
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from rocket_args.exceptions import InvalidValueError
+from rocket_args.type_casting import Caster
+
+T = TypeVar("T")
+
+RAW_VALUES_KEY = "__rocket_raw_values__"
+
+__lazy_classes: "WeakKeyDictionary[type, type]" = WeakKeyDictionary()
+
+
+class LazyValue:
+    def __init__(self, name: str, caster: Optional[Caster]):
+        self.name = name
+        self.caster = caster
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        raw_values = instance.__dict__[RAW_VALUES_KEY]
+        if self.name not in raw_values:
+            raise AttributeError(self.name)
+
+        value = cast_raw_value(self.name, raw_values[self.name], self.caster)
+        instance.__dict__[self.name] = value
+        raw_values.pop(self.name, None)
+        return value
+
+
+def create_lazy_instance(cls: Type[T], raw_args: Mapping[str, Any]) -> T:
+    schema = cls.get_schema()  # type: ignore
+    lazy_cls = get_lazy_class(cls)
+    instance = lazy_cls.__new__(lazy_cls)
+
+    instance.__dict__.update({name: value for name, value in schema.defaults.items() if name not in raw_args})
+    instance.__dict__[RAW_VALUES_KEY] = {name: raw_args[name] for name in schema.casters if name in raw_args}
+    return instance
+
+
+def get_lazy_class(cls: Type[T]) -> Type[T]:
+    lazy_cls = __lazy_classes.get(cls, None)
+
+    if lazy_cls is None or lazy_cls.get_schema() is not cls.get_schema():  # type: ignore
+        lazy_cls = __create_lazy_class(cls)
+        __lazy_classes[cls] = lazy_cls
+
+    return lazy_cls
+
+
+def resolve(instance: T) -> T:
+    raw_values = instance.__dict__.get(RAW_VALUES_KEY, {})
+
+    for name in list(raw_values.keys()):
+        getattr(instance, name)
+
+    return instance
+
+
+def cast_raw_value(name: str, value: Any, caster: Optional[Caster]) -> Any:
+    if value is None or caster is None:
+        return value
+
+    try:
+        return caster(value)
+    except (TypeError, ValueError) as error:
+        raise InvalidValueError(name, value, str(error)) from error
+
+
+def __create_lazy_class(cls: Type[T]) -> Type[T]:
+    if cls.__dictoffset__ == 0:  # type: ignore
+        raise TypeError(f"Lazy parsing requires instances with __dict__, {cls.__name__} doesn't have it")
+
+    schema = cls.get_schema()  # type: ignore
+    namespace: Dict[str, Any] = {name: LazyValue(name, caster) for name, caster in schema.casters.items()}
+    namespace.update(
+        __module__=cls.__module__, __qualname__=cls.__qualname__, __repr__=__lazy_repr, __reduce__=__lazy_reduce
+    )
+
+    metaclass: Any = type(cls)
+    return metaclass(cls.__name__, (cls,), namespace, schema=schema)
+
+
+def __lazy_repr(self: Any) -> str:
+    raw_values = self.__dict__.get(RAW_VALUES_KEY, {})
+    args = []
+
+    for field in self.get_schema().fields:
+        if field.name in raw_values:
+            args.append(f"{field.name}=<pending {raw_values[field.name]!r}>")
+        elif field.name in self.__dict__:
+            args.append(f"{field.name}={self.__dict__[field.name]}")
+
+    concatenated_args = ", ".join(args)
+    return f"{self.__class__.__name__}({concatenated_args})"
+
+
+def __lazy_reduce(self: Any) -> Tuple[Any, ...]:
+    from rocket_args.snapshot import get_state, restore_state
+
+    original_cls = self.__class__.__mro__[1]
+    return restore_state, (original_cls, get_state(self, self.get_schema(), (RAW_VALUES_KEY,)))
@@ -1,13 +1,57 @@
-from typing import Any, Dict, List, Sequence, Type, TypeVar
+import os
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_type_hints,
+)
 
-from rocket_args.arg_parsing import get_cmd_line_args, get_env_args
-from rocket_args.type_casting import cast_args_to_fields_types
-from rocket_args.utils import Argument, Field, MessageBuilder
+from rocket_args.arg_parsing import parse_cmd_line_args, tokenize_known_cmd_line_args
+from rocket_args.batch import ArgsInput, parse_columns
+from rocket_args.exceptions import (
+    HelpRequested,
+    InvalidValueError,
+    MissingArgumentsError,
+    RocketArgsError,
+    UnknownArgumentsError,
+    create_validation_error,
+)
+from rocket_args.schema import Schema
+from rocket_args.sources import Source, build_pipeline, fetch_from_sources
+from rocket_args.stats import NULL_STATS, ParseStats, stats_from_env
+from rocket_args.type_casting import is_class_var
+from rocket_args.utils import Argument, Field, Subcommands
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rocket_args.codegen import Parser
 
 T = TypeVar("T", bound="RocketBase")
 
 
 class RocketBase:
+    __slots__ = ()
+    __schema = cast(Optional[Schema], None)
+    __pinned_schema = cast(Optional[Schema], None)
+    __fields = cast(Optional[Tuple[Field, ...]], None)
+    __parser = cast(Optional["Parser"], None)
+
+    def __init_subclass__(cls, schema: Optional[Schema] = None, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls.__pinned_schema = schema
+        cls.__reset_schema()
+
     def __init__(self, **data: Any):
         for name, value in data.items():
             self.__setattr__(name, value)
@@ -17,40 +61,281 @@ class RocketBase:
         concatenated_args = ", ".join(args)
         return f"{self.__class__.__name__}({concatenated_args})"
 
+    def replace(self: T, **changes: Any) -> T:
+        from rocket_args.evolve import replace
+
+        return replace(self, **changes)
+
+    @classmethod
+    def parse_args(
+        cls: Type[T],
+        argv: Optional[Sequence[str]] = None,
+        env: Optional[Mapping[str, str]] = None,
+        *,
+        sources: Optional[Sequence[Source]] = None,
+        lazy: bool = False,
+        stats: Optional[ParseStats] = None,
+    ) -> T:
+        argv = sys.argv[1:] if argv is None else argv
+        env = os.environ if env is None else env
+        program_name = os.path.basename(sys.argv[0])
+        env_stats = stats_from_env(env) if stats is None else None
+
+        try:
+            return cls.parse(argv, env, program_name=program_name, sources=sources, lazy=lazy, stats=stats or env_stats)
+        except RocketArgsError as error:
+            raise SystemExit(str(error)) from None
+        finally:
+            if env_stats is not None:
+                print(env_stats.format(cls.__name__), file=sys.stderr)
+
+    @classmethod
+    def parse_known_args(
+        cls: Type[T],
+        argv: Optional[Sequence[str]] = None,
+        env: Optional[Mapping[str, str]] = None,
+        *,
+        sources: Optional[Sequence[Source]] = None,
+        lazy: bool = False,
+        stats: Optional[ParseStats] = None,
+    ) -> Tuple[T, Sequence[str]]:
+        argv = sys.argv[1:] if argv is None else argv
+        env = os.environ if env is None else env
+        program_name = os.path.basename(sys.argv[0])
+        env_stats = stats_from_env(env) if stats is None else None
+
+        try:
+            return cls.parse_known(
+                argv, env, program_name=program_name, sources=sources, lazy=lazy, stats=stats or env_stats
+            )
+        except RocketArgsError as error:
+            raise SystemExit(str(error)) from None
+        finally:
+            if env_stats is not None:
+                print(env_stats.format(cls.__name__), file=sys.stderr)
+
+    @classmethod
+    def parse(
+        cls: Type[T],
+        argv: Sequence[str],
+        env: Mapping[str, str],
+        *,
+        program_name: Optional[str] = None,
+        sources: Optional[Sequence[Source]] = None,
+        lazy: bool = False,
+        stats: Optional[ParseStats] = None,
+    ) -> T:
+        if cls.__parser is not None and sources is None and not lazy and stats is None:
+            return cls.__parser(argv, env, program_name)
+
+        instance, _ = cls.__parse(argv, env, program_name, sources, lazy, stats, known_only=False)
+        return instance
+
+    @classmethod
+    def parse_known(
+        cls: Type[T],
+        argv: Sequence[str],
+        env: Mapping[str, str],
+        *,
+        program_name: Optional[str] = None,
+        sources: Optional[Sequence[Source]] = None,
+        lazy: bool = False,
+        stats: Optional[ParseStats] = None,
+    ) -> Tuple[T, Sequence[str]]:
+        return cls.__parse(argv, env, program_name, sources, lazy, stats, known_only=True)
+
+    @classmethod
+    def parse_many(cls: Type[T], inputs: Iterable[ArgsInput], *, program_name: Optional[str] = None) -> List[T]:
+        rows_count, columns = parse_columns(cls.get_schema(), inputs, program_name or cls.__name__)
+        names = list(columns.keys())
+        rows = zip(*columns.values()) if names else [()] * rows_count
+        return [cls(**dict(zip(names, values))) for values in rows]
+
+    @classmethod
+    def parse_columns(cls, inputs: Iterable[ArgsInput], *, program_name: Optional[str] = None) -> Dict[str, List[Any]]:
+        _, columns = parse_columns(cls.get_schema(), inputs, program_name or cls.__name__)
+        return columns
+
+    @classmethod
+    def print_help(cls, file: Optional[TextIO] = None) -> None:
+        program_name = os.path.basename(sys.argv[0])
+        cls.get_schema().message_builder.write_help_message(sys.stdout if file is None else file, program_name)
+
+    @classmethod
+    def completion_script(
+        cls,
+        shell: str = "bash",
+        *,
+        program_name: Optional[str] = None,
+        cache_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ) -> str:
+        from rocket_args.completion import create_script
+
+        program_name = os.path.basename(sys.argv[0]) if program_name is None else program_name
+        return create_script(cls, shell, program_name, cache_path)
+
     @classmethod
-    def parse_args(cls: Type[T]) -> T:
-        fields_data = cls.__get_fields_data()
-        parsed_args = cls.__parse_args(fields_data)
+    def write_completion_cache(
+        cls, path: Union[str, "os.PathLike[str]"], *, program_name: Optional[str] = None
+    ) -> None:
+        from rocket_args.completion import write_cache
 
-        absent_args = [field for field in fields_data if field.name not in parsed_args]
-        if absent_args:
-            help_message = MessageBuilder(absent_args).create_missing_arguments_message()
-            raise SystemExit(help_message)
+        write_cache(cls, path, os.path.basename(sys.argv[0]) if program_name is None else program_name)
 
-        return cls(**parsed_args)
+    @classmethod
+    def compile_parser(cls) -> "Parser":
+        from rocket_args.codegen import compile_parser
+
+        if cls.__parser is None:
+            cls.__parser = compile_parser(cls, cls.get_schema())
+        return cls.__parser
+
+    @classmethod
+    def get_schema(cls) -> Schema:
+        if cls.__schema is None:
+            cls.__schema = Schema(cls.__get_fields_data())
+        return cls.__schema
 
-    # noinspection PyShadowingBuiltins
     @classmethod
-    def __get_fields_data(cls) -> List[Field]:
-        field_names_with_types = cls.__annotations__
-        defaults = [cls.__dict__.get(name, ...) for name in field_names_with_types.keys()]
-        args = [Argument(default=default) if not isinstance(default, Argument) else default for default in defaults]
-        fields = [Field(name, type, data) for (name, type), data in zip(field_names_with_types.items(), args)]
-        return fields
+    def invalidate_schema(cls) -> None:
+        cls.__reset_schema()
+        for subclass in cls.__subclasses__():
+            subclass.invalidate_schema()
+
+    @classmethod
+    def __reset_schema(cls) -> None:
+        cls.__schema = cls.__pinned_schema
+        cls.__fields = cls.__pinned_schema.fields if cls.__pinned_schema is not None else None
+        cls.__parser = None
+
+    @classmethod
+    def __parse(
+        cls: Type[T],
+        argv: Sequence[str],
+        env: Mapping[str, str],
+        program_name: Optional[str],
+        sources: Optional[Sequence[Source]],
+        lazy: bool,
+        stats: Optional[ParseStats],
+        known_only: bool,
+    ) -> Tuple[T, Sequence[str]]:
+        stats = NULL_STATS if stats is None else stats
+
+        with stats.measure("schema"):
+            schema = cls.get_schema()
+        with stats.measure("argv"):
+            if known_only:
+                cli_args, remainder_start = tokenize_known_cmd_line_args(argv, schema.cli_name_to_field)
+                remainder = argv[remainder_start:]
+            else:
+                cli_args, remainder = parse_cmd_line_args(argv, schema.cli_name_to_field), ()
+        with stats.measure("sources"):
+            raw_args = fetch_from_sources(build_pipeline(sources, env, cli_args), schema.fields)
+
+        if "help" in cli_args:
+            with stats.measure("help"):
+                help_message = schema.message_builder.create_help_message(program_name or cls.__name__)
+            raise HelpRequested(help_message)
+
+        with stats.measure("validation"):
+            absent_args = [
+                field for field in schema.fields if field.name not in raw_args and field.name not in schema.defaults
+            ]
+            if absent_args and lazy:
+                raise MissingArgumentsError(absent_args)
+
+        if schema.subcommand_field is not None and schema.subcommand_field.name in raw_args:
+            raw_args, remainder = cls.__parse_subcommand(
+                schema.subcommand_field, raw_args, env, program_name or cls.__name__, sources, lazy, stats, known_only
+            )
+
+        if lazy:
+            from rocket_args.lazy import create_lazy_instance
+
+            with stats.measure("init"):
+                return create_lazy_instance(cls, raw_args), remainder
+
+        invalid_values: List[InvalidValueError] = []
+        with stats.measure("cast"):
+            parsed_args = {**schema.defaults, **stats.cast_args(raw_args, schema.casters, invalid_values)}
+        if absent_args or invalid_values:
+            raise create_validation_error(absent_args, invalid_values)
+
+        with stats.measure("init"):
+            return cls(**parsed_args), remainder
+
+    @classmethod
+    def __get_fields_data(cls) -> Tuple[Field, ...]:
+        if cls.__fields is None:
+            mro = cls.__mro__
+            shared_start = next(
+                (
+                    index
+                    for index in range(1, len(mro))
+                    if issubclass(mro[index], RocketBase) and mro[index].__mro__ == mro[index:]
+                ),
+                len(mro),
+            )
+            fields: Dict[str, Field] = {}
+            if shared_start < len(mro):
+                shared_base = cast(Type[RocketBase], mro[shared_start])
+                fields.update((field.name, field) for field in shared_base.__get_fields_data())
+            for klass in reversed(mro[:shared_start]):
+                if klass is not object:
+                    fields.update(get_own_fields(klass, fields))
+            cls.__fields = tuple(fields.values())
+        return cls.__fields
 
     @staticmethod
-    def __parse_args(fields: Sequence[Field]) -> Dict[str, Any]:
-        help_field = Field(name="help", type=None, value=Argument(cli_names=["-h", "--help"], env_name=False))
-        fields_with_help = [help_field] + list(fields)
+    def __parse_subcommand(
+        field: Field,
+        raw_args: Dict[str, Any],
+        env: Mapping[str, str],
+        program_name: str,
+        sources: Optional[Sequence[Source]],
+        lazy: bool,
+        stats: ParseStats,
+        known_only: bool,
+    ) -> Tuple[Dict[str, Any], Sequence[str]]:
+        command_argv = raw_args[field.name]
+        command_argv = [command_argv] if isinstance(command_argv, str) else command_argv
+        command_name = command_argv[0]
+        subcommands = cast(Subcommands, field.value)
+
+        if command_name not in subcommands.commands:
+            raise UnknownArgumentsError(command_argv)
+
+        command_cls = cast(Type[RocketBase], subcommands.resolve(command_name))
+        command, remainder = command_cls.__parse(
+            command_argv[1:], env, f"{program_name} {command_name}", sources, lazy, stats, known_only
+        )
+        return {**raw_args, field.name: command}, remainder
+
+
+# noinspection PyShadowingBuiltins
+def get_own_fields(cls: type, inherited_fields: Mapping[str, Field]) -> Dict[str, Field]:
+    annotations = cls.__dict__.get("__annotations__", {})
+    type_hints = get_type_hints(cls) if annotations else {}
+    fields = {}
+
+    for name in annotations:
+        if not is_class_var(type_hints[name]):
+            fields[name] = Field(name, type_hints[name], __as_argument(cls.__dict__.get(name, ...)))
+
+    for name, field in inherited_fields.items():
+        if name not in annotations and name in cls.__dict__:
+            fields[name] = Field(name, field.type, __as_argument(cls.__dict__[name], field.value))
+
+    return fields
 
-        defaults = {field.name: field.value.default for field in fields_with_help if field.value.default is not ...}
-        env_args = cast_args_to_fields_types(get_env_args(fields_with_help), fields)
-        cli_args = cast_args_to_fields_types(get_cmd_line_args(fields_with_help), fields)
 
-        parsed_args = [defaults, env_args, cli_args]
-        joined_args = {key: value for args in parsed_args for key, value in args.items()}
+def __as_argument(value: Any, inherited: Optional[Argument] = None) -> Argument:
+    if isinstance(value, Argument):
+        return value
+    elif inherited is None:
+        return Argument(default=value)
 
-        if "help" in joined_args:
-            help_message = MessageBuilder(fields_with_help).create_help_message()
-            raise SystemExit(help_message)
-        return joined_args
+    argument = object.__new__(type(inherited))
+    argument.__dict__.update(vars(inherited))
+    argument.default = value
+    return argument
@@ -0,0 +1,64 @@
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Sequence, Tuple
+
+from rocket_args.arg_parsing import build_cli_index
+from rocket_args.type_casting import Caster, get_caster, get_compact_caster, get_file_caster, get_group_caster
+from rocket_args.utils import Argument, Field, MessageBuilder
+from rocket_args.validation import add_validator, compile_validator
+
+
+class Schema:
+    def __init__(self, fields: Sequence[Field]):
+        self.fields: Tuple[Field, ...] = tuple(fields)
+        self.help_field = Field(
+            name="help", type=bool, value=Argument(cli_names=["-h", "--help"], env_name=False, flag=True)
+        )
+        self.fields_with_help: Tuple[Field, ...] = (self.help_field,) + self.fields
+
+        self.cli_name_to_field: Mapping[str, Field] = MappingProxyType(build_cli_index(self.fields_with_help))
+        self.env_name_to_field: Mapping[str, Field] = MappingProxyType(
+            {field.env_name: field for field in self.fields if field.env_name}
+        )
+        self.defaults: Mapping[str, Any] = MappingProxyType(
+            {field.name: field.value.default for field in self.fields if field.value.default is not ...}
+        )
+        self.casters: Mapping[str, Optional[Caster]] = MappingProxyType(
+            {field.name: self.__create_caster(field) for field in self.fields}
+        )
+        self.subcommand_field: Optional[Field] = self.__find_subcommand_field()
+        self.__message_builder: Optional[MessageBuilder] = None
+
+    @property
+    def message_builder(self) -> MessageBuilder:
+        if self.__message_builder is None:
+            self.__message_builder = MessageBuilder(self.fields_with_help)
+        return self.__message_builder
+
+    @staticmethod
+    def __create_caster(field: Field) -> Optional[Caster]:
+        if field.is_subcommand:
+            return None
+        elif field.value.flag and field.type is not bool:
+            raise TypeError(f"Only bool fields can be flags, got {field.name}: {field.type}")
+
+        caster: Optional[Caster]
+        group_type = field.group_type
+        if group_type is not None:
+            caster = get_group_caster(group_type)
+        elif field.value.compact:
+            caster = get_compact_caster(field.type, read_files=field.value.from_file)
+        elif field.value.from_file:
+            caster = get_file_caster(field.type)
+        else:
+            caster = get_caster(field.type)
+        return add_validator(caster, compile_validator(field.value, field.type))
+
+    def __find_subcommand_field(self) -> Optional[Field]:
+        subcommand_fields = [field for field in self.fields if field.is_subcommand]
+
+        if len(subcommand_fields) > 1:
+            raise TypeError(
+                f"Only one Subcommands field is allowed, got: {[field.name for field in subcommand_fields]}"
+            )
+
+        return subcommand_fields[0] if subcommand_fields else None
@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence, Union
+
+from rocket_args.exceptions import SecretsDirError
+from rocket_args.sources import Source
+from rocket_args.utils import Field
+
+
+class SecretsDir(Source):
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+        strip: bool = True,
+    ):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got: {max_workers}")
+
+        self.path = Path(path)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.strip = strip
+
+    def fetch(self, fields: Sequence[Field]) -> Mapping[str, Any]:
+        name_to_file = self.__find_files(fields)
+
+        if len(name_to_file) <= 1:
+            return {name: self.__read_file(file_path) for name, file_path in name_to_file.items()}
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(name_to_file)))
+        try:
+            futures = {name: executor.submit(self.__read_file, file_path) for name, file_path in name_to_file.items()}
+            done, pending = wait(futures.values(), timeout=self.timeout, return_when=FIRST_EXCEPTION)
+
+            for future in pending:
+                future.cancel()
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    raise error
+            if pending:
+                raise SecretsDirError(self.path, f"reading {len(pending)} secrets timed out after {self.timeout}s")
+
+            return {name: future.result() for name, future in futures.items()}
+        finally:
+            executor.shutdown(wait=False)
+
+    def __find_files(self, fields: Sequence[Field]) -> Dict[str, Path]:
+        try:
+            with os.scandir(self.path) as entries:
+                file_names = {entry.name for entry in entries if not entry.name.startswith(".") and entry.is_file()}
+        except FileNotFoundError:
+            return {}
+        except OSError as error:
+            raise SecretsDirError(self.path, str(error)) from error
+
+        name_to_file = {}
+        for field in fields:
+            candidates = [field.name, field.env_name] if field.env_name else [field.name]
+            file_name = next((candidate for candidate in candidates if candidate in file_names), None)
+            if file_name is not None:
+                name_to_file[field.name] = self.path / file_name
+
+        return name_to_file
+
+    def __read_file(self, file_path: Path) -> str:
+        try:
+            value = file_path.read_text(encoding="utf-8")
+        except (OSError, ValueError) as error:
+            raise SecretsDirError(file_path, str(error)) from error
+        return value.rstrip("\r\n") if self.strip else value
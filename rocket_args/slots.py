@@ -0,0 +1,104 @@
+from operator import itemgetter
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union, overload
+
+from rocket_args.rocket_base import RocketBase
+
+T = TypeVar("T", bound=Type[RocketBase])
+
+MISSING = object()
+
+
+@overload
+def slotted(cls: T) -> T: ...
+
+
+@overload
+def slotted(cls: None = None, *, frozen: bool = False) -> Callable[[T], T]: ...
+
+
+def slotted(cls: Optional[T] = None, *, frozen: bool = False) -> Union[T, Callable[[T], T]]:
+    def wrap(cls: T) -> T:
+        return __make_tuple_class(cls) if frozen else __make_slotted_class(cls)
+
+    return wrap if cls is None else wrap(cls)
+
+
+def __make_slotted_class(cls: T) -> T:
+    names = __get_field_names(cls)
+    namespace = __copy_namespace(cls, names)
+    namespace["__slots__"] = names
+    namespace["__init__"] = __create_init(names)
+    namespace["__repr__"] = __create_repr(names)
+    return __create_class(cls, cls.__bases__, namespace)
+
+
+def __make_tuple_class(cls: T) -> T:
+    schema = cls.get_schema()
+    names = __get_field_names(cls)
+    namespace = __copy_namespace(cls, names)
+    namespace["__slots__"] = ()
+
+    for position, name in enumerate(names):
+        namespace[name] = property(itemgetter(position))
+
+    def __init__(self: Any, **data: Any) -> None:
+        pass
+
+    def __reduce__(self: tuple) -> Tuple[Any, ...]:
+        return tuple.__new__, (type(self), tuple(self))
+
+    namespace["__new__"] = __create_new(names, schema.defaults)
+    namespace["__init__"] = __init__
+    namespace["__reduce__"] = __reduce__
+    namespace["__repr__"] = __create_repr(names)
+    return __create_class(cls, (tuple,) + cls.__bases__, namespace)
+
+
+def __create_class(cls: T, bases: Tuple[type, ...], namespace: Dict[str, Any]) -> T:
+    metaclass: Any = type(cls)
+    return metaclass(cls.__name__, bases, namespace, schema=cls.get_schema())
+
+
+def __get_field_names(cls: T) -> Tuple[str, ...]:
+    return tuple(field.name for field in cls.get_schema().fields)
+
+
+def __copy_namespace(cls: T, names: Sequence[str]) -> Dict[str, Any]:
+    excluded_names = set(names) | {"__dict__", "__weakref__"}
+    return {name: value for name, value in cls.__dict__.items() if name not in excluded_names}
+
+
+def __create_init(names: Sequence[str]) -> Callable[..., None]:
+    parameters = __join_parameters("_rocket_self", [f"{name}=MISSING" for name in names])
+    assignments = "".join(f"\n    if {name} is not MISSING:\n        _rocket_self.{name} = {name}" for name in names)
+    source = f"def __init__({parameters}):{assignments}\n    pass"
+
+    namespace: Dict[str, Any] = {"MISSING": MISSING}
+    exec(source, namespace)
+    return namespace["__init__"]
+
+
+def __create_new(names: Sequence[str], defaults: Mapping[str, Any]) -> Callable[..., tuple]:
+    parameters = __join_parameters(
+        "_rocket_cls", [f"{name}=DEFAULTS[{name!r}]" if name in defaults else name for name in names]
+    )
+    values = "".join(f"{name}, " for name in names)
+    source = f"def __new__({parameters}):\n    return tuple_new(_rocket_cls, ({values}))"
+
+    namespace: Dict[str, Any] = {"DEFAULTS": defaults, "tuple_new": tuple.__new__}
+    exec(source, namespace)
+    return namespace["__new__"]
+
+
+def __join_parameters(first_parameter: str, keyword_parameters: Sequence[str]) -> str:
+    return ", ".join([first_parameter, "*", *keyword_parameters] if keyword_parameters else [first_parameter])
+
+
+def __create_repr(names: Sequence[str]) -> Callable[[Any], str]:
+    def __repr__(self: Any) -> str:
+        values = [(name, getattr(self, name, MISSING)) for name in names]
+        args = [f"{name}={value}" for name, value in values if value is not MISSING]
+        concatenated_args = ", ".join(args)
+        return f"{self.__class__.__name__}({concatenated_args})"
+
+    return __repr__
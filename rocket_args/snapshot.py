@@ -0,0 +1,136 @@
+import json
+import pickle
+from array import array
+from enum import Enum
+from hashlib import blake2b
+from typing import Any, Collection, Dict, List, Tuple, Type, TypeVar, cast
+
+from rocket_args.schema import Schema
+from rocket_args.utils import Field, Subcommands
+
+T = TypeVar("T")
+
+MAGIC = b"RKA"
+VERSION = 1
+FINGERPRINT_SIZE = 8
+VERSION_OFFSET = len(MAGIC)
+FINGERPRINT_OFFSET = VERSION_OFFSET + 1
+HEADER_SIZE = FINGERPRINT_OFFSET + FINGERPRINT_SIZE
+COLLECTION_TYPES = (list, tuple, set, frozenset, array)
+MISSING = object()
+
+
+def to_bytes(instance: Any) -> bytes:
+    schema = instance.get_schema()
+    values = get_values(instance, schema)
+    return MAGIC + bytes([VERSION]) + get_fingerprint(schema) + pickle.dumps(values, pickle.HIGHEST_PROTOCOL)
+
+
+def from_bytes(cls: Type[T], data: bytes) -> T:
+    schema = cls.get_schema()  # type: ignore
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Data isn't rocket_args snapshot")
+
+    magic = bytes(data[:VERSION_OFFSET])
+    version = data[VERSION_OFFSET]
+    fingerprint = bytes(data[FINGERPRINT_OFFSET:HEADER_SIZE])
+
+    if magic != MAGIC:
+        raise ValueError("Data isn't rocket_args snapshot")
+    elif version != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}, expected: {VERSION}")
+    elif fingerprint != get_fingerprint(schema):
+        raise ValueError(f"Snapshot was created for different schema than {cls.__name__} has")
+
+    values = pickle.loads(data[HEADER_SIZE:])
+    return restore_instance(cls, values)
+
+
+def to_argv(instance: Any) -> List[str]:
+    schema = instance.get_schema()
+    argv = []
+    subcommand_argv: List[str] = []
+
+    for field, value in zip(schema.fields, get_values(instance, schema)):
+        if value is None or not field.cli_names:
+            continue
+        elif field.is_subcommand:
+            subcommand_argv = [__get_subcommand_name(field, value), *to_argv(value)]
+        elif field.is_flag and value is True:
+            argv.append(__get_long_cli_name(field))
+        else:
+            argv.append(f"{__get_long_cli_name(field)}={format_value(value)}")
+
+    return argv + subcommand_argv
+
+
+def to_env(instance: Any) -> Dict[str, str]:
+    schema = instance.get_schema()
+    return {
+        field.env_name: format_value(value)
+        for field, value in zip(schema.fields, get_values(instance, schema))
+        if value is not None and field.env_name and not field.is_subcommand
+    }
+
+
+def format_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, Enum):
+        return value.name
+    elif isinstance(value, COLLECTION_TYPES):
+        return json.dumps([format_value(item) for item in value])
+    elif isinstance(value, dict):
+        return json.dumps({format_value(key): format_value(item) for key, item in value.items()})
+    elif callable(getattr(value, "get_schema", None)):
+        schema = value.get_schema()
+        values = zip(schema.fields, get_values(value, schema))
+        return json.dumps({field.name: format_value(item) for field, item in values if item is not None})
+    return str(value)
+
+
+def get_values(instance: Any, schema: Schema) -> Tuple[Any, ...]:
+    return tuple(getattr(instance, field.name) for field in schema.fields)
+
+
+def get_fingerprint(schema: Schema) -> bytes:
+    description = repr([(field.name, repr(field.type)) for field in schema.fields])
+    return blake2b(description.encode(), digest_size=FINGERPRINT_SIZE).digest()
+
+
+def restore_instance(cls: Type[T], values: Tuple[Any, ...]) -> T:
+    names = [field.name for field in cls.get_schema().fields]  # type: ignore
+    return cls(**dict(zip(names, values)))
+
+
+def get_state(instance: Any, schema: Schema, internal_keys: Collection[str] = ()) -> Dict[str, Any]:
+    state = {field.name: getattr(instance, field.name, MISSING) for field in schema.fields}
+    state.update((key, value) for key, value in vars(instance).items() if key not in internal_keys)
+    return {name: value for name, value in state.items() if value is not MISSING}
+
+
+def restore_state(cls: Type[T], state: Dict[str, Any]) -> T:
+    instance = cls.__new__(cls)
+    instance.__dict__.update(state)
+    return instance
+
+
+def __get_long_cli_name(field: Field) -> str:
+    cli_names = field.cli_names or ()
+    return next((name for name in cli_names if name.startswith("--")), cli_names[0])
+
+
+def __get_subcommand_name(field: Field, command: Any) -> str:
+    subcommands = cast(Subcommands, field.value)
+    command_path = __get_class_path(type(command))
+
+    for name, registered in subcommands.commands.items():
+        registered_path = registered.replace(":", ".") if isinstance(registered, str) else __get_class_path(registered)
+        if registered_path == command_path:
+            return name
+
+    raise ValueError(f"{type(command).__name__} isn't registered as subcommand of {field.name}")
+
+
+def __get_class_path(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
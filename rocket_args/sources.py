@@ -0,0 +1,171 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from rocket_args.arg_parsing import get_env_args
+from rocket_args.utils import Field
+
+
+class Source(ABC):
+    @abstractmethod
+    def fetch(self, fields: Sequence[Field]) -> Mapping[str, Any]:
+        pass
+
+
+class EnvSource(Source):
+    def __init__(self, env: Optional[Mapping[str, str]] = None):
+        self.env = env
+
+    def fetch(self, fields: Sequence[Field]) -> Mapping[str, Any]:
+        return get_env_args(fields, self.env)
+
+    def bind(self, env: Mapping[str, str]) -> "EnvSource":
+        return EnvSource(env)
+
+
+KeyTrie = Dict[str, Tuple[str, Optional["KeyTrie"]]]
+PrefixedItems = List[Tuple[List[str], str]]
+
+
+class EnvSnapshot:
+    def __init__(self) -> None:
+        self.env: Optional[Mapping[str, str]] = None
+        self.items: PrefixedItems = []
+
+
+class PrefixEnvSource(EnvSource):
+    def __init__(
+        self, prefix: str, delimiter: str = "__", env: Optional[Mapping[str, str]] = None, *, cache: bool = False
+    ):
+        super().__init__(env)
+        self.prefix = prefix
+        self.delimiter = delimiter
+        self.cache = cache
+        self.snapshot = EnvSnapshot()
+
+    def fetch(self, fields: Sequence[Field]) -> Mapping[str, Any]:
+        env = os.environ if self.env is None else self.env
+
+        if not self.cache:
+            items = get_prefixed_items(env, self.prefix, self.delimiter)
+        elif self.snapshot.env is env:
+            items = self.snapshot.items
+        else:
+            items = self.snapshot.items = get_prefixed_items(env, self.prefix, self.delimiter)
+            self.snapshot.env = env
+
+        return get_nested_values(create_key_trie(fields), items)
+
+    def bind(self, env: Mapping[str, str]) -> "EnvSource":
+        source = PrefixEnvSource(self.prefix, self.delimiter, env, cache=self.cache)
+        source.snapshot = self.snapshot
+        return source
+
+    def refresh(self) -> None:
+        self.snapshot.env = None
+        self.snapshot.items = []
+
+
+class MappingSource(Source):
+    def __init__(self, values: Mapping[str, Any]):
+        self.values = values
+
+    def fetch(self, fields: Sequence[Field]) -> Mapping[str, Any]:
+        return {field.name: self.values[field.name] for field in fields if field.name in self.values}
+
+
+class CliSource(Source):
+    def __init__(self, args: Optional[Mapping[str, Any]] = None):
+        self.args = args
+
+    def fetch(self, fields: Sequence[Field]) -> Mapping[str, Any]:
+        args = self.args or {}
+        return {field.name: args[field.name] for field in fields if field.name in args}
+
+
+def build_pipeline(
+    sources: Optional[Sequence[Source]], env: Mapping[str, str], cli_args: Optional[Mapping[str, Any]] = None
+) -> List[Source]:
+    pipeline: List[Source] = [EnvSource()] if sources is None else list(sources)
+
+    if not any(isinstance(source, EnvSource) for source in pipeline):
+        pipeline.insert(0, EnvSource())
+    if cli_args is not None and not any(isinstance(source, CliSource) for source in pipeline):
+        pipeline.insert(0, CliSource())
+
+    return [__bind_source(source, env, cli_args) for source in pipeline]
+
+
+def fetch_from_sources(
+    sources: Sequence[Source], fields: Sequence[Field], resolved_args: Optional[Mapping[str, Any]] = None
+) -> Dict[str, Any]:
+    raw_args = dict(resolved_args or {})
+    pending_fields = [field for field in fields if field.name not in raw_args]
+
+    for source in sources:
+        if not pending_fields:
+            break
+
+        values = source.fetch(pending_fields)
+        raw_args.update((field.name, values[field.name]) for field in pending_fields if field.name in values)
+        pending_fields = [field for field in pending_fields if field.name not in raw_args]
+
+    return raw_args
+
+
+def __bind_source(source: Source, env: Mapping[str, str], cli_args: Optional[Mapping[str, Any]]) -> Source:
+    if isinstance(source, EnvSource) and source.env is None:
+        return source.bind(env)
+    elif isinstance(source, CliSource) and source.args is None:
+        return CliSource(cli_args)
+    return source
+
+
+def create_key_trie(fields: Sequence[Field]) -> KeyTrie:
+    key_trie: KeyTrie = {}
+    for field in fields:
+        if field.env_name:
+            group_type = field.group_type
+            key_trie[field.env_name] = (
+                field.name,
+                create_key_trie(group_type.get_schema().fields) if group_type is not None else None,
+            )
+    return key_trie
+
+
+def get_prefixed_items(env: Mapping[str, str], prefix: str, delimiter: str) -> PrefixedItems:
+    full_prefix = prefix + delimiter if prefix else ""
+    prefix_length = len(full_prefix)
+    return [(key[prefix_length:].split(delimiter), value) for key, value in env.items() if key.startswith(full_prefix)]
+
+
+def get_nested_values(key_trie: KeyTrie, items: PrefixedItems) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+    for segments, value in items:
+        __insert_value(key_trie, values, segments, value)
+    return values
+
+
+def __insert_value(key_trie: KeyTrie, values: Dict[str, Any], segments: List[str], value: str) -> bool:
+    *group_segments, last_segment = segments
+    group_names = []
+
+    for segment in group_segments:
+        name, group_trie = key_trie.get(segment, ("", None))
+        if group_trie is None:
+            return False
+        group_names.append(name)
+        key_trie = group_trie
+
+    if last_segment not in key_trie:
+        return False
+
+    for name in group_names:
+        if not isinstance(values.get(name, None), dict):
+            values[name] = {}
+        values = values[name]
+
+    name, group_trie = key_trie[last_segment]
+    if group_trie is None or not isinstance(values.get(name, None), dict):
+        values[name] = value
+    return True
@@ -0,0 +1,102 @@
+import sys
+from time import perf_counter
+from typing import Any, Dict, List, Mapping, Optional
+
+from rocket_args.exceptions import InvalidValueError
+from rocket_args.type_casting import Caster, cast_args
+
+STATS_ENV_NAME = "ROCKET_ARGS_STATS"
+DISABLED_VALUES = frozenset(["", "0", "false", "no", "off"])
+
+
+class ParseStats:
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+        self.allocations: Dict[str, int] = {}
+        self.cast_times: Dict[str, float] = {}
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    def measure(self, phase: str) -> "PhaseTimer":
+        return PhaseTimer(self, phase)
+
+    def record(self, phase: str, duration: float, allocations: int) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+        self.allocations[phase] = self.allocations.get(phase, 0) + allocations
+
+    def cast_args(
+        self,
+        args: Mapping[str, Any],
+        name_to_caster: Mapping[str, Optional[Caster]],
+        errors: Optional[List[InvalidValueError]] = None,
+    ) -> Dict[str, Any]:
+        parsed_args = {}
+
+        for name, value in args.items():
+            start = perf_counter()
+            parsed_args.update(cast_args({name: value}, name_to_caster, errors))
+            self.cast_times[name] = perf_counter() - start
+
+        return parsed_args
+
+    def format(self, title: str = "parse") -> str:
+        lines = [f"{title}: {self.total * 1000:.3f} ms"]
+        lines += [
+            f"  {phase:<10} {duration * 1000:9.3f} ms {self.allocations[phase]:8} allocations"
+            for phase, duration in self.phases.items()
+        ]
+        if self.cast_times:
+            lines.append("  cast per field:")
+            lines += [f"    {name:<20} {duration * 1000:9.3f} ms" for name, duration in self.cast_times.items()]
+        return "\n".join(lines)
+
+
+class PhaseTimer:
+    __slots__ = ("stats", "phase", "start", "allocated_blocks")
+
+    def __init__(self, stats: ParseStats, phase: str):
+        self.stats = stats
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.allocated_blocks = sys.getallocatedblocks()
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        duration = perf_counter() - self.start
+        self.stats.record(self.phase, duration, sys.getallocatedblocks() - self.allocated_blocks)
+
+
+class NullStats(ParseStats):
+    def measure(self, phase: str) -> "PhaseTimer":
+        return NULL_TIMER
+
+    def cast_args(
+        self,
+        args: Mapping[str, Any],
+        name_to_caster: Mapping[str, Optional[Caster]],
+        errors: Optional[List[InvalidValueError]] = None,
+    ) -> Dict[str, Any]:
+        return cast_args(args, name_to_caster, errors)
+
+
+class NullTimer(PhaseTimer):
+    def __init__(self) -> None:
+        pass
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+NULL_STATS = NullStats()
+NULL_TIMER = NullTimer()
+
+
+def stats_from_env(env: Mapping[str, str]) -> Optional[ParseStats]:
+    value = env.get(STATS_ENV_NAME, "")
+    return ParseStats() if value.lower() not in DISABLED_VALUES else None
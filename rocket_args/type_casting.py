@@ -1,39 +1,473 @@
 import sys
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, TypeVar
+import types
+from array import array
+from collections import abc
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+from rocket_args.exceptions import InvalidValueError
 from rocket_args.utils import Field
 
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:  # pragma: no cover
+    Literal = None
+
+Caster = Callable[[Any], Any]
+Items = TypeVar("Items", bound=MutableSequence[Any])
+
+MISSING = object()
+ORIGIN_ALIASES: Dict[Any, Any] = {
+    abc.Sequence: Sequence,
+    abc.Set: AbstractSet,
+    abc.Mapping: Mapping,
+}
+UNION_TYPES = (getattr(types, "UnionType"),) if sys.version_info >= (3, 10) else ()
+
+TRUE_VALUES = frozenset(["1", "true", "yes", "on"])
+FALSE_VALUES = frozenset(["0", "false", "no", "off"])
+IMMUTABLE_TYPES = frozenset([str, int, float, bool, complex, bytes])
+COMPACT_TYPECODES: Dict[Any, str] = {int: "q", float: "d"}
+FILE_PREFIX = "@"
+FILE_PREFIX_LENGTH = len(FILE_PREFIX)
+RANGE_SEPARATOR = "-"
+MAX_RANGE_SPAN = 100_000
+
 
 # noinspection PyShadowingBuiltins
-def cast_args_to_fields_types(args: Mapping[str, Optional[str]], fields_data: Sequence[Field]) -> Dict[str, Any]:
-    name_to_type = {field.name: field.type for field in fields_data}
-    name_to_value_to_type = [(name, value, name_to_type.get(name, None)) for name, value in args.items()]
-    name_to_value = {name: __cast_value_to_type(value, type) for name, value, type in name_to_value_to_type}
-    return name_to_value
+def cast_args_to_fields_types(args: Mapping[str, Any], fields_data: Sequence[Field]) -> Dict[str, Any]:
+    name_to_caster = {field.name: get_caster(field.type) for field in fields_data}
+    return cast_args(args, name_to_caster)
 
 
-T = TypeVar("T", bound=Any)
+def cast_args(
+    args: Mapping[str, Any],
+    name_to_caster: Mapping[str, Optional[Caster]],
+    errors: Optional[List[InvalidValueError]] = None,
+) -> Dict[str, Any]:
+    if errors is None:
+        return {name: cast_value(value, name_to_caster.get(name, None)) for name, value in args.items()}
 
+    parsed_args = {}
+    for name, value in args.items():
+        try:
+            parsed_args[name] = cast_value(value, name_to_caster.get(name, None))
+        except (TypeError, ValueError) as error:
+            errors.append(InvalidValueError(name, value, str(error)))
 
-def __cast_value_to_type(value: Optional[str], type_hint: T) -> Optional[T]:
-    if value is None or type_hint is None:
+    return parsed_args
+
+
+def cast_value(value: Any, caster: Optional[Caster]) -> Any:
+    if value is None or caster is None:
         return value
-    elif type(type_hint) in [type(List), type(Set)]:
-        raw_type = __type_hint_to_raw_type(type_hint)
-        subtype = type_hint.__args__[0]
-        parsed_value = [subtype(arg) for arg in value.split(",")]
-        return raw_type(parsed_value)
+    return caster(value)
+
+
+def cast_columns(
+    columns: Mapping[str, List[Optional[str]]],
+    name_to_caster: Mapping[str, Optional[Caster]],
+    errors: Optional[List[InvalidValueError]] = None,
+) -> Dict[str, List[Any]]:
+    return {
+        name: __cast_column(name, values, name_to_caster.get(name, None), errors) for name, values in columns.items()
+    }
+
+
+def get_caster(type_hint: Any) -> Optional[Caster]:
+    try:
+        hash(type_hint)
+    except TypeError:
+        return __compile_caster(type_hint)
+
+    return __get_cached_caster(type_hint)
+
+
+def get_compact_caster(type_hint: Any, read_files: bool = False) -> Caster:
+    origin = __get_origin(type_hint)
+    args = __get_args(type_hint)
+
+    if origin is Union and type(None) in args:
+        return get_compact_caster(Union[tuple(arg for arg in args if arg is not type(None))], read_files)  # noqa: E721
+    elif origin in (list, Sequence) or (origin is tuple and len(args) == 2 and args[1] is Ellipsis):
+        item_type = args[0] if args else None
     else:
-        return type_hint(value)
+        item_type = None
+
+    typecode = COMPACT_TYPECODES.get(item_type, None)
+    if typecode is None:
+        raise TypeError(f"Compact storage supports only lists of int or float, got: {type_hint}")
+
+    cast_item = __get_item_caster(item_type)
+    expand_ranges = item_type is int
+
+    def cast_compact(value: Any) -> "array[Any]":
+        try:
+            return __fill_items(array(typecode), value, cast_item, expand_ranges, stream=True, read_files=read_files)
+        except OverflowError as error:
+            raise ValueError(f"Value doesn't fit into compact storage: {error}") from error
+
+    return cast_compact
+
+
+def get_file_caster(type_hint: Any) -> Caster:
+    origin = __get_origin(type_hint)
+    args = __get_args(type_hint)
+
+    if origin is Union and type(None) in args:
+        return get_file_caster(Union[tuple(arg for arg in args if arg is not type(None))])  # noqa: E721
+    elif origin in (list, set, frozenset, Sequence, AbstractSet):
+        raw_type = set if origin is AbstractSet else list if origin is Sequence else origin
+        return __compile_collection_caster(raw_type, args[0] if args else str, read_files=True)
+    elif origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return __compile_collection_caster(tuple, args[0], read_files=True)
+
+    raise TypeError(f"Reading items from file supports only variable-length collections, got: {type_hint}")
+
+
+def get_group_caster(group_cls: Any) -> Caster:
+    def cast_group(value: Any) -> Any:
+        if isinstance(value, group_cls):
+            return value
+
+        raw_values = __decode_json(value)
+        if not isinstance(raw_values, Mapping):
+            raise ValueError(f"Expected mapping of {group_cls.__name__} values: {value}")
+
+        schema = group_cls.get_schema()
+        missing_names = [
+            field.name for field in schema.fields if field.name not in raw_values and field.name not in schema.defaults
+        ]
+        errors: List[InvalidValueError] = []
+        known_values = {name: value for name, value in raw_values.items() if name in schema.casters}
+        parsed_values = cast_args(known_values, schema.casters, errors)
+
+        if missing_names or errors:
+            problems = [f"missing {name}" for name in missing_names]
+            problems += [f"{error.field_name}: {error.value!r} ({error.reason})" for error in errors]
+            raise ValueError(f"Invalid {group_cls.__name__}: {'; '.join(problems)}")
+
+        return group_cls(**{**schema.defaults, **parsed_values})
 
+    return cast_group
 
-def __type_hint_to_raw_type(type_hint: Any) -> Any:
-    if sys.version_info.minor >= 7:
-        raw_type = type_hint.__origin__
+
+def is_collection_type(type_hint: Any) -> bool:
+    origin = __get_origin(type_hint)
+    args = __get_args(type_hint)
+
+    if origin is Union and type(None) in args:
+        return all(is_collection_type(arg) for arg in args if arg is not type(None))  # noqa: E721
+    return origin in (list, set, frozenset, Sequence, AbstractSet) or (
+        origin is tuple and len(args) == 2 and args[1] is Ellipsis
+    )
+
+
+def is_class_var(type_hint: Any) -> bool:
+    if sys.version_info < (3, 7):
+        return type(type_hint) is type(ClassVar)
+    return type_hint is ClassVar or __get_origin(type_hint) is ClassVar
+
+
+@lru_cache(maxsize=None)
+def __get_cached_caster(type_hint: Any) -> Optional[Caster]:
+    return __compile_caster(type_hint)
+
+
+def __compile_caster(type_hint: Any) -> Optional[Caster]:
+    if type_hint is None:
+        return None
+    elif type_hint in (Any, str):
+        return str
+    elif type_hint is bool:
+        return __parse_bool
+    elif isinstance(type_hint, type) and issubclass(type_hint, Enum):
+        return __compile_enum_caster(type_hint)
+
+    origin = __get_origin(type_hint)
+    args = __get_args(type_hint)
+
+    if origin is None:
+        return type_hint
+    elif origin is Union:
+        return __compile_union_caster(args)
+    elif origin is Literal:
+        return __compile_literal_caster(args)
+    elif origin in (list, set, frozenset, Sequence, AbstractSet):
+        raw_type = set if origin is AbstractSet else list if origin is Sequence else origin
+        return __compile_collection_caster(raw_type, args[0] if args else str)
+    elif origin is tuple:
+        return __compile_tuple_caster(args)
+    elif origin in (dict, Mapping):
+        key_type, value_type = args if args else (str, str)
+        return __compile_dict_caster(key_type, value_type)
+    elif isinstance(origin, type):
+        return origin
     else:
-        raw_type = list if issubclass(type_hint, list) else set if issubclass(type_hint, set) else None
+        raise TypeError(f"Unsupported type: {type_hint}")
+
+
+def __compile_enum_caster(enum_type: Type[Enum]) -> Caster:
+    name_to_member = dict(enum_type.__members__)
+    value_to_member = {str(member.value): member for member in enum_type}
+
+    def cast_enum(value: Any) -> Enum:
+        if isinstance(value, enum_type):
+            return value
+
+        member = name_to_member.get(value, None)
+        if member is None:
+            member = value_to_member.get(str(value), None)
+        if member is None:
+            raise ValueError(f"Invalid value for {enum_type.__name__}: {value}")
+        return member
+
+    return cast_enum
+
+
+def __compile_union_caster(args: Tuple[Any, ...]) -> Optional[Caster]:
+    casters = [get_caster(arg) for arg in args if arg is not type(None)]  # noqa: E721
+
+    if len(casters) == 1:
+        return casters[0]
+
+    def cast_union(value: Any) -> Any:
+        for caster in casters:
+            try:
+                return caster(value) if caster is not None else value
+            except (TypeError, ValueError):
+                pass
+
+        raise ValueError(f"Invalid value for any of types {args}: {value}")
+
+    return cast_union
+
+
+def __compile_literal_caster(args: Tuple[Any, ...]) -> Caster:
+    text_to_option = {str(option): option for option in args}
+
+    def cast_literal(value: Any) -> Any:
+        option = text_to_option.get(str(value), MISSING)
+        if option is MISSING:
+            raise ValueError(f"Invalid value, expected one of {list(text_to_option)}: {value}")
+        return option
+
+    return cast_literal
+
+
+def __compile_collection_caster(raw_type: Type[Any], item_type: Any, read_files: bool = False) -> Caster:
+    cast_item = __get_item_caster(item_type)
+    expand_ranges = item_type is int
 
-        if raw_type is None:
-            raise ValueError(f"Unsupported type: {type_hint}")
+    def cast_collection(value: Any) -> Any:
+        items: List[Any] = __fill_items([], value, cast_item, expand_ranges, stream=False, read_files=read_files)
+        return items if raw_type is list else raw_type(items)
 
-    return raw_type
+    return cast_collection
+
+
+def __compile_tuple_caster(args: Tuple[Any, ...]) -> Caster:
+    if not args or (len(args) == 2 and args[1] is Ellipsis):
+        return __compile_collection_caster(tuple, args[0] if args else str)
+
+    item_casters = [__get_item_caster(arg) for arg in args]
+
+    def cast_tuple(value: Any) -> tuple:
+        items = __split_items(value)
+        if len(items) != len(item_casters):
+            raise ValueError(f"Expected {len(item_casters)} items, got {len(items)}: {value}")
+        return tuple(cast_item(item) for cast_item, item in zip(item_casters, items))
+
+    return cast_tuple
+
+
+def __compile_dict_caster(key_type: Any, value_type: Any) -> Caster:
+    cast_key, cast_item = __get_item_caster(key_type), __get_item_caster(value_type)
+
+    def cast_dict(value: Any) -> dict:
+        if isinstance(value, str) and not value.startswith(("{", "[")):
+            pairs = [item.split("=", 1) for item in __split_items(value)]
+            if any(len(pair) != 2 for pair in pairs):
+                raise ValueError(f"Expected comma separated key=value pairs: {value}")
+        else:
+            decoded_value = __decode_json(value)
+            if not isinstance(decoded_value, Mapping):
+                raise ValueError(f"Expected mapping or comma separated key=value pairs: {value}")
+            pairs = list(decoded_value.items())
+
+        return {cast_key(key): cast_item(item) for key, item in pairs}
+
+    return cast_dict
+
+
+def __get_item_caster(item_type: Any) -> Caster:
+    caster = get_caster(item_type)
+    return caster if caster is not None else __identity
+
+
+def __fill_items(
+    target: Items, value: Any, cast_item: Caster, expand_ranges: bool, stream: bool, read_files: bool
+) -> Items:
+    if read_files and isinstance(value, str) and value.startswith(FILE_PREFIX):
+        path = value[FILE_PREFIX_LENGTH:]
+        try:
+            return __extend_items(target, __read_items(path), cast_item, expand_ranges)
+        except OSError as error:
+            raise ValueError(f"Can't read items from {path}: {error.strerror or error}") from error
+    elif stream and isinstance(value, str) and not value.startswith("["):
+        items: Iterable[Any] = __iter_split(value)
+    else:
+        items = __split_items(value)
+
+    return __extend_items(target, items, cast_item, expand_ranges)
+
+
+def __extend_items(target: Items, items: Iterable[Any], cast_item: Caster, expand_ranges: bool) -> Items:
+    if not expand_ranges:
+        target.extend(map(cast_item, items))
+        return target
+
+    append = target.append
+    for item in items:
+        try:
+            append(cast_item(item))
+        except ValueError:
+            target.extend(__parse_range(item))
+
+    return target
+
+
+def __read_items(path: str) -> Iterator[str]:
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            yield from line.replace(",", " ").split()
+
+
+def __iter_split(value: str) -> Iterator[str]:
+    start = 0
+    while value:
+        end = value.find(",", start)
+        if end == -1:
+            yield value[start:]
+            return
+        yield value[start:end]
+        start = end + 1
+
+
+def __parse_range(item: Any) -> range:
+    text = str(item).strip()
+    sign_length = 1 if text[:1] in ("-", "+") else 0
+    sign, unsigned_text = text[:sign_length], text[sign_length:]
+    start, separator, stop = unsigned_text.partition(RANGE_SEPARATOR)
+    if not separator or not start:
+        raise ValueError(f"Invalid integer or range: {item}")
+
+    try:
+        first, last = int(sign + start), int(stop)
+    except ValueError:
+        raise ValueError(f"Invalid integer or range: {item}") from None
+
+    if first > last:
+        raise ValueError(f"Range end has to be greater than or equal to its start: {item}")
+    elif last - first >= MAX_RANGE_SPAN:
+        raise ValueError(f"Range can't contain more than {MAX_RANGE_SPAN} values: {item}")
+    return range(first, last + 1)
+
+
+def __split_items(value: Any) -> List[Any]:
+    if isinstance(value, str):
+        if value.startswith("["):
+            return list(__decode_json(value))
+        return value.split(",") if value else []
+    return list(value)
+
+
+def __decode_json(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+
+    import json
+
+    return json.loads(value)
+
+
+def __identity(value: Any) -> Any:
+    return value
+
+
+def __get_origin(type_hint: Any) -> Any:
+    if isinstance(type_hint, UNION_TYPES):
+        return Union
+    elif sys.version_info >= (3, 7):
+        origin = getattr(type_hint, "__origin__", None)
+    else:
+        origin = getattr(type_hint, "__extra__", None) or getattr(type_hint, "__origin__", None)
+
+    return ORIGIN_ALIASES.get(origin, origin)
+
+
+def __get_args(type_hint: Any) -> Tuple[Any, ...]:
+    args = getattr(type_hint, "__args__", None) or ()
+    return tuple(arg for arg in args if not isinstance(arg, TypeVar))
+
+
+def __cast_column(
+    name: str, values: List[Optional[str]], caster: Optional[Caster], errors: Optional[List[InvalidValueError]]
+) -> List[Any]:
+    if caster is None:
+        return values
+
+    cast_values: List[Any] = []
+    memo: Dict[str, Any] = {}
+
+    for row, value in enumerate(values):
+        if value is None:
+            cast_values.append(None)
+        elif value in memo:
+            cast_values.append(memo[value])
+        else:
+            try:
+                cast_result = caster(value)
+            except (TypeError, ValueError) as error:
+                if errors is None:
+                    raise
+                errors.append(InvalidValueError(name, value, str(error), row))
+                cast_values.append(None)
+                continue
+            if type(cast_result) in IMMUTABLE_TYPES:
+                memo[value] = cast_result
+            cast_values.append(cast_result)
+
+    return cast_values
+
+
+def __parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+
+    normalized_value = str(value).lower()
+
+    if normalized_value in TRUE_VALUES:
+        return True
+    elif normalized_value in FALSE_VALUES:
+        return False
+    else:
+        raise ValueError(f"Invalid boolean value: {value}")
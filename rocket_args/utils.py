@@ -1,7 +1,7 @@
+import os
 import sys
 from enum import Enum
-from pathlib import Path
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Collection, Dict, Iterator, Mapping, Optional, Sequence, TextIO, Tuple, Union
 
 
 class Argument:
@@ -13,11 +13,48 @@ class Argument:
         env_name: Union[bool, str] = True,
         default: Any = ...,
         help: Optional[str] = None,
+        min_value: Any = None,
+        max_value: Any = None,
+        choices: Optional[Collection[Any]] = None,
+        pattern: Optional[str] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+        compact: bool = False,
+        from_file: bool = False,
+        flag: bool = False,
     ):
         self.cli_names = cli_names
         self.env_name = env_name
         self.default = default
         self.help = help
+        self.min_value = min_value
+        self.max_value = max_value
+        self.choices = choices
+        self.pattern = pattern
+        self.min_length = min_length
+        self.max_length = max_length
+        self.compact = compact
+        self.from_file = from_file
+        self.flag = flag
+
+
+class Subcommands(Argument):
+    # noinspection PyShadowingBuiltins
+    def __init__(self, commands: Mapping[str, Union[str, type]], *, default: Any = ..., help: Optional[str] = None):
+        super().__init__(cli_names=list(commands.keys()), env_name=False, default=default, help=help)
+        self.commands: Dict[str, Union[str, type]] = dict(commands)
+
+    def resolve(self, name: str) -> type:
+        command = self.commands[name]
+
+        if isinstance(command, str):
+            from importlib import import_module
+
+            module_name, _, class_name = command.rpartition(":" if ":" in command else ".")
+            command = getattr(import_module(module_name), class_name)
+            self.commands[name] = command
+
+        return command
 
 
 class Field:
@@ -26,19 +63,46 @@ class Field:
         self.name = name
         self.type = type
         self.value = value
+        self.__cli_names = self.__resolve_cli_names()
+        self.__env_name = self.__resolve_env_name()
+
+    @property
+    def cli_names(self) -> Optional[Tuple[str, ...]]:
+        return self.__cli_names
+
+    @property
+    def env_name(self) -> Optional[str]:
+        return self.__env_name
+
+    @property
+    def is_flag(self) -> bool:
+        return self.value.flag and self.type is bool
 
     @property
-    def cli_names(self) -> Optional[List[str]]:
+    def is_subcommand(self) -> bool:
+        return isinstance(self.value, Subcommands)
+
+    @property
+    def group_type(self) -> Optional[Any]:
+        type_hint = self.type
+        args: Tuple[Any, ...] = getattr(type_hint, "__args__", None) or ()
+        is_union = getattr(type_hint, "__origin__", None) is Union or type(type_hint).__name__ == "UnionType"
+        if is_union and len(args) == 2 and type(None) in args:
+            type_hint = args[0] if args[1] is type(None) else args[1]  # noqa: E721
+
+        is_group_type = isinstance(type_hint, type) and hasattr(type_hint, "get_schema")
+        return type_hint if is_group_type and not self.is_subcommand else None
+
+    def __resolve_cli_names(self) -> Optional[Tuple[str, ...]]:
         if isinstance(self.value.cli_names, Sequence):
-            return list(self.value.cli_names)
+            return tuple(self.value.cli_names)
         elif self.value.cli_names is True:
             formatted_name = self.name.replace("_", "-")
-            return [f"--{formatted_name}"]
+            return (f"--{formatted_name}",)
         else:
             return None
 
-    @property
-    def env_name(self) -> Optional[str]:
+    def __resolve_env_name(self) -> Optional[str]:
         if isinstance(self.value.env_name, str):
             return self.value.env_name
         elif self.value.env_name is True:
@@ -54,30 +118,48 @@ class Color(Enum):
 
 
 class MessageBuilder:
+    padding = " " * 2
+    column_gap = " " * 2
+    header = ("CLI NAMES", "ENV NAME", "HELP")
+
     def __init__(self, fields_data: Sequence[Field]):
         self.__fields_data = fields_data
+        self.__arguments_help: Optional[str] = None
 
-    def create_help_message(self) -> str:
-        program_name = Path(sys.argv[0]).name
-        arguments_help = self.__create_arguments_help()
+    def create_help_message(self, program_name: Optional[str] = None) -> str:
+        program_name = os.path.basename(sys.argv[0]) if program_name is None else program_name
+        arguments_help = self.__get_arguments_help()
         return f"{program_name} usage:\n{arguments_help}"
 
     def create_missing_arguments_message(self) -> str:
-        arguments_help = self.__create_arguments_help()
+        arguments_help = self.__get_arguments_help()
         return f"Missing arguments:\n{arguments_help}"
 
-    def __create_arguments_help(self) -> str:
-        padding = " " * 2
-        help_message = f"{padding}{Color.cli.value}CLI NAMES\t{Color.env.value}ENV NAME{Color.neutral.value}\tHELP\n"
-
-        for field in self.__fields_data:
-            cli_names = " ".join(field.cli_names) if field.cli_names else ""
-            env_name = field.env_name if field.env_name else ""
-            arg_help = field.value.help if field.value.help else ""
-            help_message += (
-                f"{padding}{Color.cli.value}{cli_names}\t"
-                f"{Color.env.value}{env_name}\t"
+    def write_help_message(self, stream: TextIO, program_name: Optional[str] = None) -> None:
+        program_name = os.path.basename(sys.argv[0]) if program_name is None else program_name
+        stream.write(f"{program_name} usage:\n")
+
+        if self.__arguments_help is not None:
+            stream.write(self.__arguments_help)
+        else:
+            stream.writelines(self.__iter_arguments_help())
+
+    def __get_arguments_help(self) -> str:
+        if self.__arguments_help is None:
+            self.__arguments_help = "".join(self.__iter_arguments_help())
+        return self.__arguments_help
+
+    def __iter_arguments_help(self) -> Iterator[str]:
+        rows = [
+            (" ".join(field.cli_names or ()), field.env_name or "", field.value.help or "")
+            for field in self.__fields_data
+        ]
+        cli_width = max([len(self.header[0])] + [len(cli_names) for cli_names, _, _ in rows])
+        env_width = max([len(self.header[1])] + [len(env_name) for _, env_name, _ in rows])
+
+        for cli_names, env_name, arg_help in [self.header, *rows]:
+            yield (
+                f"{self.padding}{Color.cli.value}{cli_names:<{cli_width}}{self.column_gap}"
+                f"{Color.env.value}{env_name:<{env_width}}{self.column_gap}"
                 f"{Color.neutral.value}{arg_help}\n"
             )
-
-        return help_message
@@ -0,0 +1,115 @@
+import re
+from typing import Any, Callable, Collection, List, Optional
+
+from rocket_args.type_casting import Caster, is_collection_type
+from rocket_args.utils import Argument
+
+Validator = Callable[[Any], None]
+
+
+def compile_validator(argument: Argument, type_hint: Any = None) -> Optional[Validator]:
+    checks = __compile_checks(argument, type_hint)
+
+    if not checks:
+        return None
+    elif len(checks) == 1:
+        return checks[0]
+
+    def validate(value: Any) -> None:
+        for check in checks:
+            check(value)
+
+    return validate
+
+
+def add_validator(caster: Optional[Caster], validator: Optional[Validator]) -> Optional[Caster]:
+    if validator is None:
+        return caster
+
+    def cast_and_validate(value: Any) -> Any:
+        cast_value = caster(value) if caster is not None else value
+        validator(cast_value)
+        return cast_value
+
+    return cast_and_validate
+
+
+def __compile_checks(argument: Argument, type_hint: Any) -> List[Validator]:
+    checks: List[Validator] = []
+
+    if argument.min_value is not None:
+        checks.append(__compile_min_value_check(argument.min_value))
+    if argument.max_value is not None:
+        checks.append(__compile_max_value_check(argument.max_value))
+    if argument.min_length is not None:
+        checks.append(__compile_min_length_check(argument.min_length))
+    if argument.max_length is not None:
+        checks.append(__compile_max_length_check(argument.max_length))
+    if argument.choices is not None:
+        checks.append(__compile_choices_check(argument.choices, check_items=is_collection_type(type_hint)))
+    if argument.pattern is not None:
+        checks.append(__compile_pattern_check(argument.pattern))
+
+    return checks
+
+
+def __compile_min_value_check(min_value: Any) -> Validator:
+    def check_min_value(value: Any) -> None:
+        if value < min_value:
+            raise ValueError(f"must be greater than or equal to {min_value}")
+
+    return check_min_value
+
+
+def __compile_max_value_check(max_value: Any) -> Validator:
+    def check_max_value(value: Any) -> None:
+        if value > max_value:
+            raise ValueError(f"must be less than or equal to {max_value}")
+
+    return check_max_value
+
+
+def __compile_min_length_check(min_length: int) -> Validator:
+    def check_min_length(value: Any) -> None:
+        if len(value) < min_length:
+            raise ValueError(f"length must be at least {min_length}")
+
+    return check_min_length
+
+
+def __compile_max_length_check(max_length: int) -> Validator:
+    def check_max_length(value: Any) -> None:
+        if len(value) > max_length:
+            raise ValueError(f"length must be at most {max_length}")
+
+    return check_max_length
+
+
+def __compile_choices_check(choices: Any, check_items: bool) -> Validator:
+    allowed_values: Collection[Any]
+    try:
+        allowed_values = frozenset(choices)
+    except TypeError:
+        allowed_values = tuple(choices)
+    choices_str = ", ".join(repr(choice) for choice in choices)
+
+    def check_choices(value: Any) -> None:
+        if value not in allowed_values:
+            raise ValueError(f"must be one of: {choices_str}")
+
+    def check_items_choices(value: Any) -> None:
+        for item in value:
+            if item not in allowed_values:
+                raise ValueError(f"items must be one of: {choices_str}, got: {item!r}")
+
+    return check_items_choices if check_items else check_choices
+
+
+def __compile_pattern_check(pattern: str) -> Validator:
+    compiled_pattern = re.compile(pattern)
+
+    def check_pattern(value: Any) -> None:
+        if compiled_pattern.fullmatch(str(value)) is None:
+            raise ValueError(f"must match pattern {pattern!r}")
+
+    return check_pattern
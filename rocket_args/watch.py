@@ -0,0 +1,164 @@
+import os
+import threading
+import traceback
+from typing import Any, Callable, Dict, Generic, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from rocket_args.arg_parsing import parse_cmd_line_args
+from rocket_args.exceptions import HelpRequested, InvalidValueError, create_validation_error
+from rocket_args.rocket_base import RocketBase
+from rocket_args.sources import Source, build_pipeline, fetch_from_sources
+from rocket_args.type_casting import cast_args
+
+T = TypeVar("T", bound=RocketBase)
+
+Change = Tuple[Any, Any]
+ChangeCallback = Callable[[T, T, Dict[str, Change]], None]
+ErrorCallback = Callable[[Exception], None]
+FileState = Optional[Tuple[int, int, int]]
+
+MISSING = object()
+
+
+class Watcher(Generic[T]):
+    def __init__(
+        self,
+        cls: Type[T],
+        argv: Sequence[str],
+        env: Mapping[str, str],
+        *,
+        sources: Optional[Sequence[Source]] = None,
+        paths: Sequence[Union[str, "os.PathLike[str]"]] = (),
+        interval: float = 1.0,
+    ):
+        self.cls = cls
+        self.interval = interval
+        self.__schema = cls.get_schema()
+        if self.__schema.subcommand_field is not None:
+            raise TypeError(f"{cls.__name__} has subcommands, it can't be watched")
+
+        cli_args = parse_cmd_line_args(argv, self.__schema.cli_name_to_field)
+        if "help" in cli_args:
+            raise HelpRequested(self.__schema.message_builder.create_help_message(cls.__name__))
+
+        self.__pipeline = build_pipeline(sources, env, cli_args)
+        self.__raw_args = fetch_from_sources(self.__pipeline, self.__schema.fields)
+        self.__current: T = self.__create_instance(self.__raw_args)
+
+        watched_paths = [*paths, *(source.path for source in sources or () if hasattr(source, "path"))]
+        self.__file_states = {os.fspath(path): get_file_state(path) for path in watched_paths}
+
+        self.__callbacks: List[ChangeCallback] = []
+        self.__error_callbacks: List[ErrorCallback] = []
+        self.__lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def current(self) -> T:
+        return self.__current
+
+    def on_change(self, callback: ChangeCallback) -> ChangeCallback:
+        self.__callbacks.append(callback)
+        return callback
+
+    def on_error(self, callback: ErrorCallback) -> ErrorCallback:
+        self.__error_callbacks.append(callback)
+        return callback
+
+    def poll(self) -> Dict[str, Change]:
+        with self.__lock:
+            file_states = {path: get_file_state(path) for path in self.__file_states}
+            if file_states == self.__file_states:
+                return {}
+
+            self.__file_states = file_states
+            raw_args = fetch_from_sources(self.__pipeline, self.__schema.fields)
+            changed_names = [
+                field.name
+                for field in self.__schema.fields
+                if raw_args.get(field.name, MISSING) != self.__raw_args.get(field.name, MISSING)
+            ]
+            previous = self.__current
+            changes = self.__apply_changes(changed_names, raw_args)
+            self.__raw_args = raw_args
+
+        if changes:
+            for callback in self.__callbacks:
+                callback(previous, self.__current, changes)
+
+        return changes
+
+    def start(self) -> "Watcher[T]":
+        if self.__thread is None:
+            self.__stop_event.clear()
+            self.__thread = threading.Thread(target=self.__run, name=f"{self.cls.__name__}Watcher", daemon=True)
+            self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __enter__(self) -> "Watcher[T]":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def __create_instance(self, raw_args: Mapping[str, Any]) -> T:
+        schema = self.__schema
+        absent_fields = [
+            field for field in schema.fields if field.name not in raw_args and field.name not in schema.defaults
+        ]
+        invalid_values: List[InvalidValueError] = []
+        values = {**schema.defaults, **cast_args(raw_args, schema.casters, invalid_values)}
+
+        if absent_fields or invalid_values:
+            raise create_validation_error(absent_fields, invalid_values)
+        return self.cls(**values)
+
+    def __apply_changes(self, changed_names: Sequence[str], raw_args: Mapping[str, Any]) -> Dict[str, Change]:
+        if not changed_names:
+            return {}
+
+        schema = self.__schema
+        values = {field.name: getattr(self.__current, field.name) for field in schema.fields}
+        changed_raw_args = {name: raw_args[name] for name in changed_names if name in raw_args}
+        missing_fields = []
+        invalid_values: List[InvalidValueError] = []
+        values.update(cast_args(changed_raw_args, schema.casters, invalid_values))
+
+        for name in changed_names:
+            if name in raw_args:
+                continue
+            elif name in schema.defaults:
+                values[name] = schema.defaults[name]
+            else:
+                missing_fields.append(next(field for field in schema.fields if field.name == name))
+
+        if missing_fields or invalid_values:
+            raise create_validation_error(missing_fields, invalid_values)
+
+        previous = self.__current
+        self.__current = self.cls(**values)
+        return {name: (getattr(previous, name), values[name]) for name in changed_names}
+
+    def __run(self) -> None:
+        while not self.__stop_event.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as error:
+                if not self.__error_callbacks:
+                    traceback.print_exc()
+                for callback in self.__error_callbacks:
+                    callback(error)
+
+
+def get_file_state(path: Union[str, "os.PathLike[str]"]) -> FileState:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
@@ -0,0 +1,16 @@
+from rocket_args import Argument, RocketBase, Subcommands
+
+
+class MigrateArgs(RocketBase):
+    dry_run: bool = Argument(flag=True, default=False)
+    direction: RocketBase = Subcommands(
+        {"up": "tests.commands.migrate.UpArgs", "down": "tests.commands.migrate:DownArgs"}, default=None
+    )
+
+
+class UpArgs(RocketBase):
+    steps: int = 1
+
+
+class DownArgs(RocketBase):
+    steps: int
@@ -0,0 +1,6 @@
+from rocket_args import Argument, RocketBase
+
+
+class ServeArgs(RocketBase):
+    port: int
+    debug: bool = Argument(flag=True, default=False)
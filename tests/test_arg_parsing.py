@@ -1,10 +1,26 @@
-from typing import Any
+import sys
+from array import array
+from enum import Enum, IntEnum
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
 import pytest
 
 from rocket_args import Argument
-from rocket_args.arg_parsing import get_cmd_line_args, get_env_args
-from rocket_args.type_casting import cast_args_to_fields_types
+from rocket_args.arg_parsing import (
+    build_cli_index,
+    get_cmd_line_args,
+    get_env_args,
+    tokenize_cmd_line_args,
+    tokenize_known_cmd_line_args,
+)
+from rocket_args.type_casting import (
+    cast_args_to_fields_types,
+    cast_columns,
+    get_caster,
+    get_compact_caster,
+    get_file_caster,
+)
 from rocket_args.utils import Field
 from tests.utils import FieldFactory, patch_cli_args, patch_env_args
 
@@ -45,6 +61,70 @@ class TestGetCmdLineArgs:
             assert arg in str(exception.value)
 
 
+class TestTokenizeCmdLineArgs:
+    @staticmethod
+    @pytest.fixture
+    def cli_name_to_field() -> Any:
+        fields_data = [
+            Field(name="name", type=str, value=Argument(cli_names=["-n", "--name"])),
+            Field(name="verbose", type=bool, value=Argument(cli_names=["-v", "--verbose"], flag=True)),
+            Field(name="quiet", type=bool, value=Argument(cli_names=["-q"], flag=True)),
+        ]
+        return build_cli_index(fields_data)
+
+    @staticmethod
+    def test_value_can_be_attached_with_equals_sign(cli_name_to_field: Any) -> None:
+        known_args, unknown_args = tokenize_cmd_line_args(["--name=a=b", "--verbose=false"], cli_name_to_field)
+
+        assert known_args == {"name": "a=b", "verbose": "false"}
+        assert unknown_args == []
+
+    @staticmethod
+    def test_flags_dont_consume_next_token(cli_name_to_field: Any) -> None:
+        known_args, unknown_args = tokenize_cmd_line_args(["--verbose", "-n", "abcd"], cli_name_to_field)
+
+        assert known_args == {"verbose": "true", "name": "abcd"}
+        assert unknown_args == []
+
+    @staticmethod
+    def test_short_flags_can_be_grouped(cli_name_to_field: Any) -> None:
+        known_args, unknown_args = tokenize_cmd_line_args(["-vqnabcd"], cli_name_to_field)
+
+        assert known_args == {"verbose": "true", "quiet": "true", "name": "abcd"}
+        assert unknown_args == []
+
+    @staticmethod
+    def test_value_option_ending_group_consumes_next_token(cli_name_to_field: Any) -> None:
+        known_args, unknown_args = tokenize_cmd_line_args(["-vn", "abcd", "-q"], cli_name_to_field)
+
+        assert known_args == {"verbose": "true", "name": "abcd", "quiet": "true"}
+        assert unknown_args == []
+
+    @staticmethod
+    def test_group_with_unknown_flag_is_rejected_as_whole(cli_name_to_field: Any) -> None:
+        known_args, unknown_args = tokenize_cmd_line_args(["-vx"], cli_name_to_field)
+
+        assert known_args == {}
+        assert unknown_args == ["-vx"]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "cli_args, known_args, remainder_start",
+        [
+            (["-v", "--name", "a", "tool", "-v"], {"verbose": "true", "name": "a"}, 3),
+            (["-v", "--", "--name", "a"], {"verbose": "true"}, 2),
+            (["--name", "--", "-q"], {"name": "--", "quiet": "true"}, 3),
+            (["-vx", "-q"], {}, 0),
+            (["-vq", "--name=a"], {"verbose": "true", "quiet": "true", "name": "a"}, 2),
+            (["-vn", "a", "tool"], {"verbose": "true", "name": "a"}, 2),
+        ],
+    )
+    def test_known_args_stop_at_first_unknown_token(
+        cli_name_to_field: Any, cli_args: List[str], known_args: Dict[str, str], remainder_start: int
+    ) -> None:
+        assert tokenize_known_cmd_line_args(cli_args, cli_name_to_field) == (known_args, remainder_start)
+
+
 class TestGetEnvArgs:
     @staticmethod
     def test_provided_arguments_are_correctly_parsed() -> None:
@@ -80,6 +160,17 @@ class TestCastArgsToFieldTypes:
         expected = {field.name: parsed_arg}
         assert actual == expected
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "raw_arg, parsed_arg", [("true", True), ("Yes", True), ("1", True), ("false", False), ("off", False)]
+    )
+    def test_bool_is_parsed_from_text(raw_arg: str, parsed_arg: bool) -> None:
+        field = FieldFactory(type=bool)
+
+        actual = cast_args_to_fields_types({field.name: raw_arg}, [field])
+
+        assert actual == {field.name: parsed_arg}
+
     @staticmethod
     def test_argument_not_existing_in_fields_is_let_through() -> None:
         fields = []
@@ -88,3 +179,176 @@ class TestCastArgsToFieldTypes:
         actual = cast_args_to_fields_types(expected, fields)
 
         assert actual == expected
+
+
+class TestCastColumns:
+    @staticmethod
+    def test_every_value_in_column_is_casted(type_hint: Any, raw_arg: str, parsed_arg: Any) -> None:
+        columns = {"name": [raw_arg, None, raw_arg]}
+
+        actual = cast_columns(columns, {"name": get_caster(type_hint)})
+
+        assert actual == {"name": [parsed_arg, None, parsed_arg]}
+
+    @staticmethod
+    def test_column_without_caster_is_let_through() -> None:
+        columns = {"name": ["abcd", None]}
+
+        actual = cast_columns(columns, {})
+
+        assert actual == columns
+
+
+class Color(Enum):
+    red = "r"
+    green = "g"
+
+
+class Level(IntEnum):
+    zero = 0
+    one = 1
+
+
+class TestGetCaster:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "type_hint, raw_arg, parsed_arg",
+        [
+            (Optional[int], "12", 12),
+            (Union[int, str], "12", 12),
+            (Union[int, str], "abcd", "abcd"),
+            (Tuple[int, str], "12,abcd", (12, "abcd")),
+            (Tuple[int, ...], "12,34,56", (12, 34, 56)),
+            (FrozenSet[int], "12,34", frozenset([12, 34])),
+            (Sequence[float], "1.5,2", [1.5, 2.0]),
+            (Dict[str, int], "a=1,b=2", {"a": 1, "b": 2}),
+            (Dict[str, List[int]], '{"a": [1, 2]}', {"a": [1, 2]}),
+            (List[List[int]], "[[1, 2], [3]]", [[1, 2], [3]]),
+            (List[Optional[Color]], "red,g", [Color.red, Color.green]),
+            (Color, "green", Color.green),
+            (Color, "r", Color.red),
+            (Level, "zero", Level.zero),
+            (Level, "0", Level.zero),
+            (Path, "/tmp/file", Path("/tmp/file")),
+            (List[int], "", []),
+            (List[int], "1-3,7,10-10", [1, 2, 3, 7, 10]),
+            (Tuple[int, ...], "-2,5-6", (-2, 5, 6)),
+            (List[int], "-3-1,-5--4", [-3, -2, -1, 0, 1, -5, -4]),
+            (Set[int], "1-3,2", {1, 2, 3}),
+        ],
+    )
+    def test_value_is_correctly_casted(type_hint: Any, raw_arg: str, parsed_arg: Any) -> None:
+        caster = get_caster(type_hint)
+
+        assert caster(raw_arg) == parsed_arg
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "type_hint, raw_arg",
+        [
+            (Color, "blue"),
+            (Tuple[int, int], "1,2,3"),
+            (Dict[str, int], "a"),
+            (Dict[str, int], ["a=1"]),
+            (Dict[str, int], "[1]"),
+            (bool, "maybe"),
+            (Union[int, float], "a"),
+            (List[int], "5-1"),
+            (List[int], "1-a"),
+            (List[int], "-"),
+            (List[int], "--3"),
+            (List[int], "0-100000"),
+            (List[float], "1-3"),
+        ],
+    )
+    def test_invalid_value_raises_value_error(type_hint: Any, raw_arg: Any) -> None:
+        caster = get_caster(type_hint)
+
+        with pytest.raises(ValueError):
+            caster(raw_arg)
+
+    @staticmethod
+    def test_caster_is_compiled_once_per_type() -> None:
+        assert get_caster(List[int]) is get_caster(List[int])
+
+    @staticmethod
+    @pytest.mark.skipif(sys.version_info < (3, 8), reason="Literal requires Python 3.8")
+    def test_literal_accepts_only_listed_values() -> None:
+        from typing import Literal
+
+        caster = get_caster(Literal["a", 1])
+
+        assert caster("a") == "a"
+        assert caster("1") == 1
+        with pytest.raises(ValueError):
+            caster("b")
+
+    @staticmethod
+    def test_at_sign_is_plain_text_by_default() -> None:
+        assert get_caster(List[str])("@admin,@ops") == ["@admin", "@ops"]
+
+
+class TestGetFileCaster:
+    @staticmethod
+    def test_collection_items_are_read_from_file(tmp_path: Path) -> None:
+        path = tmp_path / "ids.txt"
+        path.write_text("1, 2\n3 4\n\n10-12\n")
+
+        assert get_file_caster(List[int])(f"@{path}") == [1, 2, 3, 4, 10, 11, 12]
+        assert get_file_caster(Optional[Set[str]])(f"@{path}") == {"1", "2", "3", "4", "10-12"}
+
+    @staticmethod
+    def test_values_without_at_sign_are_cast_as_usual() -> None:
+        assert get_file_caster(Tuple[int, ...])("1,2") == (1, 2)
+        assert get_file_caster(List[str])('["@user"]') == ["@user"]
+
+    @staticmethod
+    def test_unreadable_file_raises_value_error(tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Can't read items"):
+            get_file_caster(List[int])(f"@{tmp_path / 'missing.txt'}")
+
+    @staticmethod
+    @pytest.mark.parametrize("type_hint", [int, Tuple[int, int], Dict[str, int]])
+    def test_unsupported_type_raises_type_error(type_hint: Any) -> None:
+        with pytest.raises(TypeError):
+            get_file_caster(type_hint)
+
+
+class TestGetCompactCaster:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "type_hint, raw_arg, parsed_arg",
+        [
+            (List[int], "1,2,3", array("q", [1, 2, 3])),
+            (Sequence[int], "1-3,7", array("q", [1, 2, 3, 7])),
+            (Optional[Tuple[float, ...]], "1.5,2", array("d", [1.5, 2.0])),
+            (List[int], "[4, 5]", array("q", [4, 5])),
+            (List[int], [6, 7], array("q", [6, 7])),
+            (List[int], "", array("q")),
+        ],
+    )
+    def test_value_is_stored_in_array(type_hint: Any, raw_arg: Any, parsed_arg: array) -> None:
+        caster = get_compact_caster(type_hint)
+
+        assert caster(raw_arg) == parsed_arg
+
+    @staticmethod
+    def test_items_are_streamed_from_file(tmp_path: Path) -> None:
+        path = tmp_path / "ids.txt"
+        path.write_text("\n".join(map(str, range(1000))))
+
+        assert get_compact_caster(List[int], read_files=True)(f"@{path}") == array("q", range(1000))
+
+    @staticmethod
+    @pytest.mark.parametrize("raw_arg", ["1,,2", "a", str(2**64)])
+    def test_invalid_value_raises_value_error(raw_arg: str) -> None:
+        caster = get_compact_caster(List[int])
+
+        with pytest.raises(ValueError):
+            caster(raw_arg)
+
+    @staticmethod
+    @pytest.mark.parametrize("type_hint", [List[str], Set[int], Tuple[int, int], int])
+    def test_unsupported_type_raises_type_error(type_hint: Any) -> None:
+        with pytest.raises(TypeError):
+            get_compact_caster(type_hint)
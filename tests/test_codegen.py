@@ -0,0 +1,103 @@
+import inspect
+from typing import Dict, List, Sequence
+
+import pytest
+
+from rocket_args import (
+    Argument,
+    HelpRequested,
+    MissingArgumentsError,
+    RocketBase,
+    Subcommands,
+    UnknownArgumentsError,
+    slotted,
+)
+
+
+def create_args_class() -> type:
+    class Args(RocketBase):
+        arg_1: int
+        arg_2: str = "default_value"
+        arg_3: List[int] = Argument(cli_names=["-a"], env_name="CUSTOM_ENV", default=[])
+        arg_4: bool = Argument(env_name=False, flag=True, default=False)
+        arg_5: str = Argument(cli_names=False, default="env only")
+
+    return Args
+
+
+@pytest.fixture
+def compiled_args() -> type:
+    args_class = create_args_class()
+    args_class.compile_parser()  # type: ignore
+    return args_class
+
+
+class TestCompileParser:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "argv, env",
+        [
+            (["--arg-1", "12"], {}),
+            (["--arg-1", "12", "--arg-2", "cli"], {"ARG_2": "env"}),
+            ([], {"ARG_1": "12", "CUSTOM_ENV": "1,2", "ARG_5": "value"}),
+            (["-a", "3,4", "--arg-4", "--arg-1=5"], {"ARG_4": "true"}),
+        ],
+    )
+    def test_returns_same_values_as_interpreted_parser(
+        compiled_args: type, argv: Sequence[str], env: Dict[str, str]
+    ) -> None:
+        expected_args = create_args_class().parse(argv, env)  # type: ignore
+        parser = compiled_args.compile_parser()  # type: ignore
+
+        assert parser(argv, env).__dict__ == expected_args.__dict__
+
+    @staticmethod
+    def test_is_used_by_parse(compiled_args: type) -> None:
+        parser = compiled_args.compile_parser()  # type: ignore
+
+        args = compiled_args.parse(["--arg-1", "12"], {})  # type: ignore
+
+        assert compiled_args.compile_parser() is parser  # type: ignore
+        assert isinstance(args, compiled_args)
+        assert args.arg_1 == 12
+
+    @staticmethod
+    def test_source_is_exposed(compiled_args: type) -> None:
+        parser = compiled_args.compile_parser()  # type: ignore
+
+        assert "env.get('CUSTOM_ENV', MISSING)" in parser.__source__
+        assert inspect.getsource(parser) == parser.__source__
+
+    @staticmethod
+    def test_errors_are_the_same_as_in_interpreted_parser(compiled_args: type) -> None:
+        parser = compiled_args.compile_parser()  # type: ignore
+
+        with pytest.raises(MissingArgumentsError) as missing_exception:
+            parser([], {})
+        with pytest.raises(UnknownArgumentsError):
+            parser(["--arg-1", "1", "--unknown"], {})
+        with pytest.raises(HelpRequested) as help_exception:
+            parser(["--help"], {}, "my_program")
+
+        assert [field.name for field in missing_exception.value.fields] == ["arg_1"]
+        assert "my_program" in help_exception.value.message
+
+    @staticmethod
+    def test_works_with_frozen_classes() -> None:
+        @slotted(frozen=True)
+        class FrozenArgs(RocketBase):
+            arg_1: int
+            arg_2: str = "default_value"
+
+        FrozenArgs.compile_parser()  # type: ignore
+        args = FrozenArgs.parse(["--arg-1", "1"], {})
+
+        assert (args.arg_1, args.arg_2) == (1, "default_value")
+
+    @staticmethod
+    def test_subcommands_cant_be_compiled() -> None:
+        class Tool(RocketBase):
+            command: RocketBase = Subcommands({"serve": "tests.commands.serve.ServeArgs"})
+
+        with pytest.raises(TypeError):
+            Tool.compile_parser()
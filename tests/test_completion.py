@@ -0,0 +1,194 @@
+import shutil
+import subprocess
+import sys
+from enum import Enum
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from rocket_args import Argument, RocketBase, Subcommands, completer
+from rocket_args.completer import complete, load_cache
+from rocket_args.completion import create_spec
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class Level(Enum):
+    low = 1
+    high = 2
+
+
+class Tool(RocketBase):
+    verbose: bool = Argument(cli_names=["-v", "--verbose"], flag=True, default=False)
+    level: Optional[Level] = None
+    mode: str = Argument(choices=["fast", "safe"], default="safe", help="processing mode")
+    hidden: int = Argument(cli_names=False, default=0)
+    command: RocketBase = Subcommands(
+        {"serve": "tests.commands.serve.ServeArgs", "migrate": "tests.commands.migrate.MigrateArgs"}
+    )
+
+
+def run_bash_completion(script: str, words: List[str]) -> List[str]:
+    quoted_words = " ".join(f"'{word}'" for word in words)
+    code = (
+        f"{script}\n"
+        f"COMP_WORDS=({quoted_words}); COMP_CWORD={len(words) - 1}; COMPREPLY=()\n"
+        '_tool_complete; printf "%s\\n" "${COMPREPLY[@]}"\n'
+    )
+    result = subprocess.run(
+        ["bash", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+    )
+    return [line for line in result.stdout.splitlines() if line]
+
+
+COMPLETION_CASES = [
+    ([""], ["-h", "--help", "-v", "--verbose", "--level", "--mode", "serve", "migrate"]),
+    (["--l"], ["--level"]),
+    (["--level", ""], ["low", "high"]),
+    (["--mode", "f"], ["fast"]),
+    (["-v", "migrate", ""], ["-h", "--help", "--dry-run", "up", "down"]),
+    (["migrate", "--dry-run", "up", "--s"], ["--steps"]),
+    (["serve", "--port", ""], []),
+]
+
+
+class TestCreateSpec:
+    @staticmethod
+    def test_options_and_commands_are_described() -> None:
+        spec = create_spec(Tool, "tool")
+
+        assert [option["names"] for option in spec["options"]] == [
+            ["-h", "--help"],
+            ["-v", "--verbose"],
+            ["--level"],
+            ["--mode"],
+        ]
+        assert spec["options"][3] == {
+            "names": ["--mode"],
+            "flag": False,
+            "choices": ["fast", "safe"],
+            "help": "processing mode",
+        }
+        assert list(spec["commands"]) == ["serve", "migrate"]
+        assert list(spec["commands"]["migrate"]["commands"]) == ["up", "down"]
+        assert spec["commands"]["migrate"]["program"] == "tool migrate"
+
+    @staticmethod
+    def test_choices_are_taken_from_type() -> None:
+        spec = create_spec(Tool, "tool")
+
+        assert spec["options"][1]["flag"] is True
+        assert spec["options"][2]["choices"] == ["low", "high"]
+
+    @staticmethod
+    @pytest.mark.skipif(sys.version_info < (3, 8), reason="Literal requires Python 3.8")
+    def test_literal_values_are_choices() -> None:
+        from typing import Literal
+
+        class Args(RocketBase):
+            arg: Literal["a", 1] = "a"
+
+        assert create_spec(Args, "args")["options"][1]["choices"] == ["a", "1"]
+
+
+class TestComplete:
+    @staticmethod
+    @pytest.mark.parametrize("words, expected", COMPLETION_CASES)
+    def test_candidates_match_current_word(words: List[str], expected: List[str]) -> None:
+        assert complete(create_spec(Tool, "tool"), words) == expected
+
+    @staticmethod
+    def test_value_after_equal_sign_is_completed() -> None:
+        assert complete(create_spec(Tool, "tool"), ["--mode=s"]) == ["--mode=safe"]
+
+    @staticmethod
+    def test_flag_doesnt_consume_next_word() -> None:
+        assert complete(create_spec(Tool, "tool"), ["--verbose", "se"]) == ["serve"]
+
+
+class TestCompletionScript:
+    @staticmethod
+    def test_unsupported_shell_raises_value_error() -> None:
+        with pytest.raises(ValueError):
+            Tool.completion_script("tcsh", program_name="tool")
+
+    @staticmethod
+    def test_zsh_script_uses_bash_compatibility() -> None:
+        script = Tool.completion_script("zsh", program_name="tool")
+
+        assert script.startswith("autoload -U +X bashcompinit && bashcompinit\n")
+        assert script.endswith("complete -o default -F _tool_complete tool\n")
+
+    @staticmethod
+    def test_fish_script_describes_options_per_command() -> None:
+        lines = Tool.completion_script("fish", program_name="tool").splitlines()
+
+        assert "complete -c tool -n 'not __fish_seen_subcommand_from serve migrate' -f -a serve" in lines
+        assert (
+            "complete -c tool -n 'not __fish_seen_subcommand_from serve migrate' -l mode -x -a 'fast safe' "
+            "-d 'processing mode'"
+        ) in lines
+        assert "complete -c tool -n '__fish_seen_subcommand_from serve' -l port -r" in lines
+
+    @staticmethod
+    @pytest.mark.skipif(shutil.which("bash") is None, reason="bash isn't available")
+    @pytest.mark.parametrize("words, expected", COMPLETION_CASES)
+    def test_static_bash_script_completes(words: List[str], expected: List[str]) -> None:
+        script = Tool.completion_script("bash", program_name="tool")
+
+        assert run_bash_completion(script, ["tool", *words]) == expected
+
+    @staticmethod
+    @pytest.mark.skipif(shutil.which("bash") is None, reason="bash isn't available")
+    @pytest.mark.parametrize("words, expected", COMPLETION_CASES)
+    def test_dynamic_bash_script_completes(tmp_path: Path, words: List[str], expected: List[str]) -> None:
+        cache_path = tmp_path / "tool.cache"
+        Tool.write_completion_cache(cache_path, program_name="tool")
+        script = Tool.completion_script("bash", program_name="tool", cache_path=cache_path)
+
+        assert run_bash_completion(script, ["tool", *words]) == expected
+
+
+class TestCompleter:
+    @staticmethod
+    def test_cache_is_loaded(tmp_path: Path) -> None:
+        cache_path = tmp_path / "tool.cache"
+        Tool.write_completion_cache(cache_path, program_name="tool")
+
+        assert load_cache(str(cache_path)) == create_spec(Tool, "tool")
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [b"", b"not marshal data", completer.dump_cache({"version": 0})])
+    def test_invalid_cache_is_ignored(tmp_path: Path, content: bytes) -> None:
+        cache_path = tmp_path / "tool.cache"
+        cache_path.write_bytes(content)
+
+        assert load_cache(str(cache_path)) is None
+
+    @staticmethod
+    def test_missing_cache_is_ignored(tmp_path: Path) -> None:
+        assert load_cache(str(tmp_path / "missing.cache")) is None
+
+    @staticmethod
+    @pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime requires Python 3.7")
+    def test_entry_point_imports_only_builtin_modules(tmp_path: Path) -> None:
+        cache_path = tmp_path / "tool.cache"
+        Tool.write_completion_cache(cache_path, program_name="tool")
+
+        result = subprocess.run(
+            [sys.executable, "-S", "-X", "importtime", completer.__file__, str(cache_path), "--v"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+
+        assert result.stdout.splitlines() == ["--verbose"]
+        imported_modules = {line.split("|")[-1].strip() for line in result.stderr.splitlines()}
+        assert not imported_modules & {"typing", "json", "rocket_args", "tests"}
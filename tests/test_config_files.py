@@ -0,0 +1,209 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from rocket_args import Argument, ConfigFile, ConfigFileError, RocketBase
+from tests.utils import FieldFactory
+
+FIELDS = [FieldFactory(name="host"), FieldFactory(name="port"), FieldFactory(name="tags")]
+
+
+class TestConfigFile:
+    @staticmethod
+    def test_json_values_are_extracted_only_for_schema_keys(tmp_path: Path) -> None:
+        path = tmp_path / "config.json"
+        document = {"other": {"nested": ["}", "{", '"', [1, 2]]}, "host": "localhost", "port": 1234, "tags": ["a"]}
+        path.write_text(json.dumps(document))
+
+        values = ConfigFile(path).fetch(FIELDS)
+
+        assert values == {"host": "localhost", "port": 1234, "tags": ["a"]}
+
+    @staticmethod
+    def test_json_section_is_looked_up_by_dotted_path(tmp_path: Path) -> None:
+        path = tmp_path / "config.json"
+        document = {
+            "host": "global",
+            "tenants": {"tenant_1": {"host": "host_1"}, "tenant_2": {"host": "host_2", "port": 2}},
+        }
+        path.write_text(json.dumps(document, indent=4))
+
+        values = ConfigFile(path, section="tenants.tenant_2").fetch(FIELDS)
+
+        assert values == {"host": "host_2", "port": 2}
+
+    @staticmethod
+    def test_empty_json_file_has_no_values(tmp_path: Path) -> None:
+        path = tmp_path / "config.json"
+        path.write_text("")
+
+        assert ConfigFile(path).fetch(FIELDS) == {}
+
+    @staticmethod
+    def test_invalid_json_raises_value_error(tmp_path: Path) -> None:
+        path = tmp_path / "config.json"
+        path.write_text('{"host": "localhost" "port": 1}')
+
+        with pytest.raises(ValueError):
+            ConfigFile(path).fetch(FIELDS)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ['{"host": "localhost", "port": [1, 2', '["host", "port"]', '{"host": "\\x"}'])
+    def test_malformed_json_raises_config_file_error(tmp_path: Path, content: str) -> None:
+        path = tmp_path / "config.json"
+        path.write_text(content)
+
+        with pytest.raises(ConfigFileError) as exception:
+            ConfigFile(path).fetch(FIELDS)
+
+        assert exception.value.path == path
+        assert "position" in exception.value.reason
+
+    @staticmethod
+    def test_missing_file_raises_config_file_error(tmp_path: Path) -> None:
+        with pytest.raises(ConfigFileError):
+            ConfigFile(tmp_path / "config.toml").fetch(FIELDS)
+
+    @staticmethod
+    def test_toml_values_are_extracted_from_section(tmp_path: Path) -> None:
+        path = tmp_path / "config.toml"
+        path.write_text(
+            'host = "global"\n'
+            "\n"
+            "[tenant_1]\n"
+            'host = "host_1"  # comment\n'
+            "port = 1234\n"
+            "tags = [\n"
+            '    "a",\n'
+            '    "b",\n'
+            "]\n"
+            "\n"
+            "[tenant_2]\n"
+            'host = "host_2"\n'
+        )
+
+        values = ConfigFile(path, section="tenant_1").fetch(FIELDS)
+
+        assert values == {"host": "host_1", "port": 1234, "tags": ["a", "b"]}
+
+    @staticmethod
+    def test_toml_top_level_values_are_used_without_section(tmp_path: Path) -> None:
+        path = tmp_path / "config.toml"
+        path.write_text('host = "global"\n[tenant_1]\nport = 1234\n')
+
+        assert ConfigFile(path).fetch(FIELDS) == {"host": "global"}
+
+    @staticmethod
+    def test_toml_array_table_keys_arent_read_as_top_level(tmp_path: Path) -> None:
+        path = tmp_path / "config.toml"
+        path.write_text('host = "top"\n[[servers]]\nport = 9\n[[servers]]\nport = 10\n')
+
+        assert ConfigFile(path).fetch(FIELDS) == {"host": "top"}
+        assert ConfigFile(path, section="servers").fetch(FIELDS) == {}
+
+    @staticmethod
+    def test_toml_quoted_tables_and_dotted_keys_are_resolved(tmp_path: Path) -> None:
+        path = tmp_path / "config.toml"
+        path.write_text('tenant.port = 1\n[ "tenant" . "sub.name" ]\nhost = "host_1"\n[other]\ntenant.host = "other"\n')
+
+        assert ConfigFile(path, section="tenant").fetch(FIELDS) == {"port": 1}
+        assert ConfigFile(path, section='tenant."sub.name"').fetch(FIELDS) == {"host": "host_1"}
+        assert ConfigFile(path).fetch(FIELDS) == {}
+
+    @staticmethod
+    def test_invalid_toml_value_error_names_line(tmp_path: Path) -> None:
+        path = tmp_path / "config.toml"
+        path.write_text('host = "a"\n\nport = [1,\n 2,, 3]\n')
+
+        with pytest.raises(ConfigFileError) as exception:
+            ConfigFile(path).fetch(FIELDS)
+
+        assert "line 3" in exception.value.reason
+
+    @staticmethod
+    def test_ini_values_are_extracted_from_section_with_defaults(tmp_path: Path) -> None:
+        path = tmp_path / "config.ini"
+        path.write_text(
+            "[DEFAULT]\n"
+            "port = 80\n"
+            "host = default\n"
+            "[tenant_1]\n"
+            "; comment\n"
+            "HOST: host_1\n"
+            "tags = a,\n"
+            "    b\n"
+            "[tenant_2]\n"
+            "port = 2\n"
+        )
+
+        values = ConfigFile(path, section="tenant_1").fetch(FIELDS)
+
+        assert values == {"host": "host_1", "port": "80", "tags": "a,\nb"}
+
+    @staticmethod
+    def test_env_file_values_are_matched_by_env_names(tmp_path: Path) -> None:
+        path = tmp_path / "config.env"
+        path.write_text(
+            '# comment\nexport HOST="local\\thost" # comment\nPORT=1234 # comment\nTAGS=\'a,b\' # c\nOTHER="# 1"\n'
+        )
+        fields = FIELDS + [FieldFactory(name="renamed", value=Argument(env_name="OTHER"))]
+
+        values = ConfigFile(path).fetch(fields)
+
+        assert values == {"host": "local\thost", "port": "1234", "tags": "a,b", "renamed": "# 1"}
+
+    @staticmethod
+    def test_env_file_escapes_are_unescaped_and_unknown_ones_kept(tmp_path: Path) -> None:
+        path = tmp_path / "config.env"
+        path.write_text('HOST="C:\\path\\x"\nPORT="a\\\\b\\"c\\nd"\n')
+
+        assert ConfigFile(path).fetch(FIELDS) == {"host": "C:\\path\\x", "port": 'a\\b"c\nd'}
+
+    @staticmethod
+    def test_unknown_format_is_rejected(tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            ConfigFile(tmp_path / "config.xml")
+
+    @staticmethod
+    def test_format_can_be_given_explicitly(tmp_path: Path) -> None:
+        path = tmp_path / "config"
+        path.write_text('{"host": "localhost"}')
+
+        assert ConfigFile(path, format="json").fetch(FIELDS) == {"host": "localhost"}
+
+
+class TestParseWithConfigFile:
+    @staticmethod
+    def test_file_values_have_priority_between_env_and_defaults(tmp_path: Path) -> None:
+        class Args(RocketBase):
+            arg_1: str = "default_value"
+            arg_2: str = "default_value"
+            arg_3: str = "default_value"
+            arg_4: List[int] = []
+
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"arg_1": "file_value", "arg_2": "file_value", "arg_4": [1, 2]}))
+
+        args = Args.parse(["--arg-1", "cli_value"], {"ARG_2": "env_value"}, sources=[ConfigFile(path)])
+
+        assert args.arg_1 == "cli_value"
+        assert args.arg_2 == "env_value"
+        assert args.arg_3 == "default_value"
+        assert args.arg_4 == [1, 2]
+
+    @staticmethod
+    def test_malformed_file_exits_parse_args(tmp_path: Path) -> None:
+        class Args(RocketBase):
+            arg: str = "default_value"
+
+        path = tmp_path / "config.json"
+        path.write_text('{"arg": ')
+
+        with pytest.raises(ConfigFileError):
+            Args.parse([], {}, sources=[ConfigFile(path)])
+        with pytest.raises(SystemExit) as exception:
+            Args.parse_args([], {}, sources=[ConfigFile(path)])
+
+        assert str(path) in str(exception.value)
@@ -0,0 +1,123 @@
+import asyncio
+import pickle
+import sys
+from typing import List
+
+import pytest
+
+from rocket_args import Argument, RocketBase, slotted
+from rocket_args.evolve import MAX_DEPTH, current, overlay
+
+
+class Args(RocketBase):
+    host: str = "localhost"
+    port: int = 80
+    tags: List[str] = Argument(default=[])
+
+
+@slotted(frozen=True)
+class FrozenArgs(RocketBase):
+    host: str = "localhost"
+    port: int = 80
+
+
+class TestReplace:
+    @staticmethod
+    def test_changed_fields_are_replaced_and_parent_is_untouched() -> None:
+        base = Args.parse(["--port", "8080"], {})
+
+        derived = base.replace(host="example.com")
+
+        assert (derived.host, derived.port) == ("example.com", 8080)
+        assert (base.host, base.port) == ("localhost", 8080)
+        assert isinstance(derived, Args)
+        assert repr(derived) == "Args(host=example.com, port=8080, tags=[])"
+
+    @staticmethod
+    def test_unchanged_values_are_shared_with_parent() -> None:
+        base = Args.parse(["--tags", "a,b"], {})
+
+        derived = base.replace(port=1).replace(host="example.com")
+
+        assert derived.tags is base.tags
+        assert set(vars(derived)) - {"__rocket_parent__", "__rocket_depth__"} == {"host"}
+
+    @staticmethod
+    def test_deep_chains_are_flattened() -> None:
+        derived = Args.parse([], {})
+        for port in range(3 * MAX_DEPTH):
+            derived = derived.replace(port=port)
+
+        assert derived.port == 3 * MAX_DEPTH - 1
+        assert vars(derived).get("__rocket_depth__", 0) <= MAX_DEPTH
+
+    @staticmethod
+    def test_lazy_parent_values_are_cast_on_access() -> None:
+        base = Args.parse(["--port", "8080"], {}, lazy=True)
+
+        derived = base.replace(host="example.com")
+
+        assert derived.port == 8080
+
+    @staticmethod
+    def test_frozen_instances_are_rebuilt() -> None:
+        derived = FrozenArgs.parse([], {}).replace(port=1)
+
+        assert type(derived) is FrozenArgs
+        assert tuple(derived) == ("localhost", 1)
+
+    @staticmethod
+    def test_derived_instances_are_pickled_as_original_class() -> None:
+        derived = Args.parse([], {}).replace(port=1)
+
+        unpickled = pickle.loads(pickle.dumps(derived))
+
+        assert type(unpickled) is Args
+        assert repr(unpickled) == repr(derived)
+
+    @staticmethod
+    def test_unknown_fields_are_rejected() -> None:
+        with pytest.raises(TypeError):
+            Args.parse([], {}).replace(other=1)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="contextvars requires Python 3.7")
+class TestOverlay:
+    @staticmethod
+    def test_overlay_is_visible_only_inside_context() -> None:
+        config = Args.parse([], {})
+
+        with overlay(config, port=1) as overridden:
+            assert current(config) is overridden
+            assert current(config).port == 1
+
+        assert current(config) is config
+
+    @staticmethod
+    def test_nested_overlays_are_combined() -> None:
+        config = Args.parse([], {})
+
+        with overlay(config, port=1), overlay(config, host="example.com"):
+            assert (current(config).host, current(config).port) == ("example.com", 1)
+
+    @staticmethod
+    def test_other_instances_arent_affected() -> None:
+        config, other_config = Args.parse([], {}), Args.parse([], {})
+
+        with overlay(config, port=1):
+            assert current(other_config) is other_config
+
+    @staticmethod
+    def test_concurrent_tasks_dont_see_each_other_overlays() -> None:
+        config = Args.parse([], {})
+
+        async def handle(port: int) -> int:
+            with overlay(config, port=port):
+                await asyncio.sleep(0)
+                return current(config).port
+
+        async def handle_all() -> List[int]:
+            return list(await asyncio.gather(*(handle(port) for port in range(10))))
+
+        assert asyncio.run(handle_all()) == list(range(10))
+        assert current(config).port == 80
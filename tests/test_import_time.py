@@ -0,0 +1,83 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+IMPORT_TIME_BUDGET_US = 15_000
+PROJECT_ROOT = Path(__file__).parent.parent
+HEAVY_MODULES = [
+    "rocket_args.codegen",
+    "rocket_args.completion",
+    "rocket_args.evolve",
+    "rocket_args.lazy",
+]
+LAZY_EXPORT_MODULES = [
+    "json",
+    "mmap",
+    "pathlib",
+    "tomllib",
+    "weakref",
+    "threading",
+    "concurrent.futures",
+    "rocket_args.config_files",
+    "rocket_args.secrets_dir",
+    "rocket_args.watch",
+]
+
+# module __getattr__ requires Python 3.7, older versions import lazy exports (and their dependencies) eagerly
+if sys.version_info >= (3, 7):
+    HEAVY_MODULES += LAZY_EXPORT_MODULES
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+    )
+
+
+def measure_import_time() -> int:
+    # stdlib modules every program pays for anyway are imported first so only rocket_args is measured
+    result = run_python("import abc, functools, re, typing; import rocket_args", "-X", "importtime")
+    last_line = result.stderr.strip().splitlines()[-1]
+    _, cumulative, name = last_line.split("|")
+    assert name.strip() == "rocket_args"
+    return int(cumulative)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime requires Python 3.7")
+def test_import_fits_in_budget() -> None:
+    best_time = min(measure_import_time() for _ in range(3))
+    assert best_time < IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.parametrize("module", HEAVY_MODULES)
+def test_import_does_not_load_heavy_modules(module: str) -> None:
+    result = run_python(f"import sys; from rocket_args import RocketBase; print({module!r} in sys.modules)")
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_export_is_loaded_on_access() -> None:
+    code = "import sys, rocket_args; rocket_args.ConfigFile; print('rocket_args.config_files' in sys.modules)"
+    result = run_python(code)
+    assert result.stdout.strip() == "True"
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    import rocket_args
+
+    with pytest.raises(AttributeError):
+        rocket_args.NotExisting  # type: ignore
+
+
+def test_all_exports_are_available() -> None:
+    import rocket_args
+
+    missing: List[str] = [name for name in rocket_args.__all__ if not hasattr(rocket_args, name)]
+    assert missing == []
@@ -0,0 +1,93 @@
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from rocket_args import InvalidValueError, RocketBase, slotted
+from rocket_args.lazy import resolve
+
+
+class TestLazyParsing:
+    @staticmethod
+    def test_values_are_casted_on_first_access() -> None:
+        caster = Mock(side_effect=int)
+
+        class Args(RocketBase):
+            arg_1: caster  # type: ignore
+            arg_2: caster  # type: ignore
+
+        args = Args.parse(["--arg-1", "12", "--arg-2", "34"], {}, lazy=True)
+
+        caster.assert_not_called()
+        assert args.arg_1 == 12
+        assert args.arg_1 == 12
+        caster.assert_called_once_with("12")
+
+    @staticmethod
+    def test_instances_are_instances_of_parsed_class() -> None:
+        class Args(RocketBase):
+            arg: int
+
+        args = Args.parse(["--arg", "12"], {}, lazy=True)
+
+        assert isinstance(args, Args)
+        assert type(args).__name__ == "Args"
+        assert repr(resolve(args)) == "Args(arg=12)"
+
+    @staticmethod
+    def test_repr_doesnt_cast_pending_values() -> None:
+        class Args(RocketBase):
+            arg_1: int
+            arg_2: int
+
+        args = Args.parse(["--arg-1", "abcd", "--arg-2", "12"], {}, lazy=True)
+
+        assert repr(args) == "Args(arg_1=<pending 'abcd'>, arg_2=<pending '12'>)"
+        assert args.arg_2 == 12
+        assert repr(args) == "Args(arg_1=<pending 'abcd'>, arg_2=12)"
+
+    @staticmethod
+    def test_defaults_and_priorities_are_preserved() -> None:
+        class Args(RocketBase):
+            arg_1: str = "default_value"
+            arg_2: str = "default_value"
+            arg_3: List[int] = [1]
+
+        args = Args.parse(["--arg-1", "cli_value"], {"ARG_1": "env_value", "ARG_2": "env_value"}, lazy=True)
+
+        assert args.arg_1 == "cli_value"
+        assert args.arg_2 == "env_value"
+        assert args.arg_3 == [1]
+
+    @staticmethod
+    def test_cast_error_is_raised_on_access() -> None:
+        class Args(RocketBase):
+            arg_1: int
+            arg_2: int
+
+        args = Args.parse(["--arg-1", "abcd", "--arg-2", "12"], {}, lazy=True)
+
+        assert args.arg_2 == 12
+        with pytest.raises(InvalidValueError) as exception:
+            _ = args.arg_1
+
+        assert exception.value.field_name == "arg_1"
+
+    @staticmethod
+    def test_resolve_casts_all_pending_values() -> None:
+        class Args(RocketBase):
+            arg: int
+
+        args = Args.parse(["--arg", "abcd"], {}, lazy=True)
+
+        with pytest.raises(InvalidValueError):
+            resolve(args)
+
+    @staticmethod
+    def test_slotted_classes_are_rejected() -> None:
+        @slotted
+        class Args(RocketBase):
+            arg: int
+
+        with pytest.raises(TypeError):
+            Args.parse(["--arg", "12"], {}, lazy=True)
@@ -1,10 +1,13 @@
-from typing import Any, List
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, List
 
 import pytest
 from _pytest.capture import CaptureFixture
 
-from rocket_args import Argument
+from rocket_args import Argument, HelpRequested, MissingArgumentsError, UnknownArgumentsError, ValidationError
 from rocket_args.rocket_base import RocketBase
+from rocket_args.type_casting import is_class_var
 from tests.utils import patch_cli_args, patch_env_args
 
 
@@ -200,6 +203,263 @@ class TestParseArgsUsingArgument:
 
         assert args.name == parsed_arg
 
+    @staticmethod
+    def test_flag_arguments_dont_take_value() -> None:
+        class Args(RocketBase):
+            verbose: bool = Argument(cli_names=["-v"], flag=True, default=False)
+            name: str
+
+        with patch_cli_args(["-v", "--name=abcd"]):
+            args = Args.parse_args()
+
+        assert args.verbose is True
+        assert args.name == "abcd"
+
+    @staticmethod
+    def test_plain_bool_arguments_take_value() -> None:
+        class Args(RocketBase):
+            debug: bool = True
+            name: str
+
+        args = Args.parse(["--debug", "false", "--name", "abcd"], {})
+
+        assert (args.debug, args.name) == (False, "abcd")
+
+    @staticmethod
+    def test_only_bool_arguments_can_be_flags() -> None:
+        class Args(RocketBase):
+            count: int = Argument(flag=True, default=0)
+
+        with pytest.raises(TypeError):
+            Args.get_schema()
+
+
+class TestSchemaResolution:
+    @staticmethod
+    def test_string_annotations_are_resolved() -> None:
+        class Args(RocketBase):
+            arg_int: "int"
+            arg_list: "List[int]"
+
+        args = Args.parse(["--arg-int", "12", "--arg-list", "1,2"], {})
+
+        assert args.arg_int == 12
+        assert args.arg_list == [1, 2]
+
+    @staticmethod
+    def test_class_vars_arent_arguments() -> None:
+        class Args(RocketBase):
+            constant: ClassVar[int] = 5
+            arg: int
+
+        assert [field.name for field in Args.get_schema().fields] == ["arg"]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "type_hint, expected",
+        [(ClassVar, True), (ClassVar[int], True), (ClassVar[List[int]], True), (int, False), (List[int], False)],
+    )
+    def test_class_vars_are_detected(type_hint: Any, expected: bool) -> None:
+        assert is_class_var(type_hint) is expected
+
+
+class TestParse:
+    @staticmethod
+    def test_explicit_argv_and_env_are_used_instead_of_process_globals() -> None:
+        class Args(RocketBase):
+            arg_1: str
+            arg_2: str
+
+        with patch_cli_args(["--arg-1", "process_value"]), patch_env_args(ARG_2="process_value"):
+            args = Args.parse(["--arg-1", "cli_value"], {"ARG_2": "env_value"})
+
+        assert args.arg_1 == "cli_value"
+        assert args.arg_2 == "env_value"
+
+    @staticmethod
+    def test_unknown_arguments_raise_typed_exception() -> None:
+        class Args(RocketBase):
+            arg: str = "default_value"
+
+        with pytest.raises(UnknownArgumentsError) as exception:
+            Args.parse(["--other", "value"], {})
+
+        assert exception.value.arguments == ["--other", "value"]
+
+    @staticmethod
+    def test_missing_arguments_raise_typed_exception() -> None:
+        class Args(RocketBase):
+            arg_1: str
+            arg_2: str = "default_value"
+
+        with pytest.raises(MissingArgumentsError) as exception:
+            Args.parse([], {})
+
+        assert [field.name for field in exception.value.fields] == ["arg_1"]
+
+    @staticmethod
+    def test_help_raises_typed_exception_with_program_name() -> None:
+        class Args(RocketBase):
+            arg: str
+
+        with pytest.raises(HelpRequested) as exception:
+            Args.parse(["--help"], {}, program_name="my_program")
+
+        assert "my_program" in exception.value.message
+        assert "--arg" in exception.value.message
+
+    @staticmethod
+    def test_missing_arguments_message_contains_only_missing_rows() -> None:
+        class Args(RocketBase):
+            arg_1: str
+            arg_2: str = "default_value"
+
+        with pytest.raises(MissingArgumentsError) as exception:
+            Args.parse([], {})
+
+        assert "--arg-1" in str(exception.value)
+        assert "--arg-2" not in str(exception.value)
+
+    @staticmethod
+    def test_print_help_writes_to_stream() -> None:
+        class Args(RocketBase):
+            arg: str = Argument(help="arg help")
+
+        stream = io.StringIO()
+        Args.print_help(stream)
+
+        assert "--arg" in stream.getvalue()
+        assert "arg help" in stream.getvalue()
+
+    @staticmethod
+    def test_concurrent_parsing_doesnt_mix_inputs() -> None:
+        class Args(RocketBase):
+            arg_int: int
+            arg_str: str
+
+        def parse(number: int) -> Args:
+            return Args.parse(["--arg-int", str(number)], {"ARG_STR": f"value_{number}"})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(parse, range(200)))
+
+        for number, args in enumerate(results):
+            assert args.arg_int == number
+            assert args.arg_str == f"value_{number}"
+
+
+class TestParseKnown:
+    @staticmethod
+    def test_remainder_starts_at_first_unknown_argument() -> None:
+        class Args(RocketBase):
+            arg: str = "default_value"
+            flag: bool = Argument(flag=True, default=False)
+
+        argv = ["--flag", "child", "--arg", "child_value"]
+        args, remainder = Args.parse_known(argv, {"ARG": "env_value"})
+
+        assert (args.arg, args.flag) == ("env_value", True)
+        assert remainder == ["child", "--arg", "child_value"]
+
+    @staticmethod
+    def test_double_dash_ends_options() -> None:
+        class Args(RocketBase):
+            arg: str
+
+        args, remainder = Args.parse_known(("--arg", "value", "--", "--arg", "--"), {})
+
+        assert args.arg == "value"
+        assert remainder == ("--arg", "--")
+
+    @staticmethod
+    def test_remainder_is_empty_when_all_arguments_are_known() -> None:
+        class Args(RocketBase):
+            arg: str
+
+        _, remainder = Args.parse_known(["--arg", "value"], {})
+
+        assert remainder == []
+
+    @staticmethod
+    def test_errors_are_raised_as_in_parse() -> None:
+        class Args(RocketBase):
+            arg: int
+
+        with pytest.raises(ValidationError):
+            Args.parse_known(["--arg", "value", "rest"], {})
+
+    @staticmethod
+    def test_parse_known_args_exits_on_errors() -> None:
+        class Args(RocketBase):
+            arg: int
+
+        with pytest.raises(SystemExit):
+            Args.parse_known_args(["rest"], {})
+
+
+class TestParseMany:
+    @staticmethod
+    def test_every_input_is_parsed_with_appropriate_priorities() -> None:
+        class Args(RocketBase):
+            arg_int: int
+            arg_str: str = "default_value"
+
+        inputs = [
+            (["--arg-int", "1"], {}),
+            (["--arg-int", "2"], {"ARG_STR": "env_value"}),
+            (["--arg-str", "cli_value"], {"ARG_INT": "3", "ARG_STR": "env_value"}),
+        ]
+
+        results = Args.parse_many(inputs)
+
+        assert [(args.arg_int, args.arg_str) for args in results] == [
+            (1, "default_value"),
+            (2, "env_value"),
+            (3, "cli_value"),
+        ]
+
+    @staticmethod
+    def test_columns_are_returned_per_field() -> None:
+        class Args(RocketBase):
+            arg_int: int
+            arg_list: List[int] = Argument(default=[])
+
+        inputs = [(["--arg-int", "1", "--arg-list", "1,2"], {}), (["--arg-int", "1"], {})]
+
+        columns = Args.parse_columns(inputs)
+
+        assert columns == {"arg_int": [1, 1], "arg_list": [[1, 2], []]}
+
+    @staticmethod
+    def test_mutable_values_arent_shared_between_rows() -> None:
+        class Args(RocketBase):
+            arg_list: List[int]
+
+        columns = Args.parse_columns([(["--arg-list", "1,2"], {}), (["--arg-list", "1,2"], {})])
+
+        assert columns["arg_list"][0] is not columns["arg_list"][1]
+
+    @staticmethod
+    def test_not_provided_required_arguments_raise_typed_exception() -> None:
+        class Args(RocketBase):
+            arg_int: int
+
+        with pytest.raises(MissingArgumentsError):
+            Args.parse_many([(["--arg-int", "1"], {}), ([], {})])
+
+    @staticmethod
+    def test_invalid_values_are_reported_with_field_and_row() -> None:
+        class Args(RocketBase):
+            arg_int: int = Argument(max_value=10)
+
+        with pytest.raises(ValidationError) as error_info:
+            Args.parse_many([(["--arg-int", "1"], {}), (["--arg-int", "x"], {}), (["--arg-int", "11"], {})])
+
+        assert [(error.field_name, error.row) for error in error_info.value.invalid_values] == [
+            ("arg_int", 1),
+            ("arg_int", 2),
+        ]
+
 
 class TestRepr:
     @staticmethod
@@ -0,0 +1,204 @@
+from array import array
+from pathlib import Path
+from typing import Any, ClassVar, List, Sequence
+
+import pytest
+
+from rocket_args import Argument, ValidationError, slotted
+from rocket_args.rocket_base import RocketBase
+from rocket_args.schema import Schema
+from tests.utils import FieldFactory
+
+
+class TestSchema:
+    @staticmethod
+    def test_cli_names_are_indexed_including_help() -> None:
+        field = FieldFactory(name="name", value=Argument(cli_names=["-n", "--name"]))
+        schema = Schema([field])
+
+        assert schema.cli_name_to_field["-n"] is field
+        assert schema.cli_name_to_field["--name"] is field
+        assert schema.cli_name_to_field["--help"] is schema.help_field
+
+    @staticmethod
+    def test_turned_off_names_are_not_indexed() -> None:
+        field = FieldFactory(name="name", value=Argument(cli_names=False, env_name=False))
+        schema = Schema([field])
+
+        assert field not in schema.cli_name_to_field.values()
+        assert schema.env_name_to_field == {}
+
+    @staticmethod
+    def test_only_provided_defaults_are_stored() -> None:
+        fields = [FieldFactory(name="name_1", value=Argument(default=1)), FieldFactory(name="name_2")]
+        schema = Schema(fields)
+
+        assert schema.defaults == {"name_1": 1}
+
+    @staticmethod
+    def test_casters_are_resolved_per_field() -> None:
+        fields = [FieldFactory(name="name_1", type=int), FieldFactory(name="name_2", type=List[int])]
+        schema = Schema(fields)
+
+        assert schema.casters["name_1"]("12") == 12
+        assert schema.casters["name_2"]("1,2") == [1, 2]
+
+    @staticmethod
+    def test_compact_fields_are_stored_in_arrays() -> None:
+        field = FieldFactory(name="name", type=Sequence[int], value=Argument(compact=True, max_length=3))
+        schema = Schema([field])
+
+        assert schema.casters["name"]("1-3") == array("q", [1, 2, 3])
+
+    @staticmethod
+    def test_only_file_fields_read_items_from_files(tmp_path: Path) -> None:
+        path = tmp_path / "ids.txt"
+        path.write_text("1\n2\n")
+
+        class Args(RocketBase):
+            ids: List[int] = Argument(from_file=True, default=[])
+            tags: List[str] = Argument(default=[])
+
+        args = Args.parse(["--ids", f"@{path}"], {"TAGS": "@admin,@ops"})
+
+        assert (args.ids, args.tags) == ([1, 2], ["@admin", "@ops"])
+        with pytest.raises(ValidationError, match="Can't read items"):
+            Args.parse(["--ids", f"@{tmp_path / 'missing.txt'}"], {})
+
+
+class TestGetSchema:
+    @staticmethod
+    def test_schema_is_built_once_per_class() -> None:
+        class Args(RocketBase):
+            arg: int
+
+        assert Args.get_schema() is Args.get_schema()
+
+    @staticmethod
+    def test_subclasses_dont_share_schema() -> None:
+        class Args(RocketBase):
+            arg_1: int
+
+        class OtherArgs(RocketBase):
+            arg_2: int
+
+        assert [field.name for field in Args.get_schema().fields] == ["arg_1"]
+        assert [field.name for field in OtherArgs.get_schema().fields] == ["arg_2"]
+
+
+class Common(RocketBase):
+    host: str = "localhost"
+    port: int = Argument(default=80, help="port to listen on")
+    instances: ClassVar[int] = 0
+
+
+class LoggingMixin:
+    log_level: str = "info"
+
+
+class TestSchemaInheritance:
+    @staticmethod
+    def test_fields_are_inherited_in_definition_order() -> None:
+        class Service(Common, LoggingMixin):
+            name: str
+
+        assert [field.name for field in Service.get_schema().fields] == ["log_level", "host", "port", "name"]
+        assert Service.parse(["--name", "api"], {"LOG_LEVEL": "debug"}).log_level == "debug"
+
+    @staticmethod
+    def test_overridden_field_keeps_position_and_takes_new_type() -> None:
+        class Service(Common):
+            host: int = 5
+
+        [host, port] = Service.get_schema().fields
+
+        assert (host.name, host.type, host.value.default) == ("host", int, 5)
+        assert port is Common.get_schema().fields[1]
+
+    @staticmethod
+    def test_default_can_be_overridden_without_annotation() -> None:
+        class Service(Common):
+            port = 8080
+
+        port = Service.get_schema().fields[1]
+
+        assert (port.type, port.value.default, port.value.help) == (int, 8080, "port to listen on")
+        assert Common.get_schema().defaults["port"] == 80
+
+    @staticmethod
+    @pytest.mark.parametrize("override", [2, Argument(default=2)])
+    def test_diamond_inheritance_follows_mro(override: Any) -> None:
+        class Base(RocketBase):
+            x: int = 1
+
+        class Left(Base):
+            y: int = 0
+
+        class Right(Base):
+            x: int = override
+
+        class Child(Left, Right):
+            pass
+
+        assert [field.name for field in Child.get_schema().fields] == ["x", "y"]
+        assert Child.parse([], {}).x == 2
+
+    @staticmethod
+    def test_default_override_in_diamond_keeps_nearest_argument() -> None:
+        class Base(RocketBase):
+            x: int = Argument(default=1, help="base")
+
+        class Left(Base):
+            pass
+
+        class Right(Base):
+            x = 2
+
+        class Child(Left, Right):
+            pass
+
+        [x] = Child.get_schema().fields
+        assert (x.type, x.value.default, x.value.help) == (int, 2, "base")
+
+    @staticmethod
+    def test_fields_of_deep_hierarchy_are_shared_with_bases() -> None:
+        classes = [Common]
+        for index in range(20):
+            classes.append(type(f"Level{index}", (classes[-1],), {"__annotations__": {f"field_{index}": int}}))
+
+        fields = classes[-1].get_schema().fields
+
+        assert len(fields) == 22
+        assert all(field is base_field for field, base_field in zip(fields, classes[-2].get_schema().fields))
+
+    @staticmethod
+    def test_invalidation_rebuilds_only_subclasses() -> None:
+        class Base(RocketBase):
+            arg: int = 1
+
+        class Child(Base):
+            other: int = 2
+
+        class Sibling(RocketBase):
+            arg: int = 3
+
+        base_schema, sibling_schema = Base.get_schema(), Sibling.get_schema()
+        Child.compile_parser()
+        Base.arg = Argument(default=10)  # type: ignore
+
+        Base.invalidate_schema()
+
+        assert Base.get_schema() is not base_schema
+        assert Sibling.get_schema() is sibling_schema
+        assert Child.parse([], {}).arg == 10
+        assert Child.parse([], {}, lazy=True).arg == 10
+
+    @staticmethod
+    def test_slotted_subclass_has_base_fields() -> None:
+        @slotted
+        class Service(Common):
+            name: str = "api"
+
+        args = Service.parse(["--port", "1"], {})
+
+        assert (args.host, args.port, args.name) == ("localhost", 1, "api")
@@ -0,0 +1,125 @@
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from rocket_args import Argument, CliSource, EnvSource, RocketBase, SecretsDir, SecretsDirError
+from tests.utils import FieldFactory
+
+
+class Args(RocketBase):
+    db_password: str
+    api_token: str = Argument(env_name="TOKEN")
+    tags: List[str] = []
+
+
+@pytest.fixture
+def secrets_path(tmp_path: Path) -> Path:
+    (tmp_path / "db_password").write_text("secret\n")
+    (tmp_path / "TOKEN").write_text("token")
+    (tmp_path / "unrelated").write_text("unrelated")
+    (tmp_path / "..data").mkdir()
+    return tmp_path
+
+
+class TestSecretsDir:
+    @staticmethod
+    def test_files_are_matched_by_field_and_env_names(secrets_path: Path) -> None:
+        fields = [FieldFactory(name="db_password"), FieldFactory(name="api_token", value=Argument(env_name="TOKEN"))]
+
+        values = SecretsDir(secrets_path).fetch(fields)
+
+        assert values == {"db_password": "secret", "api_token": "token"}
+
+    @staticmethod
+    def test_only_requested_files_are_read(secrets_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        read_files = []
+        read_text = Path.read_text
+
+        def recording_read_text(path: Path, *args: str, **kwargs: str) -> str:
+            read_files.append(path.name)
+            return read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", recording_read_text)
+        SecretsDir(secrets_path).fetch([FieldFactory(name="db_password")])
+
+        assert read_files == ["db_password"]
+
+    @staticmethod
+    def test_values_can_be_kept_unstripped(secrets_path: Path) -> None:
+        values = SecretsDir(secrets_path, strip=False).fetch([FieldFactory(name="db_password")])
+        assert values == {"db_password": "secret\n"}
+
+    @staticmethod
+    def test_missing_directory_provides_no_values(tmp_path: Path) -> None:
+        assert SecretsDir(tmp_path / "missing").fetch([FieldFactory(name="db_password")]) == {}
+
+    @staticmethod
+    def test_files_are_read_concurrently_with_bounded_workers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        names = [f"secret_{index}" for index in range(8)]
+        for name in names:
+            (tmp_path / name).write_text(name)
+
+        lock = threading.Lock()
+        running, max_running = [0], [0]
+        read_text = Path.read_text
+
+        def slow_read_text(path: Path, *args: str, **kwargs: str) -> str:
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", slow_read_text)
+        values = SecretsDir(tmp_path, max_workers=3).fetch([FieldFactory(name=name) for name in names])
+
+        assert values == {name: name for name in names}
+        assert 1 < max_running[0] <= 3
+
+    @staticmethod
+    def test_slow_reads_time_out(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in ["secret_1", "secret_2"]:
+            (tmp_path / name).write_text(name)
+
+        monkeypatch.setattr(Path, "read_text", lambda *args, **kwargs: time.sleep(0.5))
+
+        with pytest.raises(SecretsDirError):
+            SecretsDir(tmp_path, timeout=0.01).fetch([FieldFactory(name="secret_1"), FieldFactory(name="secret_2")])
+
+    @staticmethod
+    def test_directories_named_like_fields_are_skipped(secrets_path: Path) -> None:
+        (secrets_path / "tags").mkdir()
+
+        assert SecretsDir(secrets_path).fetch([FieldFactory(name="tags")]) == {}
+
+    @staticmethod
+    def test_unreadable_secret_exits_parse_args(secrets_path: Path) -> None:
+        (secrets_path / "db_password").write_bytes(b"\xff")
+
+        with pytest.raises(SecretsDirError):
+            Args.parse([], {}, sources=[SecretsDir(secrets_path)])
+        with pytest.raises(SystemExit):
+            Args.parse_args([], {}, sources=[SecretsDir(secrets_path)])
+
+    @staticmethod
+    def test_invalid_workers_count_is_rejected(tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            SecretsDir(tmp_path, max_workers=0)
+
+
+class TestParseWithSecretsDir:
+    @staticmethod
+    def test_precedence_follows_sources_order(secrets_path: Path) -> None:
+        env = {"DB_PASSWORD": "from env", "TOKEN": "from env"}
+        argv = ["--api-token", "from cli"]
+
+        default_args = Args.parse(argv, env, sources=[SecretsDir(secrets_path)])
+        secrets_first_args = Args.parse(argv, env, sources=[SecretsDir(secrets_path), CliSource(), EnvSource()])
+
+        assert (default_args.db_password, default_args.api_token) == ("from env", "from cli")
+        assert (secrets_first_args.db_password, secrets_first_args.api_token) == ("secret", "token")
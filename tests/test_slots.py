@@ -0,0 +1,87 @@
+import pickle
+
+import pytest
+
+from rocket_args import Argument, RocketBase, slotted
+
+
+@slotted
+class SlottedArgs(RocketBase):
+    arg_int: int
+    arg_str: str = Argument(default="default_value")
+
+
+@slotted(frozen=True)
+class FrozenArgs(RocketBase):
+    arg_int: int
+    arg_str: str = "default_value"
+
+
+class TestSlotted:
+    @staticmethod
+    def test_instances_dont_have_dict() -> None:
+        args = SlottedArgs.parse(["--arg-int", "1234"], {})
+
+        assert not hasattr(args, "__dict__")
+        assert args.arg_int == 1234
+        assert args.arg_str == "default_value"
+
+    @staticmethod
+    def test_schema_is_preserved() -> None:
+        args = SlottedArgs.parse(["--arg-str", "cli_value"], {"ARG_INT": "1234"})
+
+        assert args.arg_int == 1234
+        assert args.arg_str == "cli_value"
+
+    @staticmethod
+    def test_not_provided_arguments_are_not_present_in_repr() -> None:
+        assert repr(SlottedArgs(arg_int=1234)) == "SlottedArgs(arg_int=1234)"
+
+    @staticmethod
+    def test_unknown_arguments_are_rejected() -> None:
+        with pytest.raises(TypeError):
+            SlottedArgs(other=1234)  # type: ignore
+
+    @staticmethod
+    def test_instances_can_be_pickled() -> None:
+        args = SlottedArgs(arg_int=1234, arg_str="abcd")
+
+        unpickled_args = pickle.loads(pickle.dumps(args))
+
+        assert repr(unpickled_args) == repr(args)
+
+
+class TestSlottedFrozen:
+    @staticmethod
+    def test_instances_are_tuples() -> None:
+        args = FrozenArgs.parse(["--arg-int", "1234"], {})
+
+        assert isinstance(args, tuple)
+        assert isinstance(args, RocketBase)
+        assert tuple(args) == (1234, "default_value")
+        assert args.arg_int == 1234
+
+    @staticmethod
+    def test_attributes_cant_be_changed() -> None:
+        args = FrozenArgs(arg_int=1234)
+
+        with pytest.raises(AttributeError):
+            args.arg_int = 5678  # type: ignore
+
+    @staticmethod
+    def test_missing_arguments_are_rejected() -> None:
+        with pytest.raises(TypeError):
+            FrozenArgs()
+
+    @staticmethod
+    def test_repr_contains_all_arguments() -> None:
+        assert repr(FrozenArgs(arg_int=1234)) == "FrozenArgs(arg_int=1234, arg_str=default_value)"
+
+    @staticmethod
+    def test_instances_can_be_pickled() -> None:
+        args = FrozenArgs(arg_int=1234, arg_str="abcd")
+
+        unpickled_args = pickle.loads(pickle.dumps(args))
+
+        assert unpickled_args == args
+        assert type(unpickled_args) is FrozenArgs
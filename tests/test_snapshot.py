@@ -0,0 +1,185 @@
+import copy
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+
+import pytest
+
+from rocket_args import Argument, RocketBase, Subcommands, slotted
+from rocket_args.snapshot import from_bytes, to_argv, to_bytes, to_env
+
+
+class Color(Enum):
+    red = 1
+    green = 2
+
+
+class Args(RocketBase):
+    host: str
+    port: int = 80
+    tags: List[str] = []
+    weights: Dict[str, float] = {}
+    color: Color = Color.red
+    verbose: bool = Argument(cli_names=["-v", "--verbose"], flag=True, default=False)
+    quiet: bool = Argument(default=True)
+    path: Path = Path(".")
+    secret: str = Argument(cli_names=False, env_name="SECRET", default="")
+    optional: Optional[int] = None
+
+
+@slotted
+class SlottedArgs(RocketBase):
+    host: str
+    port: int = 80
+
+
+@slotted(frozen=True)
+class FrozenArgs(RocketBase):
+    host: str
+    port: int = 80
+
+
+ARGV = ["--host", "localhost", "--tags", "a,b c", "--weights", "x=1.5", "--color", "green", "-v", "--quiet=false"]
+ENV = {"SECRET": "password"}
+
+
+def get_values(args: RocketBase) -> Dict[str, object]:
+    return {field.name: getattr(args, field.name) for field in args.get_schema().fields}
+
+
+def get_port(args: Args) -> int:
+    return args.port
+
+
+class TestBytesSnapshot:
+    @staticmethod
+    def test_instance_is_restored_without_parsing() -> None:
+        args = Args.parse(ARGV, ENV)
+
+        restored_args = from_bytes(Args, to_bytes(args))
+
+        assert type(restored_args) is Args
+        assert get_values(restored_args) == get_values(args)
+
+    @staticmethod
+    def test_snapshot_of_different_schema_is_rejected() -> None:
+        class OtherArgs(RocketBase):
+            host: int
+
+        with pytest.raises(ValueError, match="different schema"):
+            from_bytes(OtherArgs, to_bytes(Args.parse(ARGV, ENV)))
+
+    @staticmethod
+    def test_unknown_version_is_rejected() -> None:
+        data = bytearray(to_bytes(Args.parse(ARGV, ENV)))
+        data[3] = 255
+
+        with pytest.raises(ValueError, match="version"):
+            from_bytes(Args, bytes(data))
+
+    @staticmethod
+    @pytest.mark.parametrize("data", [b"", b"not a snapshot at all"])
+    def test_other_data_is_rejected(data: bytes) -> None:
+        with pytest.raises(ValueError):
+            from_bytes(Args, data)
+
+
+class TestPickle:
+    @staticmethod
+    def test_instance_is_pickled_by_values() -> None:
+        args = Args.parse(ARGV, ENV)
+
+        restored_args = pickle.loads(pickle.dumps(args))
+
+        assert type(restored_args) is Args
+        assert get_values(restored_args) == get_values(args)
+
+    @staticmethod
+    @pytest.mark.parametrize("copy_instance", [copy.copy, copy.deepcopy, lambda args: pickle.loads(pickle.dumps(args))])
+    def test_extra_attributes_and_unset_fields_are_kept(copy_instance: Any) -> None:
+        args = Args(port=1)
+        args.extra = "value"  # type: ignore
+
+        copied_args = copy_instance(args)
+
+        assert vars(copied_args) == {"port": 1, "extra": "value"}
+
+    @staticmethod
+    def test_lazy_instance_extra_attributes_are_kept() -> None:
+        args = Args.parse(ARGV, ENV, lazy=True)
+        args.extra = "value"  # type: ignore
+
+        restored_args = pickle.loads(pickle.dumps(args))
+
+        assert type(restored_args) is Args
+        assert restored_args.extra == "value"  # type: ignore
+
+    @staticmethod
+    def test_lazy_instance_is_restored_as_regular_one() -> None:
+        args = Args.parse(ARGV, ENV, lazy=True)
+
+        restored_args = pickle.loads(pickle.dumps(args))
+
+        assert type(restored_args) is Args
+        assert get_values(restored_args) == get_values(args)
+
+    @staticmethod
+    @pytest.mark.parametrize("args_class", [SlottedArgs, FrozenArgs])
+    def test_slotted_instance_is_pickled(args_class: Type[RocketBase]) -> None:
+        args = args_class.parse(["--host", "localhost"], {})
+        restored_args = pickle.loads(pickle.dumps(args))
+
+        assert (restored_args.host, restored_args.port) == ("localhost", 80)  # type: ignore
+
+    @staticmethod
+    def test_instance_is_sent_to_spawned_process() -> None:
+        args = Args.parse(["--host", "localhost", "--port", "1234"], {})
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            assert executor.submit(get_port, args).result() == 1234
+
+
+class TestArgvAndEnv:
+    @staticmethod
+    def test_argv_round_trip() -> None:
+        args = Args.parse(ARGV, ENV)
+
+        argv = to_argv(args)
+
+        assert "-v" not in argv and "--verbose" in argv
+        assert not any(arg.startswith("--secret") for arg in argv)
+        assert get_values(Args.parse(argv, ENV)) == get_values(args)
+
+    @staticmethod
+    def test_env_round_trip() -> None:
+        args = Args.parse(ARGV, ENV)
+
+        env = to_env(args)
+
+        assert env["SECRET"] == "password"
+        assert "OPTIONAL" not in env
+        assert get_values(Args.parse([], env)) == get_values(args)
+
+    @staticmethod
+    def test_subcommand_is_placed_at_the_end_of_argv() -> None:
+        class Tool(RocketBase):
+            verbose: bool = Argument(flag=True, default=False)
+            command: RocketBase = Subcommands({"serve": "tests.commands.serve.ServeArgs"})
+
+        args = Tool.parse(["serve", "--port", "80"], {"VERBOSE": "true"})
+
+        assert to_argv(args) == ["--verbose", "serve", "--port=80", "--debug=false"]
+
+    @staticmethod
+    def test_group_is_serialized_as_json() -> None:
+        class Service(RocketBase):
+            database: SlottedArgs
+
+        args = Service.parse([], {"DATABASE": '{"host": "db", "port": "1"}'})
+
+        assert to_env(args) == {"DATABASE": '{"host": "db", "port": "1"}'}
+        database = Service.parse(to_argv(args), {}).database
+        assert (database.host, database.port) == ("db", 1)
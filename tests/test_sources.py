@@ -0,0 +1,266 @@
+from typing import Any, Dict, ItemsView, List, Mapping, Optional, Sequence
+
+import pytest
+
+from rocket_args import (
+    Argument,
+    CliSource,
+    EnvSource,
+    MappingSource,
+    MissingArgumentsError,
+    PrefixEnvSource,
+    RocketBase,
+    Source,
+    ValidationError,
+)
+from rocket_args.sources import build_pipeline, fetch_from_sources
+from rocket_args.utils import Field
+from tests.utils import FieldFactory
+
+
+class RecordingSource(Source):
+    def __init__(self, values: Mapping[str, Any]):
+        self.values = values
+        self.requested_names: List[List[str]] = []
+
+    def fetch(self, fields: Sequence[Field]) -> Mapping[str, Any]:
+        self.requested_names.append([field.name for field in fields])
+        return {name: value for name, value in self.values.items() if name in self.requested_names[-1]}
+
+
+class CountingEnv(Dict[str, str]):
+    scans = 0
+
+    def items(self) -> ItemsView[str, str]:
+        self.scans += 1
+        return super().items()
+
+
+class Database(RocketBase):
+    host: str
+    port: int = 5432
+
+
+class Service(RocketBase):
+    debug: bool = False
+    name: str = Argument(env_name="SERVICE_NAME", default="app")
+    database: Database
+
+
+class TestFetchFromSources:
+    @staticmethod
+    def test_first_source_providing_value_wins() -> None:
+        fields = [FieldFactory(name="name_1"), FieldFactory(name="name_2"), FieldFactory(name="name_3")]
+        sources = [MappingSource({"name_1": "first"}), MappingSource({"name_1": "second", "name_2": "second"})]
+
+        raw_args = fetch_from_sources(sources, fields)
+
+        assert raw_args == {"name_1": "first", "name_2": "second"}
+
+    @staticmethod
+    def test_resolved_fields_arent_requested_from_lower_sources() -> None:
+        fields = [FieldFactory(name="name_1"), FieldFactory(name="name_2"), FieldFactory(name="name_3")]
+        first_source = RecordingSource({"name_2": "first"})
+        second_source = RecordingSource({"name_3": "second"})
+        third_source = RecordingSource({})
+
+        fetch_from_sources([first_source, second_source, third_source], fields, {"name_1": "cli"})
+
+        assert first_source.requested_names == [["name_2", "name_3"]]
+        assert second_source.requested_names == [["name_3"]]
+        assert third_source.requested_names == []
+
+
+class TestBuildPipeline:
+    @staticmethod
+    def test_env_source_is_used_by_default() -> None:
+        env = {"NAME": "value"}
+
+        pipeline = build_pipeline(None, env)
+
+        assert len(pipeline) == 1
+        assert isinstance(pipeline[0], EnvSource) and pipeline[0].env is env
+
+    @staticmethod
+    def test_env_source_is_prepended_when_not_given() -> None:
+        source = MappingSource({})
+
+        pipeline = build_pipeline([source], {})
+
+        assert isinstance(pipeline[0], EnvSource)
+        assert pipeline[1] is source
+
+    @staticmethod
+    def test_unbound_env_source_keeps_its_position() -> None:
+        env: Dict[str, str] = {}
+        source = MappingSource({})
+
+        pipeline = build_pipeline([source, EnvSource()], env)
+
+        assert pipeline[0] is source
+        assert isinstance(pipeline[1], EnvSource) and pipeline[1].env is env
+
+    @staticmethod
+    def test_cli_source_is_prepended_when_not_given() -> None:
+        cli_args = {"name": "value"}
+
+        pipeline = build_pipeline(None, {}, cli_args)
+
+        assert isinstance(pipeline[0], CliSource) and pipeline[0].args is cli_args
+        assert isinstance(pipeline[1], EnvSource)
+
+    @staticmethod
+    def test_unbound_cli_source_keeps_its_position() -> None:
+        cli_args = {"name": "value"}
+        source = MappingSource({})
+
+        pipeline = build_pipeline([source, CliSource(), EnvSource()], {}, cli_args)
+
+        assert pipeline[0] is source
+        assert isinstance(pipeline[1], CliSource) and pipeline[1].args is cli_args
+
+
+class TestParseWithSources:
+    @staticmethod
+    def test_custom_source_can_have_priority_over_env() -> None:
+        class Args(RocketBase):
+            arg_1: int = Argument(default=0)
+            arg_2: int = Argument(default=0)
+            arg_3: int = Argument(default=0)
+
+        sources = [MappingSource({"arg_1": "1", "arg_2": "1"}), EnvSource()]
+        env = {"ARG_2": "2", "ARG_3": "2"}
+
+        args = Args.parse(["--arg-1", "3"], env, sources=sources)
+
+        assert (args.arg_1, args.arg_2, args.arg_3) == (3, 1, 2)
+
+    @staticmethod
+    def test_custom_source_can_have_priority_over_cli() -> None:
+        class Args(RocketBase):
+            arg_1: int = Argument(default=0)
+            arg_2: int = Argument(default=0)
+
+        sources = [MappingSource({"arg_1": "1"}), CliSource(), EnvSource()]
+
+        args = Args.parse(["--arg-1", "2", "--arg-2", "2"], {}, sources=sources)
+
+        assert (args.arg_1, args.arg_2) == (1, 2)
+
+    @staticmethod
+    def test_only_winning_values_are_casted() -> None:
+        class Args(RocketBase):
+            arg: int
+
+        args = Args.parse(["--arg", "1"], {"ARG": "not a number"})
+
+        assert args.arg == 1
+
+
+class TestPrefixEnvSource:
+    @staticmethod
+    def test_nested_groups_are_filled_from_prefixed_keys() -> None:
+        env = {"APP__DEBUG": "true", "APP__DATABASE__HOST": "db", "APP__DATABASE__PORT": "1", "DEBUG": "false"}
+
+        args = Service.parse([], env, sources=[PrefixEnvSource("APP")])
+
+        assert args.debug is True
+        assert (args.database.host, args.database.port) == ("db", 1)
+
+    @staticmethod
+    def test_only_keys_matching_schema_are_loaded() -> None:
+        env = {"APP__SERVICE_NAME": "api", "APP__NAME": "other", "APP__DATABASE__USER": "root", "APP__DEBUG__X": "1"}
+
+        values = PrefixEnvSource("APP", env=env).fetch(Service.get_schema().fields)
+
+        assert values == {"name": "api"}
+
+    @staticmethod
+    def test_custom_delimiter_can_be_used() -> None:
+        env = {"APP.DATABASE.HOST": "db"}
+
+        args = Service.parse([], env, sources=[PrefixEnvSource("APP", delimiter=".")])
+
+        assert args.database.host == "db"
+
+    @staticmethod
+    def test_nested_keys_have_priority_over_group_value() -> None:
+        env = {"APP__DATABASE": '{"host": "json", "port": "1"}', "APP__DATABASE__HOST": "db"}
+
+        args = Service.parse([], env, sources=[PrefixEnvSource("APP")])
+
+        assert (args.database.host, args.database.port) == ("db", 5432)
+
+    @staticmethod
+    def test_env_is_read_on_every_parse_by_default() -> None:
+        env = {"APP__DATABASE__HOST": "db", "OTHER": "1"}
+        source = PrefixEnvSource("APP")
+        Service.parse([], env, sources=[source])
+
+        del env["OTHER"]
+        env["APP__DATABASE__PORT"] = "1"
+
+        assert Service.parse([], env, sources=[source]).database.port == 1
+        assert Service.parse(["--name", "api"], env, sources=[source]).database.port == 1
+
+    @staticmethod
+    def test_cached_snapshot_is_reused_for_same_env() -> None:
+        env = CountingEnv({"APP__DATABASE__HOST": "db", "APP__DEBUG": "true"})
+        source = PrefixEnvSource("APP", cache=True)
+
+        Service.parse([], env, sources=[source])
+        args = Service.parse(["--debug=false"], env, sources=[source])
+
+        assert env.scans == 1
+        assert (args.debug, args.database.host) == (False, "db")
+
+    @staticmethod
+    def test_refresh_drops_cached_snapshot() -> None:
+        env = CountingEnv({"APP__DATABASE__HOST": "db"})
+        source = PrefixEnvSource("APP", cache=True)
+        Service.parse([], env, sources=[source])
+
+        env["APP__DATABASE__PORT"] = "1"
+        source.refresh()
+        args = Service.parse([], env, sources=[source])
+
+        assert env.scans == 2
+        assert args.database.port == 1
+
+    @staticmethod
+    def test_optional_group_is_filled_from_prefixed_keys() -> None:
+        class OptionalService(RocketBase):
+            database: Optional[Database] = None
+
+        source = PrefixEnvSource("APP")
+
+        assert OptionalService.parse([], {}, sources=[source]).database is None
+        assert OptionalService.parse([], {"APP__DATABASE__HOST": "db"}, sources=[source]).database.host == "db"
+
+    @staticmethod
+    def test_flat_env_isnt_used_in_prefix_mode() -> None:
+        with pytest.raises(MissingArgumentsError):
+            Service.parse([], {"DATABASE": '{"host": "db"}'}, sources=[PrefixEnvSource("APP")])
+
+
+class TestGroupFields:
+    @staticmethod
+    def test_group_can_be_passed_as_json() -> None:
+        args = Service.parse(["--database", '{"host": "db", "port": 1}'], {})
+
+        assert (args.database.host, args.database.port) == ("db", 1)
+
+    @staticmethod
+    def test_group_instance_is_used_as_is() -> None:
+        database = Database(host="db")
+
+        args = Service.parse([], {}, sources=[MappingSource({"database": database})])
+
+        assert args.database is database
+
+    @staticmethod
+    def test_invalid_group_values_are_reported_together() -> None:
+        with pytest.raises(ValidationError) as error_info:
+            Service.parse([], {"APP__DATABASE__PORT": "x"}, sources=[PrefixEnvSource("APP")])
+
+        assert "missing host; port: 'x'" in str(error_info.value)
@@ -0,0 +1,72 @@
+from typing import List
+
+import pytest
+from _pytest.capture import CaptureFixture
+
+from rocket_args import ParseStats, RocketBase
+
+
+class Args(RocketBase):
+    arg_1: int
+    arg_2: List[str] = ["default"]
+
+
+class TestParseStats:
+    @staticmethod
+    def test_records_parsing_phases() -> None:
+        stats = ParseStats()
+
+        Args.parse(["--arg-1", "12"], {}, stats=stats)
+
+        assert list(stats.phases.keys()) == ["schema", "argv", "sources", "validation", "cast", "init"]
+        assert stats.allocations.keys() == stats.phases.keys()
+        assert stats.total == pytest.approx(sum(stats.phases.values()))
+
+    @staticmethod
+    def test_records_cast_time_of_given_fields() -> None:
+        stats = ParseStats()
+
+        Args.parse(["--arg-1", "12"], {"ARG_2": "a,b"}, stats=stats)
+
+        assert set(stats.cast_times.keys()) == {"arg_1", "arg_2"}
+
+    @staticmethod
+    def test_records_help_phase() -> None:
+        stats = ParseStats()
+
+        with pytest.raises(SystemExit):
+            Args.parse_args(["--help"], {}, stats=stats)
+
+        assert "help" in stats.phases
+        assert "cast" not in stats.phases
+
+    @staticmethod
+    def test_format_contains_phases_and_fields() -> None:
+        stats = ParseStats()
+        Args.parse(["--arg-1", "12"], {}, stats=stats)
+
+        report = stats.format("Args")
+
+        assert report.startswith("Args: ")
+        assert "validation" in report
+        assert "arg_1" in report
+
+
+class TestStatsEnvSwitch:
+    @staticmethod
+    def test_prints_report_when_enabled(capsys: CaptureFixture) -> None:
+        Args.parse_args(["--arg-1", "12"], {"ROCKET_ARGS_STATS": "1"})
+        assert capsys.readouterr().err.startswith("Args: ")
+
+    @staticmethod
+    def test_prints_report_when_parsing_fails(capsys: CaptureFixture) -> None:
+        with pytest.raises(SystemExit):
+            Args.parse_args([], {"ROCKET_ARGS_STATS": "1"})
+
+        assert "validation" in capsys.readouterr().err
+
+    @staticmethod
+    @pytest.mark.parametrize("value", ["", "0", "false"])
+    def test_is_disabled_by_default(capsys: CaptureFixture, value: str) -> None:
+        Args.parse_args(["--arg-1", "12"], {"ROCKET_ARGS_STATS": value})
+        assert capsys.readouterr().err == ""
@@ -0,0 +1,120 @@
+import sys
+from typing import Iterator, Type
+
+import pytest
+
+from rocket_args import Argument, HelpRequested, MissingArgumentsError, RocketBase, Subcommands, UnknownArgumentsError
+
+COMMAND_MODULES = ["tests.commands.serve", "tests.commands.migrate"]
+
+
+@pytest.fixture
+def tool() -> Iterator[Type[RocketBase]]:
+    for module in COMMAND_MODULES:
+        sys.modules.pop(module, None)
+
+    class Tool(RocketBase):
+        verbose: bool = Argument(flag=True, default=False)
+        command: RocketBase = Subcommands(
+            {"serve": "tests.commands.serve.ServeArgs", "migrate": "tests.commands.migrate.MigrateArgs"},
+            help="command to run",
+        )
+
+    yield Tool
+
+
+class TestSubcommands:
+    @staticmethod
+    def test_only_selected_command_is_imported(tool: Type[RocketBase]) -> None:
+        args = tool.parse(["--verbose", "serve", "--port", "8080"], {})
+
+        assert args.verbose is True
+        assert type(args.command).__name__ == "ServeArgs"
+        assert args.command.port == 8080  # type: ignore
+        assert "tests.commands.serve" in sys.modules
+        assert "tests.commands.migrate" not in sys.modules
+
+    @staticmethod
+    def test_arguments_after_command_belong_to_command(tool: Type[RocketBase]) -> None:
+        with pytest.raises(UnknownArgumentsError) as exception:
+            tool.parse(["serve", "--port", "8080", "--verbose"], {})
+
+        assert exception.value.arguments == ["--verbose"]
+
+    @staticmethod
+    def test_command_names_can_be_option_values() -> None:
+        class Args(RocketBase):
+            name: str
+            command: RocketBase = Subcommands({"serve": "tests.commands.serve.ServeArgs"})
+
+        args = Args.parse(["--name", "serve", "serve", "--port", "1"], {})
+
+        assert args.name == "serve"
+        assert args.command.port == 1  # type: ignore
+
+    @staticmethod
+    def test_commands_can_be_nested(tool: Type[RocketBase]) -> None:
+        args = tool.parse(["migrate", "--dry-run", "down", "--steps", "3"], {})
+
+        assert args.command.dry_run is True  # type: ignore
+        assert args.command.direction.steps == 3  # type: ignore
+
+    @staticmethod
+    def test_command_returns_remainder_in_parse_known(tool: Type[RocketBase]) -> None:
+        args, remainder = tool.parse_known(["migrate", "--dry-run", "up", "--steps", "2", "alembic", "-x"], {})
+
+        assert args.command.direction.steps == 2  # type: ignore
+        assert remainder == ["alembic", "-x"]
+
+    @staticmethod
+    def test_command_env_is_shared(tool: Type[RocketBase]) -> None:
+        args = tool.parse(["serve"], {"PORT": "80"})
+        assert args.command.port == 80  # type: ignore
+
+    @staticmethod
+    def test_missing_command_raises_exception(tool: Type[RocketBase]) -> None:
+        with pytest.raises(MissingArgumentsError) as exception:
+            tool.parse(["--verbose"], {})
+
+        assert [field.name for field in exception.value.fields] == ["command"]
+
+    @staticmethod
+    def test_optional_command_uses_default(tool: Type[RocketBase]) -> None:
+        args = tool.parse(["migrate"], {})
+        assert args.command.direction is None  # type: ignore
+
+    @staticmethod
+    def test_command_help_contains_command_path(tool: Type[RocketBase]) -> None:
+        with pytest.raises(HelpRequested) as exception:
+            tool.parse(["serve", "--help"], {}, program_name="tool")
+
+        assert exception.value.message.startswith("tool serve usage:")
+        assert "--port" in exception.value.message
+
+    @staticmethod
+    def test_help_lists_commands(tool: Type[RocketBase]) -> None:
+        with pytest.raises(HelpRequested) as exception:
+            tool.parse(["--help"], {}, program_name="tool")
+
+        assert "serve migrate" in exception.value.message
+        assert "command to run" in exception.value.message
+        assert "tests.commands.serve" not in sys.modules
+
+    @staticmethod
+    def test_lazy_parsing_is_applied_to_command(tool: Type[RocketBase]) -> None:
+        args = tool.parse(["serve", "--port", "80"], {}, lazy=True)
+        assert args.command.port == 80  # type: ignore
+
+    @staticmethod
+    def test_only_one_subcommands_field_is_allowed() -> None:
+        class Args(RocketBase):
+            command_1: RocketBase = Subcommands({"a": "module.A"})
+            command_2: RocketBase = Subcommands({"b": "module.B"})
+
+        with pytest.raises(TypeError):
+            Args.get_schema()
+
+    @staticmethod
+    def test_batch_parsing_is_not_supported(tool: Type[RocketBase]) -> None:
+        with pytest.raises(TypeError):
+            tool.parse_many([(["serve"], {})])
@@ -1,9 +1,10 @@
+import io
 from typing import List, Tuple
 
 import pytest
 
 from rocket_args import Argument
-from rocket_args.utils import Field, MessageBuilder
+from rocket_args.utils import Color, Field, MessageBuilder
 from tests.utils import FieldFactory
 
 
@@ -14,12 +15,12 @@ class TestField:
             expected_cli_names = ["-a", "--arg"]
             field_data = FieldFactory(value=Argument(cli_names=expected_cli_names))
 
-            assert field_data.cli_names == expected_cli_names
+            assert field_data.cli_names == tuple(expected_cli_names)
 
         @staticmethod
         def test_generates_name_based_on_field() -> None:
             field_data = FieldFactory(name="field_name", value=Argument(cli_names=True))
-            assert field_data.cli_names == ["--field-name"]
+            assert field_data.cli_names == ("--field-name",)
 
         @staticmethod
         def test_returns_none_if_cli_names_are_turned_off() -> None:
@@ -90,3 +91,32 @@ class TestMessageBuilder:
         for tokens in expected_tokens:
             matches = [all([token in line for token in tokens]) for line in divided_message]
             assert any(matches)
+
+    @staticmethod
+    def test_columns_are_aligned(fields_with_expected_tokens: FieldsWithTokens) -> None:
+        fields, _ = fields_with_expected_tokens
+        builder = MessageBuilder(fields)
+
+        lines = builder.create_help_message("program").splitlines()[1:]
+        help_columns = {line.index(Color.neutral.value) for line in lines}
+
+        assert len(help_columns) == 1
+
+    @staticmethod
+    def test_help_message_is_cached(fields_with_expected_tokens: FieldsWithTokens) -> None:
+        fields, _ = fields_with_expected_tokens
+        builder = MessageBuilder(fields)
+        first_message = builder.create_help_message("program")
+
+        fields.clear()
+
+        assert builder.create_help_message("program") == first_message
+
+    @staticmethod
+    def test_write_help_message(fields_with_expected_tokens: FieldsWithTokens) -> None:
+        fields, _ = fields_with_expected_tokens
+        stream = io.StringIO()
+
+        MessageBuilder(fields).write_help_message(stream, "program")
+
+        assert stream.getvalue() == MessageBuilder(fields).create_help_message("program")
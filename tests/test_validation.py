@@ -0,0 +1,152 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from rocket_args import Argument, InvalidValueError, MissingArgumentsError, RocketBase, ValidationError
+from rocket_args.type_casting import get_caster
+from rocket_args.validation import compile_validator
+
+
+class Args(RocketBase):
+    port: int = Argument(min_value=1, max_value=65535, default=80)
+    mode: str = Argument(choices=["fast", "safe"], default="safe")
+    name: str = Argument(pattern=r"[a-z_]+", min_length=3, max_length=8, default="default")
+    tags: List[str] = Argument(max_length=2, default=[])
+    required: int
+
+
+class TestCompileValidator:
+    @staticmethod
+    def test_argument_without_constraints_has_no_validator() -> None:
+        assert compile_validator(Argument()) is None
+
+    @staticmethod
+    def test_field_without_constraints_uses_plain_caster() -> None:
+        assert Args.get_schema().casters["required"] is get_caster(int)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "argument, value",
+        [
+            (Argument(min_value=1), 1),
+            (Argument(max_value=1.5), 1.5),
+            (Argument(choices=[1, 2]), 2),
+            (Argument(choices=[[1], [2]]), [2]),
+            (Argument(pattern=r"\d+"), "123"),
+            (Argument(min_length=1, max_length=2), [1, 2]),
+        ],
+    )
+    def test_valid_values_pass(argument: Argument, value: Any) -> None:
+        validator = compile_validator(argument)
+        assert validator is not None
+        validator(value)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "argument, value, reason",
+        [
+            (Argument(min_value=1), 0, "greater than or equal to 1"),
+            (Argument(max_value=1.5), 2, "less than or equal to 1.5"),
+            (Argument(choices=[1, 2]), 3, "one of: 1, 2"),
+            (Argument(pattern=r"\d+"), "12a", "match pattern"),
+            (Argument(min_length=2), "a", "at least 2"),
+            (Argument(max_length=2), [1, 2, 3], "at most 2"),
+        ],
+    )
+    def test_invalid_values_are_rejected(argument: Argument, value: Any, reason: str) -> None:
+        validator = compile_validator(argument)
+        assert validator is not None
+
+        with pytest.raises(ValueError, match=reason):
+            validator(value)
+
+    @staticmethod
+    @pytest.mark.parametrize("type_hint", [List[str], Optional[List[str]], Tuple[str, ...]])
+    def test_choices_of_collection_are_checked_per_item(type_hint: Any) -> None:
+        validator = compile_validator(Argument(choices=["a", "b"]), type_hint)
+        assert validator is not None
+        validator(["a", "b", "a"])
+
+        with pytest.raises(ValueError, match="items must be one of: 'a', 'b', got: 'c'"):
+            validator(["a", "c"])
+
+
+class TestParseWithValidation:
+    @staticmethod
+    def test_valid_values_are_parsed() -> None:
+        args = Args.parse(["--port", "8080", "--mode", "fast", "--name", "my_name", "--required", "1"], {})
+        assert (args.port, args.mode, args.name, args.required) == (8080, "fast", "my_name", 1)
+
+    @staticmethod
+    def test_collection_items_are_checked_against_choices() -> None:
+        class ListArgs(RocketBase):
+            modes: List[str] = Argument(choices=["fast", "safe"], default=[])
+
+        assert ListArgs.parse(["--modes", "fast,safe"], {}).modes == ["fast", "safe"]
+        with pytest.raises(ValidationError, match="got: 'slow'"):
+            ListArgs.parse(["--modes", "fast,slow"], {})
+
+    @staticmethod
+    def test_defaults_arent_validated() -> None:
+        class DefaultArgs(RocketBase):
+            arg: int = Argument(min_value=10, default=0)
+
+        assert DefaultArgs.parse([], {}).arg == 0
+
+    @staticmethod
+    def test_all_errors_are_reported_together() -> None:
+        env = {"PORT": "0", "MODE": "unknown", "NAME": "NO", "TAGS": "a,b,c"}
+
+        with pytest.raises(ValidationError) as exception:
+            Args.parse(["--required", "not a number"], env)
+
+        invalid_names = [error.field_name for error in exception.value.invalid_values]
+        assert invalid_names == ["required", "port", "mode", "name", "tags"]
+        assert exception.value.missing_fields == []
+        assert all(isinstance(error, InvalidValueError) for error in exception.value.errors)
+
+    @staticmethod
+    def test_missing_fields_are_reported_with_invalid_values() -> None:
+        with pytest.raises(ValidationError) as exception:
+            Args.parse(["--port", "0"], {})
+
+        assert [field.name for field in exception.value.missing_fields] == ["required"]
+        assert isinstance(exception.value.errors[0], MissingArgumentsError)
+        assert "--required" in str(exception.value)
+        assert "port" in str(exception.value)
+
+    @staticmethod
+    def test_only_missing_fields_raise_missing_arguments_error() -> None:
+        with pytest.raises(MissingArgumentsError):
+            Args.parse([], {})
+
+    @staticmethod
+    def test_compiled_parser_reports_same_errors() -> None:
+        class CompiledArgs(RocketBase):
+            port: int = Argument(min_value=1, default=80)
+            count: int
+            required: int
+
+        CompiledArgs.compile_parser()
+        env: Dict[str, str] = {"PORT": "0", "COUNT": "x"}
+
+        with pytest.raises(ValidationError) as exception:
+            CompiledArgs.parse([], env)
+
+        assert [error.field_name for error in exception.value.invalid_values] == ["port", "count"]
+        assert [field.name for field in exception.value.missing_fields] == ["required"]
+
+    @staticmethod
+    def test_lazy_values_are_validated_on_access() -> None:
+        args = Args.parse(["--port", "0", "--required", "1"], {}, lazy=True)
+
+        with pytest.raises(InvalidValueError):
+            args.port
+
+    @staticmethod
+    def test_parse_args_exits_with_all_errors() -> None:
+        with pytest.raises(SystemExit) as exception:
+            Args.parse_args(["--port", "0", "--mode", "x", "--required", "1"], {})
+
+        assert "port" in str(exception.value.code)
+        assert "mode" in str(exception.value.code)
@@ -0,0 +1,151 @@
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence
+from unittest.mock import Mock
+
+import pytest
+
+from rocket_args import ConfigFile, MissingArgumentsError, RocketBase, Source, ValidationError, Watcher, slotted
+from rocket_args.utils import Field
+
+
+@slotted(frozen=True)
+class Args(RocketBase):
+    host: str
+    port: int = 80
+    tags: List[str] = []
+
+
+class TextFileSource(Source):
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+
+    def fetch(self, fields: Sequence[Field]) -> Mapping[str, Any]:
+        return {"host": self.file_path.read_text()}
+
+
+def write_config(path: Path, content: str) -> None:
+    previous_mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content)
+    os.utime(path, ns=(previous_mtime + 1_000_000_000, previous_mtime + 1_000_000_000))
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    path = tmp_path / "config.env"
+    write_config(path, "HOST=localhost\nTAGS=a,b\n")
+    return path
+
+
+class TestWatcher:
+    @staticmethod
+    def test_initial_instance_is_parsed(config_path: Path) -> None:
+        watcher = Watcher(Args, [], {}, sources=[ConfigFile(config_path)])
+
+        assert (watcher.current.host, watcher.current.port, watcher.current.tags) == ("localhost", 80, ["a", "b"])
+
+    @staticmethod
+    def test_sources_are_fetched_once_on_start(config_path: Path) -> None:
+        source = Mock(wraps=ConfigFile(config_path), path=config_path)
+
+        Watcher(Args, [], {}, sources=[source])
+
+        source.fetch.assert_called_once()
+
+    @staticmethod
+    def test_unchanged_files_keep_instance(config_path: Path) -> None:
+        watcher = Watcher(Args, [], {}, sources=[ConfigFile(config_path)])
+        instance = watcher.current
+
+        assert watcher.poll() == {}
+        assert watcher.current is instance
+
+    @staticmethod
+    def test_only_changed_fields_are_recasted(config_path: Path) -> None:
+        watcher = Watcher(Args, [], {}, sources=[ConfigFile(config_path)])
+        previous = watcher.current
+
+        write_config(config_path, "HOST=remote\nTAGS=a,b\nPORT=8080\n")
+        changes = watcher.poll()
+
+        assert changes == {"host": ("localhost", "remote"), "port": (80, 8080)}
+        assert (watcher.current.host, watcher.current.port) == ("remote", 8080)
+        assert watcher.current.tags is previous.tags
+        assert previous.host == "localhost"
+
+    @staticmethod
+    def test_cli_args_keep_priority(config_path: Path) -> None:
+        watcher = Watcher(Args, ["--host", "cli"], {}, sources=[ConfigFile(config_path)])
+
+        write_config(config_path, "HOST=remote\n")
+        changes = watcher.poll()
+
+        assert changes == {"tags": (["a", "b"], [])}
+        assert watcher.current.host == "cli"
+
+    @staticmethod
+    def test_callbacks_receive_diff(config_path: Path) -> None:
+        watcher = Watcher(Args, [], {}, sources=[ConfigFile(config_path)])
+        callback = Mock()
+        watcher.on_change(callback)
+        previous = watcher.current
+
+        write_config(config_path, "HOST=remote\nTAGS=a,b\n")
+        watcher.poll()
+
+        callback.assert_called_once_with(previous, watcher.current, {"host": ("localhost", "remote")})
+
+    @staticmethod
+    def test_invalid_reload_keeps_current_instance(config_path: Path) -> None:
+        watcher = Watcher(Args, [], {}, sources=[ConfigFile(config_path)])
+        instance = watcher.current
+
+        write_config(config_path, "TAGS=a,b\n")
+        with pytest.raises(MissingArgumentsError):
+            watcher.poll()
+
+        assert watcher.current is instance
+
+    @staticmethod
+    def test_invalid_reloaded_value_names_field(config_path: Path) -> None:
+        @slotted(frozen=True)
+        class PortArgs(RocketBase):
+            port: int = 80
+
+        watcher = Watcher(PortArgs, [], {}, sources=[ConfigFile(config_path)])
+
+        write_config(config_path, "PORT=abcd\n")
+        with pytest.raises(ValidationError) as exception:
+            watcher.poll()
+
+        assert [error.field_name for error in exception.value.invalid_values] == ["port"]
+        assert watcher.current.port == 80
+
+    @staticmethod
+    def test_extra_paths_are_watched(tmp_path: Path) -> None:
+        path = tmp_path / "values.txt"
+        write_config(path, "first")
+        watcher = Watcher(Args, [], {}, sources=[TextFileSource(path)], paths=[path])
+
+        write_config(path, "second")
+
+        assert watcher.poll() == {"host": ("first", "second")}
+
+    @staticmethod
+    def test_background_thread_publishes_changes(config_path: Path) -> None:
+        changed = threading.Event()
+        received: Dict[str, Any] = {}
+
+        def on_change(previous: Args, current: Args, changes: Dict[str, Any]) -> None:
+            received.update(changes)
+            changed.set()
+
+        with Watcher(Args, [], {}, sources=[ConfigFile(config_path)], interval=0.01) as watcher:
+            watcher.on_change(on_change)
+            write_config(config_path, "HOST=remote\nTAGS=a,b\n")
+
+            assert changed.wait(timeout=5)
+
+        assert received == {"host": ("localhost", "remote")}
+        assert watcher.current.host == "remote"